@@ -1,5 +1,6 @@
+import re
 from dataclasses import dataclass
-from typing import Sequence
+from typing import Any, Callable, Sequence
 
 from dublib.Methods.Data import ToSequence
 
@@ -20,6 +21,7 @@ class MetainfoFieldParameters:
 	allow_list: bool
 	values: tuple[int | float | str, ...] | None
 	description: str | None
+	index: str | None = None
 
 	def to_dict(self) -> dict:
 		"""
@@ -29,15 +31,128 @@ class MetainfoFieldParameters:
 		:rtype: dict
 		"""
 
-		Values = self.values
-		if Values is not None and len(Values) == 1: Values = Values[0]
+		Values: tuple[int | float | str, ...] | int | float | str | None = self.values
+		if self.values is not None and len(self.values) == 1: Values = self.values[0]
 
-		return {
+		Data = {
 			"types": ";".join(CurrentType.__name__ for CurrentType in self.types) if self.types else None,
 			"allow_list": self.allow_list,
 			"values": Values,
 			"description": self.description
 		}
+		if self.index: Data["index"] = self.index
+
+		return Data
+
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ <<<<< #
+#==========================================================================================#
+
+SPACES_PATTERN = re.compile(" {2,}")
+
+def NormalizeString(value: str, separator: str | None = ";") -> str | list[str]:
+	"""
+	Удаляет из строки повторяющиеся пробелы и разбивает её по вхождению разделителя.
+
+	:param value: Обрабатываемое значение.
+	:type value: str
+	:param separator: Разделитель подстрок, используемый для формирования из строки набора значений по вхождению символа.
+	:type separator: str | None
+	:return: Результат обработки.
+	:rtype: str | list[str]
+	"""
+
+	if "  " in value: value = SPACES_PATTERN.sub(" ", value)
+	value = value.strip()
+	Result: str | list[str] = value
+	if separator and separator in value: Result = [Element.strip() for Element in value.split(separator)]
+
+	return Result
+
+def ParseNumber(value: str) -> float | int | None:
+	"""
+	Преобразует строку в число: в дробное при наличии точки, иначе в целое. Строки, не оканчивающиеся цифрой или точкой, отбрасываются без попытки преобразования.
+
+	:param value: Строка.
+	:type value: str
+	:return: Число или `None`, если строка не является числом.
+	:rtype: float | int | None
+	"""
+
+	Last = value[-1:]
+	if not Last.isdecimal() and Last != ".": return None
+
+	try: return float(value) if "." in value else int(value)
+	except ValueError: return None
+
+def CompileValidator(parameters: MetainfoFieldParameters) -> Callable[[Any], Any]:
+	"""
+	Компилирует правила поля метаданных в функцию проверки и нормализации значения.
+
+	Числовые строки преобразуются в числа, остальные строки очищаются от повторяющихся пробелов и разбиваются по символу `;`, повторяющиеся элементы списков удаляются с сохранением порядка. Проверки типов и допустимых значений включаются в функцию, только если они описаны.
+
+	:param parameters: Параметры поля метаданных.
+	:type parameters: MetainfoFieldParameters
+	:return: Функция, принимающая значение и возвращающая нормализованное значение для записи в поле.
+	:rtype: Callable[[Any], Any]
+	"""
+
+	Field = parameters.name
+	AllowList = parameters.allow_list
+	AllowedTypes: tuple[type, ...] = parameters.types or tuple()
+	Types: frozenset[type] | None = frozenset(AllowedTypes) if AllowedTypes else None
+	Values: frozenset[int | float | str] | None = frozenset(parameters.values) if parameters.values else None
+
+	def CheckElement(element: float | int | str):
+		"""
+		Проверяет тип элемента и его вхождение в список допустимых значений.
+
+		:param element: Элемент.
+		:type element: float | int | str
+		:raises MetainfoFieldIncorrectTyping: Неверный тип значения.
+		:raises MetainfoFieldIncorrectValue: Значение не входит в список допустимых.
+		"""
+
+		if Types is not None and type(element) not in Types: raise Exceptions.Note.MetainfoFieldIncorrectTyping(Field, type(element), AllowedTypes)
+		if Values is not None and element not in Values: raise Exceptions.Note.MetainfoFieldIncorrectValue(Field, element)
+
+	Check: Callable[[float | int | str], None] | None = CheckElement if Types is not None or Values is not None else None
+
+	def Validate(value: Any) -> Any:
+		"""
+		Проверяет и нормализует значение поля метаданных.
+
+		:param value: Значение.
+		:type value: Any
+		:return: Нормализованное значение.
+		:rtype: Any
+		:raises MetainfoFieldEnlistingDenied: Использование списков в поле метаданных запрещено.
+		:raises MetainfoFieldIncorrectTyping: Неверный тип значения.
+		:raises MetainfoFieldIncorrectValue: Значение не входит в список допустимых.
+		:raises ValueError: Списки могут содержать только строки.
+		"""
+
+		if type(value) is str:
+			value = value.strip()
+			Number = ParseNumber(value)
+			if Number is not None: value = Number
+
+		if type(value) in (int, float):
+			if Check: Check(value)
+			return value
+
+		if type(value) is str: value = NormalizeString(value)
+		Elements = list(dict.fromkeys(ToSequence(value)))
+
+		for Element in Elements:
+			if type(Element) is not str: raise ValueError("Lists can contains only strings.")
+			if Check: Check(Element)
+
+		if len(Elements) > 1 and not AllowList: raise Exceptions.Note.MetainfoFieldEnlistingDenied(Field)
+
+		return Elements[0] if len(Elements) == 1 else Elements
+
+	return Validate
 
 #==========================================================================================#
 # >>>>> ОСНОВНОЙ КЛАСС <<<<< #
@@ -46,6 +161,12 @@ class MetainfoFieldParameters:
 class MetainfoRules(BaseSection):
 	"""Правила метаданных."""
 
+	#==========================================================================================#
+	# >>>>> СТАТИЧЕСКИЕ АТРИБУТЫ <<<<< #
+	#==========================================================================================#
+
+	INDEXES_TYPES = ("hash", "sorted")
+
 	#==========================================================================================#
 	# >>>>> СВОЙСТВА <<<<< #
 	#==========================================================================================#
@@ -67,6 +188,12 @@ class MetainfoRules(BaseSection):
 		"""Последовательность имён описанных полей метаданных."""
 
 		return tuple(self.__Fields.keys())
+
+	@property
+	def indexes(self) -> dict[str, str]:
+		"""Словарь объявленных вторичных индексов, где ключ – имя поля, а значение – тип индекса."""
+
+		return {Field: Parameters.index for Field, Parameters in self.__Fields.items() if Parameters.index}
 	
 	@property
 	def rule(self) -> int:
@@ -86,6 +213,21 @@ class MetainfoRules(BaseSection):
 	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
+	def __CheckIndexType(self, index: str | None) -> str | None:
+		"""
+		Проверяет тип вторичного индекса поля.
+
+		:param index: Тип индекса: `hash` для категориальных полей или `sorted` для числовых.
+		:type index: str | None
+		:return: Тип индекса.
+		:rtype: str | None
+		:raises TypeError: Указан неподдерживаемый тип индекса.
+		"""
+
+		if index is not None and index not in self.INDEXES_TYPES: raise TypeError(f"Unsupported index type \"{index}\".")
+
+		return index
+
 	def __ParseFields(self, data: dict[str, dict]) -> dict[str, MetainfoFieldParameters]:
 		"""
 		Парсит словарь данных полей в объектные представления.
@@ -108,10 +250,22 @@ class MetainfoRules(BaseSection):
 			if Values is not None: Values = ToSequence(Values)
 
 			Description = Parameters.get("description")
+			Index = self.__CheckIndexType(Parameters.get("index"))
 			
-			FieldsData[Field] = MetainfoFieldParameters(Field, Types, AllowList, Values, Description)
+			FieldsData[Field] = MetainfoFieldParameters(Field, Types, AllowList, Values, Description, Index)
 
 		return FieldsData
+
+	def __SetFieldParameters(self, parameters: MetainfoFieldParameters):
+		"""
+		Задаёт параметры поля метаданных и компилирует функцию проверки его значений.
+
+		:param parameters: Параметры поля метаданных.
+		:type parameters: MetainfoFieldParameters
+		"""
+
+		self.__Fields[parameters.name] = parameters
+		self.__Validators[parameters.name] = CompileValidator(parameters)
 	
 	def __ParseTypesString(self, string: str) -> tuple[type, ...]:
 		"""
@@ -143,6 +297,7 @@ class MetainfoRules(BaseSection):
 
 		self.__IsFreeAllowed = False
 		self.__Fields: dict[str, MetainfoFieldParameters] = dict()
+		self.__Validators: dict[str, Callable[[Any], Any]] = dict()
 
 	#==========================================================================================#
 	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
@@ -155,6 +310,7 @@ class MetainfoRules(BaseSection):
 			allow_list: bool = False,
 			values: Sequence[int | float | str] | None = None,
 			description: str | None = None,
+			index: str | None = None,
 			save: bool = True
 		):
 		"""
@@ -170,12 +326,15 @@ class MetainfoRules(BaseSection):
 		:type values: Sequence[int | float | str] | None
 		:param description: Описание поля.
 		:type description: str | None
+		:param index: Тип вторичного индекса поля: `hash` для категориальных полей, в том числе списков, или `sorted` для числовых. По умолчанию поле не индексируется.
+		:type index: str | None
 		:param save: Указывает, нужно ли выполнить сохранение манифеста после процедуры.
 		:type save: bool
+		:raises TypeError: Указан неподдерживаемый тип индекса.
 		"""
 
 		AllowedTypes = ToSequence(types, target_type = tuple) if types else None
-		self.__Fields[field] = MetainfoFieldParameters(field, AllowedTypes, allow_list, tuple(values) if values else None, description)
+		self.__SetFieldParameters(MetainfoFieldParameters(field, AllowedTypes, allow_list, tuple(values) if values else None, description, self.__CheckIndexType(index)))
 		if save: self.save()
 
 	def get_field_parameters(self, field: str) -> MetainfoFieldParameters:
@@ -193,6 +352,33 @@ class MetainfoRules(BaseSection):
 
 		return self.__Fields[field]
 
+	def get_validator(self, field: str) -> Callable[[Any], Any]:
+		"""
+		Возвращает скомпилированную функцию проверки и нормализации значений поля метаданных.
+
+		:param field: Имя поля.
+		:type field: str
+		:return: Функция, принимающая значение и возвращающая нормализованное значение для записи в поле.
+		:rtype: Callable[[Any], Any]
+		:raises MetainfoFieldNotDescribed: Данные поля не найдены.
+		"""
+
+		if field not in self.__Validators: raise Exceptions.Note.MetainfoFieldNotDescribed(field)
+
+		return self.__Validators[field]
+
+	def is_field_described(self, field: str) -> bool:
+		"""
+		Проверяет, описано ли поле метаданных.
+
+		:param field: Имя поля.
+		:type field: str
+		:return: Состояние: описано ли поле.
+		:rtype: bool
+		"""
+
+		return field in self.__Fields
+
 	def parse(self, data: dict):
 		"""
 		Парсит данные из переданного словаря.
@@ -202,7 +388,9 @@ class MetainfoRules(BaseSection):
 		"""
 
 		self.__IsFreeAllowed = bool(data.get("allow_free"))
-		self.__Fields: dict[str, MetainfoFieldParameters] = self.__ParseFields(data.get("fields") or dict())
+		self.__Fields = dict()
+		self.__Validators = dict()
+		for Parameters in self.__ParseFields(data.get("fields") or dict()).values(): self.__SetFieldParameters(Parameters)
 
 	def remove_field_parameters(self, field: str, save: bool = True):
 		"""
@@ -217,6 +405,7 @@ class MetainfoRules(BaseSection):
 
 		if field not in self.__Fields: raise Exceptions.Note.MetainfoFieldNotDescribed(field)
 		del self.__Fields[field]
+		del self.__Validators[field]
 		if save: self.save()
 
 	def to_dict(self) -> dict:
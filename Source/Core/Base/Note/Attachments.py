@@ -1,10 +1,10 @@
 import os
-import shutil
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from Source.Core import Exceptions
+from Source.Core.Session.Blobs import CopyFile
 
 from ..Note.Enums import CallbacksTypes
 
@@ -18,6 +18,8 @@ if TYPE_CHECKING:
 class Slot:
 	"""Слот."""
 
+	__slots__ = ("__Attachments", "__Name", "__File", "__Note")
+
 	#==========================================================================================#
 	# >>>>> СВОЙСТВА <<<<< #
 	#==========================================================================================#
@@ -80,14 +82,7 @@ class Slot:
 		
 		if self.__File: raise Exceptions.Note.AttachmentSlotAlreadyFilled(self.__Name)
 		self.__File = file.name
-
-
-		AttachmentDirectory = self.__Note.table.full_path / ".attachments" / str(self.__Note.id)
-		os.makedirs(AttachmentDirectory, exist_ok = True)
-		AttachmentPath = AttachmentDirectory / file
-
-		if copy: shutil.copy(file, AttachmentPath)
-		else: os.replace(file, AttachmentPath)
+		self.__Attachments._PlaceFile(file, copy)
 		
 		self.__Note.save()
 		self.__Note.run_callback(CallbacksTypes.AttachmentsChanged)
@@ -135,6 +130,8 @@ class ValidationError:
 class Attachments:
 	"""Вложения."""
 
+	__slots__ = ("__Note", "__Data", "__Slots")
+
 	#==========================================================================================#
 	# >>>>> СВОЙСТВА <<<<< #
 	#==========================================================================================#
@@ -149,6 +146,8 @@ class Attachments:
 	def count(self) -> int:
 		"""Количество вложений."""
 
+		if self.__Slots is None: return len(self.__Data["free"]) + sum(1 for File in cast(dict, self.__Data["slots"]).values() if File)
+
 		return len(self.__Data["free"]) + sum(1 for slot in self.slots if slot.file)
 
 	@property
@@ -167,25 +166,57 @@ class Attachments:
 	def slots(self) -> tuple[Slot, ...]:
 		"""Последовательность данных слотов."""
 
-		return tuple(self.__Slots.values())
+		return tuple(self.__GetSlots().values())
 
 	#==========================================================================================#
 	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
-	def __ParseSlots(self) -> dict[str, Slot]:
+	def __GetSlots(self) -> dict[str, Slot]:
 		"""
-		Парсит данные слотов в объекты.
+		Возвращает объекты слотов, при первом обращении создавая их из данных слотов.
 
 		:return: Словарь данных слотов.
 		:rtype: dict[str, SlotInfo]
 		"""
 
-		Slots = dict()
-		for Name, File in self.__Data["slots"].items(): Slots[Name] = Slot(self, Name, File)
+		Slots = self.__Slots
+
+		if Slots is None:
+			Slots = {Name: Slot(self, Name, File) for Name, File in self.__Data["slots"].items()}
+			self.__Slots: dict[str, Slot] | None = Slots
 		
 		return Slots
 
+	#==========================================================================================#
+	# >>>>> НАСЛЕДУЕМЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def _PlaceFile(self, file: Path, copy: bool):
+		"""
+		Помещает файл в директорию вложений записи.
+
+		Если для хранилища явно включено хранилище содержимого, копирование заменяется ссылкой на уже известное содержимое, а перемещённые и скопированные файлы в фоне хешируются и заменяются ссылками на содержимое. Существующий файл вложения всегда заменяется новым файлом, а не перезаписывается на месте, поэтому связанные с ним копии в других записях не изменяются.
+
+		:param file: Путь к файлу.
+		:type file: Path
+		:param copy: Указывает, нужно ли скопировать файл или переместить.
+		:type copy: bool
+		"""
+
+		Blobs = self.__Note.table.driver.blobs
+		os.makedirs(self.directory, exist_ok = True)
+		AttachmentPath = self.directory / file.name
+
+		if Blobs and not Blobs.is_enabled: Blobs = None
+
+		if copy and Blobs: Blobs.copy(file, AttachmentPath)
+		elif copy: CopyFile(file, AttachmentPath)
+
+		else:
+			os.replace(file, AttachmentPath)
+			if Blobs: Blobs.submit(AttachmentPath)
+
 	#==========================================================================================#
 	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
@@ -206,9 +237,7 @@ class Attachments:
 			"free": data.get("free") or list()
 		}
 
-		if bool(note.table.manifest.attachments.rule): os.makedirs(self.__Note.table.full_path / ".attachments", exist_ok = True)
-
-		self.__Slots: dict[str, Slot] = self.__ParseSlots()
+		self.__Slots = None
 
 	def attach(self, file: Path, copy: bool = False):
 		"""
@@ -225,13 +254,7 @@ class Attachments:
 		if Rule < 2: raise Exceptions.Note.AttachmentsDenied(bool(Rule))
 
 		self.__Data["free"].append(file.name)
-
-		AttachmentsDirectoryPath = self.directory
-		os.makedirs(AttachmentsDirectoryPath, exist_ok = True)
-		AttachmentPath = AttachmentsDirectoryPath / file
-
-		if copy: shutil.copy(file, AttachmentPath)
-		else: os.replace(file, AttachmentPath)
+		self._PlaceFile(file, copy)
 		
 		self.__Note.save()
 		self.__Note.run_callback(CallbacksTypes.AttachmentsChanged)
@@ -247,22 +270,10 @@ class Attachments:
 		:raises AttachmentSlotNotDescribed: Слот вложения не описан.
 		"""
 
-		if slot not in self.__Slots: raise Exceptions.Note.AttachmentSlotNotDescribed(slot)
-
-		return self.__Slots[slot]
+		Slots = self.__GetSlots()
+		if slot not in Slots: raise Exceptions.Note.AttachmentSlotNotDescribed(slot)
 
-	def move(self, new_id: int):
-		"""
-		Перемещает вложения в каталог, соответствующий новому ID записи.
-
-		:param new_id: Новый ID записи.
-		:type new_id: int
-		"""
-
-		if self.count > 0:
-			OldAttachmentsPath = self.__Note.table.full_path / ".attachments" / str(self.__Note.id)
-			NewAttachmentsPath =  self.__Note.table.full_path / ".attachments" / str(new_id)
-			shutil.move(OldAttachmentsPath, NewAttachmentsPath)
+		return Slots[slot]
 
 	def to_dict(self) -> dict:
 		"""
@@ -272,6 +283,8 @@ class Attachments:
 		:rtype: dict
 		"""
 
+		if self.__Slots is None: return self.__Data
+
 		return {
 			"slots": {Name: SlotData.file for Name, SlotData in self.__Slots.items()},
 			"free": self.__Data["free"]
@@ -309,7 +322,7 @@ class Attachments:
 			FilePath = AttachmentsDirectory / FreeFile
 			if not FilePath.exists(): Errors.append(ValidationError(None, FreeFile))
 
-		for CurrentSlot in self.__Slots.values():
+		for CurrentSlot in self.__GetSlots().values():
 			if CurrentSlot.file and not CurrentSlot.is_exists(): Errors.append(ValidationError(CurrentSlot.name, CurrentSlot.file))
 
 		return tuple(Errors)
\ No newline at end of file
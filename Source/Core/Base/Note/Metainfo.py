@@ -1,9 +1,9 @@
 from typing import TYPE_CHECKING, Sequence
 
-from dublib.CLI.Validators import Validator_Number
-from dublib.Methods.Data import Copy, RemoveRecurringSubstrings, ToSequence
+from dublib.Methods.Data import Copy, ToSequence
 
 from Source.Core import Exceptions
+from Source.Core.Base.Manifest.Sections.MetainfoRules import NormalizeString
 
 if TYPE_CHECKING:
 	from . import BaseNote
@@ -11,6 +11,8 @@ if TYPE_CHECKING:
 class Metainfo:
 	"""Оператор метаданных."""
 
+	__slots__ = ("__Note", "__Data", "__MetainfoRules")
+
 	#==========================================================================================#
 	# >>>>> СВОЙСТВА <<<<< #
 	#==========================================================================================#
@@ -30,31 +32,9 @@ class Metainfo:
 		return any(Values) if Values else False
 
 	#==========================================================================================#
-	# >>>>> ПРИВАТНЫЕ МЕТОДЫ ВАЛИДАЦИИ <<<<< #
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
-	def __CheckValueTyping(self, field: str, value: float | int | list | str | None):
-		"""
-		Проверяет, имеет ли значение корректный тип.
-
-		:param field: Имя поля метаданных.
-		:type field: str
-		:param value: Значение.
-		:type value: value: float | int | list | str | None
-		:raises MetainfoFieldEnlistingDenied: Использование списков в поле метаданных запрещено.
-		"""
-		
-		value = ToSequence(value, target_type = list)
-		FieldParameters = self.__Note.table.manifest.metainfo_rules.get_field_parameters(field)
-		
-		if not FieldParameters.allow_list:
-			if len(value) > 1: raise Exceptions.Note.MetainfoFieldEnlistingDenied(field)
-
-		if FieldParameters.types:
-			for Element in value:
-				ElementType = type(Element)
-				if ElementType not in FieldParameters.types: raise Exceptions.Note.MetainfoFieldIncorrectTyping(field, ElementType, FieldParameters.types)
-
 	def __NormalizeString(self, value: str, separator: str | None = ";") -> str | list[str]:
 		"""
 		Удаляет из строки повторяющиеся пробелы и разбивает её по вхождению символа `;`.
@@ -67,11 +47,7 @@ class Metainfo:
 		:rtype: str | list[str, ...]
 		"""
 
-		Value = RemoveRecurringSubstrings(value, " ")
-		Value = Value.strip()
-		if separator and separator in Value: Value = list(Element.strip() for Element in Value.split(separator))
-
-		return Value
+		return NormalizeString(value, separator)
 
 	#==========================================================================================#
 	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
@@ -83,12 +59,12 @@ class Metainfo:
 
 		:param note: Запись.
 		:type note: BaseNote
-		:param data: Словарь метаданных.
+		:param data: Словарь метаданных. Используется без копирования, так как является частью данных записи.
 		:type data: dict[str, float | int | list | str | None]
 		"""
 
 		self.__Note = note
-		self.__Data: dict[str, float | int | list | str | None] = data.copy()
+		self.__Data: dict[str, float | int | list | str | None] = data
 
 		self.__MetainfoRules = self.__Note.table.manifest.metainfo_rules
 
@@ -114,11 +90,12 @@ class Metainfo:
 		:raises MetainfoFieldNotDescribed: Поле метаданных не описано.
 		"""
 
-		if field not in self.__MetainfoRules.fields_names:
+		if not self.__MetainfoRules.is_field_described(field):
 			raise Exceptions.Note.MetainfoFieldNotDescribed(field)
 
 		try:
 			del self.__Data[field]
+			self.__Note.table.metainfo_index.update(self.__Note.id, field, None)
 			self.__Note.save()
 
 		except KeyError: pass
@@ -134,48 +111,35 @@ class Metainfo:
 		:raises MetainfoFieldNotDescribed: Поле метаданных не описано.
 		"""
 		
-		if field not in self.__MetainfoRules.fields_names: raise Exceptions.Note.MetainfoFieldNotDescribed(field)
+		if not self.__MetainfoRules.is_field_described(field): raise Exceptions.Note.MetainfoFieldNotDescribed(field)
 
 		return self.__Data.get(field)
 
 	def set_field_value(self, field: str, value: float | int | list | str | None):
 		"""
-		Задаёт значение поля метаданных.
+		Задаёт значение поля метаданных, проверяя и нормализуя его скомпилированными правилами поля.
 
 		:param field: Имя поля.
 		:type field: str
 		:param value: Значение. При передаче `None` поле удаляется.
 		:type value: float | int | list | str | None
 		:raises MetainfoBlocked: Поле метаданных не описано и свободный режим отключён.
-		:raises ValueError: Кортежи могут содержать только строки.
+		:raises MetainfoFieldEnlistingDenied: Использование списков в поле метаданных запрещено.
+		:raises MetainfoFieldIncorrectTyping: Неверный тип значения.
+		:raises MetainfoFieldIncorrectValue: Значение не входит в список допустимых.
+		:raises MetainfoFieldNotDescribed: Поле метаданных не описано.
+		:raises ValueError: Списки могут содержать только строки.
 		"""
 
-		if not self.__MetainfoRules.is_free_allowed and field not in self.__MetainfoRules.fields_names: raise Exceptions.Note.MetainfoBlocked()
+		if not self.__MetainfoRules.is_free_allowed and not self.__MetainfoRules.is_field_described(field): raise Exceptions.Note.MetainfoBlocked()
 
 		if value is None:
 			self.clear_field(field)
 			return
-		
-		if type(value) is str:
-			value = value.strip()
-			if Validator_Number.validate(value): value = Validator_Number.convert(value)
-		
-		if type(value) in (int, float):
-			self.__CheckValueTyping(field, value)
-			self.__Data[field] = value
-			self.__Note.save()
-			return
-		
-		if type(value) is str:
-			value = self.__NormalizeString(value)
-		
-		value = list(set(ToSequence(value)))
-		for Element in value:
-			if type(Element) is not str: raise ValueError("Lists can contains only strings.")
-			self.__CheckValueTyping(field, Element)
 
-		if len(value) == 1: value = value[0]
+		value = self.__MetainfoRules.get_validator(field)(value)
 		self.__Data[field] = value
+		self.__Note.table.metainfo_index.update(self.__Note.id, field, value)
 		self.__Note.save()
 
 	def append_to_field(self, field: str, value: str | Sequence[str], separator: str | None = ";"):
@@ -205,6 +169,7 @@ class Metainfo:
 
 		if FieldValue is None: FieldValue = list()
 		elif type(FieldValue) is str: FieldValue = [FieldValue]
+		elif type(FieldValue) is list: FieldValue = FieldValue.copy()
 		else: raise ValueError(f"Field \"{field}\" has non-string and non-sequence value.")
 
 		self.set_field_value(field, FieldValue + value)
@@ -233,6 +198,8 @@ class Metainfo:
 
 		if type(FieldValue) is str:
 			FieldValue = [FieldValue]
+		elif type(FieldValue) is list:
+			FieldValue = FieldValue.copy()
 		else:
 			raise ValueError(f"Field \"{field}\" has non-string and non-sequence value.")
 
@@ -1,4 +1,4 @@
-import os
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -14,18 +14,49 @@ if TYPE_CHECKING:
 	from Source.Core.Base.Table.Connector import NoteBonds
 	from Source.Core.Session.Driver import Driver
 
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ <<<<< #
+#==========================================================================================#
+
+def InternKeys(data: Any) -> Any:
+	"""
+	Рекурсивно интернирует строковые ключи словарей, чтобы одинаковые ключи всех записей таблицы ссылались на одну строку.
+
+	:param data: Данные записи.
+	:type data: Any
+	:return: Данные записи с интернированными ключами.
+	:rtype: Any
+	"""
+
+	if type(data) is dict: return {sys.intern(Key) if type(Key) is str else Key: InternKeys(Value) for Key, Value in data.items()}
+	if type(data) is list: return [InternKeys(Value) for Value in data]
+
+	return data
+
+#==========================================================================================#
+# >>>>> ОСНОВНОЙ КЛАСС <<<<< #
+#==========================================================================================#
+
 class BaseNote:
 	"""Базовая запись."""
 
+	__slots__ = ("_Driver", "_Table", "_ID", "_Data", "_Metainfo", "_Attachments")
+
 	#==========================================================================================#
 	# >>>>> СВОЙСТВА <<<<< #
 	#==========================================================================================#
 
 	@property
 	def attachments(self) -> Attachments:
-		"""Оператор вложений."""
+		"""Оператор вложений. Создаётся при первом обращении."""
 
-		return self._Attachments
+		Operator = self._Attachments
+
+		if Operator is None:
+			Operator = Attachments(self, self._Data.get("attachments") or dict())
+			self._Attachments: Attachments | None = Operator
+
+		return Operator
 	
 	@property
 	def bonds(self) -> "NoteBonds":
@@ -73,30 +104,34 @@ class BaseNote:
 	# >>>>> НАСЛЕДУЕМЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
-	def _LoadData(self):
-		"""Считывает данные записи или создаёт локальный файл при отсутствии такового."""
+	def _LoadData(self, data: dict | None = None):
+		"""
+		Считывает данные записи или создаёт локальный файл при отсутствии такового.
+
+		:param data: Заранее прочитанные данные записи. Если не переданы, считываются из локального файла.
+		:type data: dict | None
+		"""
 
 		NoteFullPath = self.full_path
 
 		self._Data = {
 			"name": None,
 			"metainfo": dict(),
-			"attachments": dict().fromkeys(self._Table.manifest.attachments.slots_names, None)
+			"attachments": {"slots": dict().fromkeys(self._Table.manifest.attachments.slots_names, None), "free": list()}
 		} | self._GetEmptyNote()
 
-		if NoteFullPath.exists():
-			self._Data = self._Data | ReadJSON(NoteFullPath)
-			self._ParseContainers()
+		if data is not None: self._Data = self._Data | InternKeys(data)
+		elif NoteFullPath.exists(): self._Data = self._Data | InternKeys(ReadJSON(NoteFullPath))
 
 		else:
 			self._ParseContainers()
 			self.save()
 
 	def _ParseContainers(self):
-		"""Парсит контейнерные типы данных."""
+		"""Парсит контейнерные типы данных. Оператор вложений создаётся при первом обращении."""
 
 		self._Metainfo = Metainfo(self, self._Data.get("metainfo") or dict())
-		self._Attachments = Attachments(self, self._Data.get("attachments") or dict())
+		self._Attachments = None
 
 	#==========================================================================================#
 	# >>>>> ПЕРЕОПРЕДЕЛЯЕМЫЕ ОБРАБОТЧИКИ CALLBACK-ВЫЗОВОВ <<<<< #
@@ -180,7 +215,7 @@ class BaseNote:
 	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
-	def __init__(self, driver: "Driver", table: "BaseTable", note_id: int):
+	def __init__(self, driver: "Driver", table: "BaseTable", note_id: int, data: dict | None = None):
 		"""
 		Базовая запись.
 
@@ -188,6 +223,8 @@ class BaseNote:
 		:type table: BaseTable
 		:param note_id: ID записи.
 		:type note_id: int
+		:param data: Заранее прочитанные данные записи, например, параллельным загрузчиком. Если не переданы, считываются из локального файла.
+		:type data: dict | None
 		:raises ValueError: Обязательный ключ отсутствует в файле записи.
 		"""
 
@@ -195,7 +232,7 @@ class BaseNote:
 		self._Table = table
 		self._ID = note_id
 		
-		self._LoadData()
+		self._LoadData(data)
 		self.sort()
 		self._ParseContainers()
 		self._PostInitMethod()
@@ -205,6 +242,14 @@ class BaseNote:
 
 		self._Table.delete_note(self._ID)
 
+	def reload(self):
+		"""Перечитывает данные записи из локального файла JSON, отбрасывая несохранённые изменения."""
+
+		self._LoadData()
+		self.sort()
+		self._ParseContainers()
+		self._PostInitMethod()
+
 	def rename(self, name: str | None):
 		"""
 		Задаёт имя записи.
@@ -232,29 +277,40 @@ class BaseNote:
 			case CallbacksTypes.SlaveNoteSaved: self._Callback_SlaveNoteSaved(*args, **kwargs)
 
 	def save(self):
-		"""Сохраняет данные записи в локальный файл JSON."""
+		"""
+		Сохраняет данные записи в локальный файл JSON.
+
+		В режиме отложенной записи или во время пакетного редактирования таблицы существующая запись лишь помечается изменённой и будет записана позднее, вместе с оповещением записей, к которым она привязана. Файл новой записи создаётся сразу.
+		"""
+
+		self._Table.search_index.update(self)
+		self._Table.metainfo_index.update_note(self)
+		self._Table.columns.update_note(self)
+
+		if (self._Table.is_write_behind or self._Table.is_batch) and self.full_path.exists(): self._Table.mark_note_dirty(self)
+		else: self.write()
+
+	def write(self):
+		"""Немедленно записывает данные записи в локальный файл JSON и ставит в очередь таблицы оповещение записей, к которым она привязана."""
 
 		IsNoteFileExists = self.full_path.exists()
 
 		WriteJSON(self.full_path, self.to_dict(copy = False), atomic = True)
 
-		if IsNoteFileExists:
-			for Master in self.bonds.masters: Master.run_callback(CallbacksTypes.SlaveNoteSaved, self)
+		if IsNoteFileExists: self._Table.notify_note_saved(self)
 
-	def set_id(self, id: int):
+	def set_id(self, id: int, relocate: bool = True):
 		"""
 		Задаёт новый ID и переименовывает файл записи.
 
 		:param id: Новый ID записи.
 		:type id: int
+		:param relocate: Указывает, нужно ли переместить файлы записи и обновить связи и поисковый индекс через журналируемую перенумерацию таблицы. Отключается самой перенумерацией.
+		:type relocate: bool
 		"""
 
-		OldPath = self.full_path
-		NewPath = OldPath.parent / f"{id}.json"
-		os.rename(OldPath, NewPath)
-		self._Attachments.move(id)
-		self._Table.connector.bonds.update_note_id(self._ID, id)
-		self._ID = id
+		if relocate: self._Table.renumber({self._ID: id})
+		else: self._ID = id
 
 	def sort(self):
 		"""
@@ -295,8 +351,8 @@ class BaseNote:
 		"""
 
 		self._PreDictFormatter()
-		self._Data["metainfo"] = self._Metainfo.to_dict(copy)
-		self._Data["attachments"] = self._Attachments.to_dict()
+		self._Data["metainfo"] = self._Metainfo.to_dict(False)
+		if self._Attachments is not None: self._Data["attachments"] = self._Attachments.to_dict()
 		if sort: self.sort()
 
 		return Copy(self._Data) if copy else self._Data
\ No newline at end of file
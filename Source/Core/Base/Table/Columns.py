@@ -0,0 +1,352 @@
+from array import array
+from collections import Counter
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Iterable
+
+from .Loader import NotesLoader
+
+if TYPE_CHECKING:
+	from Source.Core.Base.Note import BaseNote
+	from Source.Core.Base.Table import BaseTable
+
+COLUMNS_TYPES = ("category", "integer", "string")
+COUNTING_THRESHOLD = 32
+NULL_INTEGER = -(1 << 63)
+
+class ColumnarView:
+	"""Колоночное представление скалярных полей записей таблицы."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def columns(self) -> tuple[str, ...]:
+		"""Последовательность имён колонок, включая колонку ID."""
+
+		return ("id",) + tuple(self.__Table.COLUMNS.keys())
+
+	@property
+	def is_built(self) -> bool:
+		"""Состояние: построено ли представление."""
+
+		return self.__IsBuilt
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __Append(self, note: "BaseNote"):
+		"""
+		Добавляет строку записи в конец колонок.
+
+		:param note: Запись.
+		:type note: BaseNote
+		"""
+
+		self.__Rows[note.id] = len(self.__IDs)
+		self.__IDs.append(note.id)
+
+		for Column, Type in self.__Table.COLUMNS.items():
+			Value = self.__GetValue(note, Column)
+
+			match Type:
+				case "category": self.__Data[Column].append(self.__Encode(Column, Value))
+				case "integer": self.__Data[Column].append(NULL_INTEGER if Value is None else Value)
+				case "string": self.__Data[Column].append(Value)
+
+	def __Build(self):
+		"""Строит колонки по записям таблицы. Если данные таблицы не загружены, записи считываются во временные объекты и в таблицу не помещаются."""
+
+		self.invalidate()
+
+		for Column, Type in self.__Table.COLUMNS.items():
+			if Type not in COLUMNS_TYPES: raise ValueError(f"Unknown column type \"{Type}\".")
+
+			match Type:
+				case "category":
+					self.__Data[Column] = array("l")
+					self.__Codes[Column] = dict()
+					self.__Labels[Column] = list()
+
+				case "integer": self.__Data[Column] = array("q")
+				case "string": self.__Data[Column] = list()
+
+		if self.__Table.is_loaded: Notes = self.__Table.notes
+		else: Notes = tuple(NotesLoader(self.__Table).load(self.__Table.notes_id).values())
+
+		for CurrentNote in Notes: self.__Append(CurrentNote)
+		self.__IsBuilt = True
+
+	def __Encode(self, column: str, value: Any) -> int:
+		"""
+		Возвращает код значения категориальной колонки, при необходимости добавляя значение в словарь колонки. Списки сохраняются кортежами.
+
+		:param column: Имя колонки.
+		:type column: str
+		:param value: Значение.
+		:type value: Any
+		:return: Код значения или `-1` для `None`.
+		:rtype: int
+		"""
+
+		if value is None: return -1
+		if type(value) is list: value = tuple(value)
+
+		Codes = self.__Codes[column]
+		Code = Codes.get(value)
+
+		if Code is None:
+			Code = Codes[value] = len(self.__Labels[column])
+			self.__Labels[column].append(value)
+
+		return Code
+
+	def __GetRank(self, column: str) -> list[int]:
+		"""
+		Возвращает порядковые номера значений категориальной колонки в порядке сортировки. Элементы перечислений сравниваются по своим значениям, кортежи – по строке из элементов.
+
+		:param column: Имя колонки.
+		:type column: str
+		:return: Список, где индекс – код значения, а значение – его порядковый номер.
+		:rtype: list[int]
+		"""
+
+		def GetKey(value: Any) -> Any:
+			"""
+			Возвращает ключ сортировки значения.
+
+			:param value: Значение.
+			:type value: Any
+			:return: Ключ сортировки.
+			:rtype: Any
+			"""
+
+			if isinstance(value, Enum): value = value.value
+			if type(value) is tuple: value = "; ".join(str(Element) for Element in value)
+
+			return value
+
+		Labels = self.__Labels[column]
+		Codes = range(len(Labels))
+
+		try: Order = sorted(Codes, key = lambda Code: GetKey(Labels[Code]))
+		except TypeError: Order = sorted(Codes, key = lambda Code: str(GetKey(Labels[Code])))
+
+		Rank = [0] * len(Labels)
+		for Position, Code in enumerate(Order): Rank[Code] = Position
+
+		return Rank
+
+	def __GetValue(self, note: "BaseNote", column: str) -> Any:
+		"""
+		Возвращает значение свойства записи или, если у записи нет такого свойства, значение поля метаданных без проверки его описания.
+
+		:param note: Запись.
+		:type note: BaseNote
+		:param column: Имя колонки.
+		:type column: str
+		:return: Значение.
+		:rtype: Any
+		"""
+
+		if hasattr(type(note), column): return getattr(note, column)
+
+		return note.metainfo.to_dict(copy = False).get(column)
+
+	def __Remove(self, row: int):
+		"""
+		Удаляет строку, перемещая на её место последнюю строку колонок.
+
+		:param row: Индекс строки.
+		:type row: int
+		"""
+
+		Last = len(self.__IDs) - 1
+
+		if row != Last:
+			self.__Rows[self.__IDs[Last]] = row
+			self.__IDs[row] = self.__IDs[Last]
+			for Values in self.__Data.values(): Values[row] = Values[Last]
+
+		self.__IDs.pop()
+		for Values in self.__Data.values(): Values.pop()
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, table: "BaseTable"):
+		"""
+		Колоночное представление скалярных полей записей таблицы.
+
+		Колонки объявляются в `COLUMNS` таблицы: ключом служит имя свойства записи или поля метаданных, а значением – тип колонки. Целочисленные колонки хранятся в типизированных массивах, категориальные, например статусы и перечисления, – массивами кодов со словарём значений, строковые – списками. Представление строится при первом обращении после загрузки данных и обновляется при сохранении записей, позволяя выводу списков, сортировке и статистике не обращаться к свойствам каждой записи.
+
+		:param table: Таблица.
+		:type table: BaseTable
+		"""
+
+		self.__Table = table
+
+		self.__IsBuilt = False
+		self.__IDs: array = array("q")
+		self.__Rows: dict[int, int] = dict()
+		self.__Data: dict[str, array | list] = dict()
+		self.__Codes: dict[str, dict[Any, int]] = dict()
+		self.__Labels: dict[str, list] = dict()
+
+	def __len__(self) -> int:
+		"""Возвращает количество строк."""
+
+		if not self.__IsBuilt: self.__Build()
+
+		return len(self.__IDs)
+
+	def count(self, column: str, rows: Iterable[int] | None = None) -> dict[Any, int]:
+		"""
+		Подсчитывает строки для каждого значения категориальной колонки. Если значений в словаре колонки не больше `COUNTING_THRESHOLD`, коды всех строк подсчитываются методом массива без перебора в интерпретаторе.
+
+		:param column: Имя колонки.
+		:type column: str
+		:param rows: Индексы строк, среди которых ведётся подсчёт, или `None` для всех строк.
+		:type rows: Iterable[int] | None
+		:return: Словарь, где ключ – значение, а значение – количество строк, отсортированный по убыванию количества. Пустые значения не учитываются.
+		:rtype: dict[Any, int]
+		:raises KeyError: Колонка не является категориальной.
+		"""
+
+		if not self.__IsBuilt: self.__Build()
+		if column not in self.__Labels: raise KeyError(column)
+
+		Codes = self.__Data[column]
+		Labels = self.__Labels[column]
+
+		if rows is None and len(Labels) <= COUNTING_THRESHOLD: Counts = Counter({Code: Codes.count(Code) for Code in range(len(Labels))})
+		elif rows is None: Counts = Counter(Codes)
+		else: Counts = Counter(Codes[Row] for Row in rows)
+
+		Counts.pop(-1, None)
+
+		return {Labels[Code]: Count for Code, Count in Counts.most_common() if Count}
+
+	def get_rows(self, notes_id: Iterable[int] | None = None) -> list[int]:
+		"""
+		Возвращает индексы строк записей.
+
+		:param notes_id: ID записей или `None` для всех строк. Отсутствующие в представлении записи пропускаются.
+		:type notes_id: Iterable[int] | None
+		:return: Список индексов строк в порядке следования переданных ID.
+		:rtype: list[int]
+		"""
+
+		if not self.__IsBuilt: self.__Build()
+		if notes_id is None: return list(range(len(self.__IDs)))
+
+		return [self.__Rows[NoteID] for NoteID in notes_id if NoteID in self.__Rows]
+
+	def get_values(self, column: str, rows: Iterable[int] | None = None) -> list:
+		"""
+		Возвращает значения колонки. Категориальные значения декодируются, пустые значения представляются `None`.
+
+		:param column: Имя колонки.
+		:type column: str
+		:param rows: Индексы строк или `None` для всех строк.
+		:type rows: Iterable[int] | None
+		:return: Список значений.
+		:rtype: list
+		:raises KeyError: Колонка не объявлена.
+		"""
+
+		if not self.__IsBuilt: self.__Build()
+		if rows is None: rows = range(len(self.__IDs))
+
+		if column == "id": return [self.__IDs[Row] for Row in rows]
+		Values = self.__Data[column]
+
+		if column in self.__Labels:
+			Labels = self.__Labels[column]
+			return [None if Values[Row] == -1 else Labels[Values[Row]] for Row in rows]
+
+		if type(Values) is array: return [None if Values[Row] == NULL_INTEGER else Values[Row] for Row in rows]
+
+		return [Values[Row] for Row in rows]
+
+	def invalidate(self):
+		"""Сбрасывает представление. Оно будет построено заново при следующем обращении."""
+
+		self.__IsBuilt = False
+		self.__IDs = array("q")
+		self.__Rows = dict()
+		self.__Data = dict()
+		self.__Codes = dict()
+		self.__Labels = dict()
+
+	def remove(self, note_id: int):
+		"""
+		Удаляет строку записи.
+
+		:param note_id: ID записи.
+		:type note_id: int
+		"""
+
+		if self.__IsBuilt and note_id in self.__Rows: self.__Remove(self.__Rows.pop(note_id))
+
+	def sort(self, rows: Iterable[int], column: str, reverse: bool = False) -> list[int]:
+		"""
+		Сортирует строки по значениям колонки. Категориальные колонки сортируются по порядковым номерам значений, вычисляемым один раз для словаря колонки. Строки с пустыми значениями помещаются в конец.
+
+		:param rows: Индексы строк.
+		:type rows: Iterable[int]
+		:param column: Имя колонки.
+		:type column: str
+		:param reverse: Указывает, нужно ли сортировать по убыванию.
+		:type reverse: bool
+		:return: Отсортированный список индексов строк.
+		:rtype: list[int]
+		:raises KeyError: Колонка не объявлена.
+		"""
+
+		if not self.__IsBuilt: self.__Build()
+		Rows = list(rows)
+
+		if column == "id": return sorted(Rows, key = self.__IDs.__getitem__, reverse = reverse)
+		Values = self.__Data[column]
+
+		if column in self.__Labels:
+			Rank = self.__GetRank(column)
+			Empty = [Row for Row in Rows if Values[Row] == -1]
+			Rows = sorted((Row for Row in Rows if Values[Row] != -1), key = lambda Row: Rank[Values[Row]], reverse = reverse)
+
+		elif type(Values) is array:
+			Empty = [Row for Row in Rows if Values[Row] == NULL_INTEGER]
+			Rows = sorted((Row for Row in Rows if Values[Row] != NULL_INTEGER), key = Values.__getitem__, reverse = reverse)
+
+		else:
+			Empty = [Row for Row in Rows if Values[Row] is None]
+			Rows = sorted((Row for Row in Rows if Values[Row] is not None), key = Values.__getitem__, reverse = reverse)
+
+		return Rows + Empty
+
+	def update_note(self, note: "BaseNote"):
+		"""
+		Обновляет строку сохранённой записи или добавляет строку новой записи. Ничего не делает, если представление ещё не построено.
+
+		:param note: Запись.
+		:type note: BaseNote
+		"""
+
+		if not self.__IsBuilt: return
+
+		Row = self.__Rows.get(note.id)
+
+		if Row is None:
+			self.__Append(note)
+			return
+
+		for Column, Type in self.__Table.COLUMNS.items():
+			Value = self.__GetValue(note, Column)
+
+			match Type:
+				case "category": self.__Data[Column][Row] = self.__Encode(Column, Value)
+				case "integer": self.__Data[Column][Row] = NULL_INTEGER if Value is None else Value
+				case "string": self.__Data[Column][Row] = Value
@@ -1,10 +1,12 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from dublib.Methods.Filesystem import ReadJSON, WriteJSON
+from dublib.Methods.Filesystem import WriteJSON
 
 from Source.Core import Exceptions
 
+from .Graph import BondGraph
+
 if TYPE_CHECKING:
 	from . import BaseNote, BaseTable
 
@@ -12,13 +14,6 @@ if TYPE_CHECKING:
 # >>>>> ОПЕРАТОР СВЯЗЕЙ <<<<< #
 #==========================================================================================#
 
-@dataclass
-class NoteBondsCache:
-	"""Кэш связей записи."""
-
-	masters: list[int] = field(default_factory = list)
-	slaves: list[int] = field(default_factory = list)
-
 @dataclass(frozen = True)
 class Bond:
 	"""Связь."""
@@ -33,17 +28,29 @@ class NoteBonds:
 	# >>>>> СВОЙСТВА <<<<< #
 	#==========================================================================================#
 
+	@property
+	def ancestors(self) -> "tuple[BaseNote, ...]":
+		"""Записи, транзитивно привязавшие данную по любой связи."""
+
+		return self.__Operator.get_note_ancestors(self.__NoteID)
+
 	@property
 	def bonds(self) -> tuple[Bond, ...]:
 		"""Последовательность связей."""
 
-		return tuple(self.__Bonds.values())
+		return tuple(self.get_bond(Name) for Name in self.__Operator.graph.names)
 	
 	@property
 	def bonds_names(self) -> tuple[str, ...]:
 		"""Последовательность имён связей."""
 
-		return tuple(self.__Bonds.keys())
+		return self.__Operator.graph.names
+
+	@property
+	def descendants(self) -> "tuple[BaseNote, ...]":
+		"""Записи, транзитивно привязанные к данной по любой связи."""
+
+		return self.__Operator.get_note_descendants(self.__NoteID)
 
 	@property
 	def has_masters(self) -> bool:
@@ -69,50 +76,23 @@ class NoteBonds:
 
 		return self.__Operator.get_note_slaves(self.__NoteID)
 
-	#==========================================================================================#
-	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
-	#==========================================================================================#
-
-	def __ParseData(self, data: dict[str, list[int]]) -> dict[str, Bond]:
-		"""
-		Парсит данные связей.
-
-		:param data: Словарь данных связей.
-		:type data: dict[str, list[int]]
-		:return: Словарь связей.
-		:rtype: dict[str, Bond]
-		"""
-
-		for BondName in self.__Table.manifest.connections.bonds.names:
-			if BondName not in data: data[BondName] = list()
-
-		Bonds = dict()
-		for Name, SlavesList in data.items(): Bonds[Name] = Bond(Name, SlavesList)
-
-		return Bonds
-
 	#==========================================================================================#
 	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
-	def __init__(self, operator: "BondsOperator", note_id: int, data: dict[str, list[int]]):
+	def __init__(self, operator: "BondsOperator", note_id: int):
 		"""
-		Связи записи.
+		Связи записи. Данные связей хранятся в графе оператора.
 		
 		:param operator: Оператор связей.
 		:type operator: BondsOperator
 		:param note_id: ID записи.
 		:type note_id: int
-		:param data: Словарь данных связей.
-		:type data: dict[str, list[int]]
 		"""
 
 		self.__Operator = operator
 		self.__NoteID = note_id
 
-		self.__Table = operator.table
-		self.__Bonds: dict[str, Bond] = self.__ParseData(data)
-
 	def bind(self, bond_name: str, slave_id: int):
 		"""
 		Привязывает одну запись к другой внутри таблицы.
@@ -131,14 +111,15 @@ class NoteBonds:
 
 		:param bond_name: Имя связи.
 		:type bond_name: str
-		:return: Связь.
+		:return: Связь с копией списка ID привязанных записей.
 		:rtype: Bond
 		:raises BondNotDescribed: Связь не описана.
 		"""
 
-		if bond_name not in self.__Bonds: raise Exceptions.Note.BondNotDescribed(bond_name)
+		Graph = self.__Operator.graph
+		if bond_name not in Graph.names: raise Exceptions.Note.BondNotDescribed(bond_name)
 
-		return self.__Bonds[bond_name]
+		return Bond(bond_name, list(Graph.get_slaves(bond_name, self.__NoteID)))
 
 	def set_note_id(self, new_note_id: int):
 		"""
@@ -158,7 +139,7 @@ class NoteBonds:
 		:rtype: dict
 		"""
 
-		return {Name: CurrentBond.slaves_id for Name, CurrentBond in self.__Bonds.items()}
+		return {CurrentBond.name: CurrentBond.slaves_id for CurrentBond in self.bonds}
 
 	def unbind(self, bond_name: str, slave_id: int):
 		"""
@@ -172,21 +153,6 @@ class NoteBonds:
 
 		self.__Operator.unbind(self.__NoteID, bond_name, slave_id)		
 
-	def update_slaves_id(self, old_slave_id: int, new_slave_id: int):
-		"""
-		Заменяет старый ID привязанной записи на новый.
-
-		:param old_slave_id: Старый ID.
-		:type old_slave_id: int
-		:param new_slave_id: Новый ID.
-		:type new_slave_id: int
-		"""
-
-		for CurrentBond in self.__Bonds.values():
-			if old_slave_id in CurrentBond.slaves_id:
-				Index = CurrentBond.slaves_id.index(old_slave_id)
-				CurrentBond.slaves_id[Index] = new_slave_id
-
 class BondsOperator:
 	"""Оператор связей."""
 
@@ -194,6 +160,18 @@ class BondsOperator:
 	# >>>>> СВОЙСТВА <<<<< #
 	#==========================================================================================#
 
+	@property
+	def graph(self) -> BondGraph:
+		"""Граф связей."""
+
+		return self.__Graph
+
+	@property
+	def is_changed(self) -> bool:
+		"""Состояние: имеются ли изменения, сохранение которых отложено пакетным редактированием."""
+
+		return self.__IsChanged
+
 	@property
 	def table(self) -> "BaseTable":
 		"""Таблица."""
@@ -204,33 +182,31 @@ class BondsOperator:
 	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
-	def __LoadData(self):
-		"""Считывает данные из файла _.bonds.json_ в директории таблицы и парсит их."""
-
-		self.__Bonds: dict[int, NoteBonds] = dict()
-
-		DataFilePath = self.__Table.full_path / ".bonds.json"
+	def __CheckBondName(self, bond_name: str | None):
+		"""
+		Проверяет, описана ли связь.
 
-		if DataFilePath.exists():
-			Buffer = ReadJSON(DataFilePath)
-			for MasterID in Buffer.keys(): self.__Bonds[int(MasterID)] = NoteBonds(self, int(MasterID), Buffer[MasterID])
+		:param bond_name: Имя связи или `None` для всех связей.
+		:type bond_name: str | None
+		:raises BondNotDescribed: Связь не описана.
+		"""
 
-		self.__UpdateBondsCache()
+		if bond_name is not None and bond_name not in self.__Graph.names: raise Exceptions.Note.BondNotDescribed(bond_name)
 
-	def __UpdateBondsCache(self):
-		"""Обновляет кэш связей."""
+	def __LoadData(self):
+		"""Считывает данные из файла _.bonds.json_ в директории таблицы (или из снимка таблицы) и парсит их."""
 
-		self.__Cache: dict[int, NoteBondsCache] = dict()
+		self.__ParseData(self.__Table.snapshot.read(".bonds.json") or dict())
 
-		for MasterID, MasterBonds in self.__Bonds.items():
-			if MasterID not in self.__Cache: self.__Cache[MasterID] = NoteBondsCache()
+	def __ParseData(self, data: dict):
+		"""
+		Строит граф связей за один проход по данным.
 
-			for Bond in MasterBonds.bonds:
-				for SlaveID in Bond.slaves_id:
-					if SlaveID not in self.__Cache: self.__Cache[SlaveID] = NoteBondsCache()
+		:param data: Словарь, где ключ – ID привязывающей записи, а значение – словарь её связей.
+		:type data: dict
+		"""
 
-					if SlaveID not in self.__Cache[MasterID].slaves: self.__Cache[MasterID].slaves.append(SlaveID)
-					if MasterID not in self.__Cache[SlaveID].masters: self.__Cache[SlaveID].masters.append(MasterID)
+		self.__Graph = BondGraph(self.__Table.manifest.connections.bonds.names, data)
 
 	#==========================================================================================#
 	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
@@ -245,6 +221,9 @@ class BondsOperator:
 		"""
 
 		self.__Table = table
+
+		self.__Bonds: dict[int, NoteBonds] = dict()
+		self.__IsChanged = False
 		
 		self.__LoadData()
 
@@ -259,20 +238,38 @@ class BondsOperator:
 		:param slave_id: ID привязываемой записи.
 		:type slave_id: int
 		:raises MaxBindedNotesCountReached: Достигнуто максимальное количество прикрепляемых записей.
+		:raises BondCycleDetected: Привязка образует цикл связей.
 		"""
 
 		self.__Table.get_note(master_id)
 		self.__Table.get_note(slave_id)
 
 		BondParameters = self.__Table.manifest.connections.bonds.get_bond_parameters(bond_name)
-		MasterBond = self.get_note_bonds(master_id).get_bond(bond_name)
+		self.__CheckBondName(bond_name)
+		SlavesCount = len(self.__Graph.get_slaves(bond_name, master_id))
 
-		if BondParameters.count and len(MasterBond.slaves_id) >= BondParameters.count: raise Exceptions.Note.MaxBindedNotesCountReached(bond_name, BondParameters.count)
-
-		MasterBond.slaves_id.append(slave_id)
+		if BondParameters.count and SlavesCount >= BondParameters.count: raise Exceptions.Note.MaxBindedNotesCountReached(bond_name, BondParameters.count)
+		if master_id == slave_id or self.__Graph.is_reachable(slave_id, master_id): raise Exceptions.Note.BondCycleDetected(bond_name, (master_id, slave_id))
 
+		self.__Graph.add(bond_name, master_id, slave_id)
 		self.save()
-		self.__UpdateBondsCache()
+
+	def get_note_ancestors(self, note_id: int, bond_name: str | None = None) -> "tuple[BaseNote, ...]":
+		"""
+		Возвращает записи, транзитивно привязавшие данную. Результат обхода запоминается до следующего изменения связей.
+
+		:param note_id: ID записи.
+		:type note_id: int
+		:param bond_name: Имя связи. По умолчанию учитываются все связи.
+		:type bond_name: str | None
+		:return: Последовательность записей в порядке возрастания ID.
+		:rtype: tuple[BaseNote, ...]
+		:raises BondNotDescribed: Связь не описана.
+		"""
+
+		self.__CheckBondName(bond_name)
+
+		return tuple(self.__Table.get_note(NoteID) for NoteID in self.__Graph.get_ancestors(note_id, bond_name))
 
 	def get_note_bonds(self, note_id: int) -> NoteBonds:
 		"""
@@ -286,9 +283,26 @@ class BondsOperator:
 
 		self.__Table.get_note(note_id)
 
-		if not self.__Bonds.get(note_id): self.__Bonds[note_id] = NoteBonds(self, note_id, dict())
+		if note_id not in self.__Bonds: self.__Bonds[note_id] = NoteBonds(self, note_id)
+
+		return self.__Bonds[note_id]
+
+	def get_note_descendants(self, note_id: int, bond_name: str | None = None) -> "tuple[BaseNote, ...]":
+		"""
+		Возвращает записи, транзитивно привязанные к данной. Результат обхода запоминается до следующего изменения связей.
+
+		:param note_id: ID записи.
+		:type note_id: int
+		:param bond_name: Имя связи. По умолчанию учитываются все связи.
+		:type bond_name: str | None
+		:return: Последовательность записей в порядке возрастания ID.
+		:rtype: tuple[BaseNote, ...]
+		:raises BondNotDescribed: Связь не описана.
+		"""
+
+		self.__CheckBondName(bond_name)
 
-		return self.__Bonds.get(note_id)
+		return tuple(self.__Table.get_note(NoteID) for NoteID in self.__Graph.get_descendants(note_id, bond_name))
 
 	def get_note_masters(self, slave_id: int) -> "tuple[BaseNote, ...]":
 		"""
@@ -300,11 +314,7 @@ class BondsOperator:
 		:rtype: tuple[BaseNote, ...]
 		"""
 
-		BindedNotes: list["BaseNote"] = list()
-		if slave_id in self.__Cache:
-			for MasterID in self.__Cache[slave_id].masters: BindedNotes.append(self.__Table.get_note(MasterID))
-
-		return tuple(sorted(BindedNotes, key = lambda CurrentNote: CurrentNote.id))
+		return tuple(self.__Table.get_note(MasterID) for MasterID in self.__Graph.get_masters_id(slave_id))
 
 	def get_note_slaves(self, master_id: int) -> "tuple[BaseNote, ...]":
 		"""
@@ -317,11 +327,23 @@ class BondsOperator:
 		:raises NoteNotFound: Запись не найдена в таблице.
 		"""
 
-		BindedNotes: list["BaseNote"] = list()
-		if master_id in self.__Cache:
-			for SlaveID in self.__Cache[master_id].slaves: BindedNotes.append(self.__Table.get_note(SlaveID))
+		return tuple(self.__Table.get_note(SlaveID) for SlaveID in self.__Graph.get_slaves_id(master_id))
 
-		return tuple(sorted(BindedNotes, key = lambda CurrentNote: CurrentNote.id))
+	def get_topological_order(self, bond_name: str | None = None) -> "tuple[BaseNote, ...]":
+		"""
+		Возвращает участвующие в связях записи в топологическом порядке: каждая привязывающая запись предшествует привязанным к ней.
+
+		:param bond_name: Имя связи. По умолчанию учитываются все связи.
+		:type bond_name: str | None
+		:return: Последовательность записей.
+		:rtype: tuple[BaseNote, ...]
+		:raises BondNotDescribed: Связь не описана.
+		:raises BondCycleDetected: Связи образуют цикл.
+		"""
+
+		self.__CheckBondName(bond_name)
+
+		return tuple(self.__Table.get_note(NoteID) for NoteID in self.__Graph.get_topological_order(bond_name))
 
 	def is_note_has_masters(self, slave_id: int) -> bool:
 		"""
@@ -333,9 +355,7 @@ class BondsOperator:
 		:rtype: bool
 		"""
 
-		if slave_id not in self.__Cache: return False
-
-		return bool(self.__Cache[slave_id].masters)
+		return self.__Graph.has_masters(slave_id)
 	
 	def is_note_has_slaves(self, master_id: int) -> bool:
 		"""
@@ -348,24 +368,63 @@ class BondsOperator:
 		:raises NoteNotFound: Запись не найдена в таблице.
 		"""
 
-		if master_id not in self.__Cache: return False
+		return self.__Graph.has_slaves(master_id)
 
-		return bool(self.__Cache[master_id].slaves)
+	def renumber(self, mapping: dict[int, int]):
+		"""
+		Заменяет ID записей во всех связях без записи в файл.
+
+		:param mapping: Словарь, где ключ – старый ID записи, а значение – новый.
+		:type mapping: dict[int, int]
+		"""
+
+		Bonds = dict()
+
+		for NoteID, CurrentNoteBonds in self.__Bonds.items():
+			NoteID = mapping.get(NoteID, NoteID)
+			CurrentNoteBonds.set_note_id(NoteID)
+			Bonds[NoteID] = CurrentNoteBonds
+
+		self.__Bonds = Bonds
+		self.__Graph.renumber(mapping)
+
+	def restore(self, data: dict):
+		"""
+		Заменяет связи данными из словарного представления без сохранения в файл.
+
+		:param data: Словарное представление связей, полученное методом `to_dict()`.
+		:type data: dict
+		"""
+
+		self.__ParseData(data)
+		self.__IsChanged = False
 
 	def save(self):
-		"""Сохраняет данные связей в файл _.bonds.json_ в директории таблицы."""
+		"""Сохраняет данные связей в файл _.bonds.json_ в директории таблицы. Во время пакетного редактирования таблицы сохранение откладывается."""
 
-		WriteJSON(self.__Table.full_path / ".bonds.json", self.to_dict(), atomic = True)
+		if self.__Table.is_batch: self.__IsChanged = True
+		else: self.write()
 
 	def to_dict(self) -> dict:
 		"""
-		Возвращает словарное представление объекта.
+		Возвращает словарное представление объекта. Списки ID привязанных записей создаются заново при каждом вызове.
 
 		:return: Словарное представление объекта
 		:rtype: dict
 		"""
 
-		return {NoteID: CurrentNoteBonds.to_dict() for NoteID, CurrentNoteBonds in self.__Bonds.items() if CurrentNoteBonds.bonds}
+		return self.__Graph.to_dict()
+
+	def write(self, atomic: bool = True):
+		"""
+		Немедленно записывает данные связей в файл _.bonds.json_ в директории таблицы.
+
+		:param atomic: Указывает, нужно ли записывать через временный файл. Отключается, если целостность файла обеспечивает журнал таблицы.
+		:type atomic: bool
+		"""
+
+		WriteJSON(self.__Table.full_path / ".bonds.json", self.to_dict(), atomic = atomic)
+		self.__IsChanged = False
 
 	def unbind(self, master_id: int, bond_name: str, slave_id: int):
 		"""
@@ -382,35 +441,9 @@ class BondsOperator:
 		self.__Table.get_note(master_id)
 		self.__Table.get_note(slave_id)
 		self.__Table.manifest.connections.bonds.get_bond_parameters(bond_name)
+		self.__CheckBondName(bond_name)
 
-		MasterBond = self.get_note_bonds(master_id).get_bond(bond_name)
-
-		try:
-			MasterBond.slaves_id.remove(slave_id)
-			self.save()
-			self.__UpdateBondsCache()
-		except ValueError: pass
-
-	def update_note_id(self, old_id: int, new_id: int):
-		"""
-		Обновляет ID записи во внутреннем хранилище.
-
-		:param old_id: Старый ID записи.
-		:type old_id: int
-		:param new_id: Новый ID записи.
-		:type new_id: int
-		"""
-
-		if old_id in self.__Bonds:
-			Buffer = self.__Bonds[old_id]
-			Buffer.set_note_id(new_id)
-			del self.__Bonds[old_id]
-			self.__Bonds[new_id] = Buffer
-
-		for CurrentNoteBonds in self.__Bonds.values(): CurrentNoteBonds.update_slaves_id(old_id, new_id)
-
-		self.save()
-		self.__UpdateBondsCache()
+		if self.__Graph.remove(bond_name, master_id, slave_id): self.save()
 
 #==========================================================================================#
 # >>>>> ОСНОВНОЙ КЛАСС <<<<< #
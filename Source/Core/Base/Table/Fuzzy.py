@@ -0,0 +1,205 @@
+import heapq
+import re
+import unicodedata
+from collections import Counter
+
+TRANSLITERATION = str.maketrans({
+	"а": "a", "б": "b", "в": "v", "г": "g", "д": "d", "е": "e", "ё": "e", "ж": "zh", "з": "z", "и": "i", "й": "i",
+	"к": "k", "л": "l", "м": "m", "н": "n", "о": "o", "п": "p", "р": "r", "с": "s", "т": "t", "у": "u", "ф": "f",
+	"х": "h", "ц": "ts", "ч": "ch", "ш": "sh", "щ": "sch", "ъ": "", "ы": "y", "ь": "", "э": "e", "ю": "yu", "я": "ya"
+})
+
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ <<<<< #
+#==========================================================================================#
+
+def Levenshtein(first: str, second: str) -> int:
+	"""
+	Вычисляет редакционное расстояние Левенштейна между строками.
+
+	:param first: Первая строка.
+	:type first: str
+	:param second: Вторая строка.
+	:type second: str
+	:return: Минимальное количество вставок, удалений и замен символов.
+	:rtype: int
+	"""
+
+	if len(first) < len(second): first, second = second, first
+	if not second: return len(first)
+
+	Previous = list(range(len(second) + 1))
+
+	for FirstIndex, FirstChar in enumerate(first, 1):
+		Current = [FirstIndex]
+
+		for SecondIndex, SecondChar in enumerate(second, 1):
+			Current.append(min(Previous[SecondIndex] + 1, Current[SecondIndex - 1] + 1, Previous[SecondIndex - 1] + (FirstChar != SecondChar)))
+
+		Previous = Current
+
+	return Previous[-1]
+
+def Normalize(string: str) -> str:
+	"""
+	Приводит строку к нормализованной латинской форме: раскладывает символы Unicode, удаляет диакритику, транслитерирует кириллицу, сокращает долгие гласные ромадзи и схлопывает пробельные символы.
+
+	:param string: Исходная строка.
+	:type string: str
+	:return: Нормализованная строка.
+	:rtype: str
+	"""
+
+	string = unicodedata.normalize("NFKD", string.lower())
+	string = "".join(Char for Char in string if not unicodedata.combining(Char))
+	string = string.translate(TRANSLITERATION)
+	string = re.sub(r"[\W_]+", " ", string).strip()
+
+	return re.sub(r"(ou|oo)", "o", string).replace("uu", "u")
+
+#==========================================================================================#
+# >>>>> ОСНОВНОЙ КЛАСС <<<<< #
+#==========================================================================================#
+
+class FuzzyIndex:
+	"""Нечёткий поисковый индекс с ранжированием."""
+
+	#==========================================================================================#
+	# >>>>> СТАТИЧЕСКИЕ АТРИБУТЫ <<<<< #
+	#==========================================================================================#
+
+	CANDIDATES_FACTOR = 8
+	NGRAM_WEIGHT = 0.6
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __GetNgrams(self, string: str) -> set[str]:
+		"""
+		Возвращает множество триграмм строки, дополненной пробелами по краям слов.
+
+		:param string: Нормализованная строка.
+		:type string: str
+		:return: Множество триграмм.
+		:rtype: set[str]
+		"""
+
+		string = f"  {string} "
+
+		return {string[Index:Index + 3] for Index in range(len(string) - 2)}
+
+	def __GetEditSimilarity(self, query: str, string: str) -> float:
+		"""
+		Вычисляет сходство по редакционному расстоянию между запросом и наиболее похожим фрагментом строки с тем же количеством слов.
+
+		:param query: Нормализованный запрос.
+		:type query: str
+		:param string: Нормализованная строка.
+		:type string: str
+		:return: Сходство от 0 до 1.
+		:rtype: float
+		"""
+
+		QueryWords = query.split(" ")
+		Words = string.split(" ")
+		Fragments = {string}
+		WindowSize = len(QueryWords)
+
+		for Index in range(max(0, len(Words) - WindowSize) + 1): Fragments.add(" ".join(Words[Index:Index + WindowSize]))
+
+		BestSimilarity = 0.0
+
+		for Fragment in Fragments:
+			Length = max(len(query), len(Fragment))
+			if not Length: continue
+			BestSimilarity = max(BestSimilarity, 1 - Levenshtein(query, Fragment) / Length)
+
+		return BestSimilarity
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self):
+		"""
+		Нечёткий поисковый индекс с ранжированием.
+
+		Строки нормализуются (Unicode, диакритика, кириллица в латиницу), раскладываются на триграммы, а кандидаты ранжируются по сходству триграмм и редакционному расстоянию.
+		"""
+
+		self.__Entries: dict[tuple[int, int], tuple[str, int]] = dict()
+		self.__Ngrams: dict[str, set[tuple[int, int]]] = dict()
+
+	def add(self, note_id: int, strings: tuple[str, ...]):
+		"""
+		Добавляет строки записи в индекс.
+
+		:param note_id: ID записи.
+		:type note_id: int
+		:param strings: Индексируемые строки записи.
+		:type strings: tuple[str, ...]
+		"""
+
+		for Index, String in enumerate(strings):
+			String = Normalize(String)
+			if not String: continue
+			Key = (note_id, Index)
+			Ngrams = self.__GetNgrams(String)
+			self.__Entries[Key] = (String, len(Ngrams))
+			for Ngram in Ngrams: self.__Ngrams.setdefault(Ngram, set()).add(Key)
+
+	def remove(self, note_id: int, strings: tuple[str, ...]):
+		"""
+		Удаляет строки записи из индекса.
+
+		:param note_id: ID записи.
+		:type note_id: int
+		:param strings: Ранее индексированные строки записи.
+		:type strings: tuple[str, ...]
+		"""
+
+		for Index in range(len(strings)):
+			Entry = self.__Entries.pop((note_id, Index), None)
+			if not Entry: continue
+
+			for Ngram in self.__GetNgrams(Entry[0]):
+				Postings = self.__Ngrams[Ngram]
+				Postings.discard((note_id, Index))
+				if not Postings: del self.__Ngrams[Ngram]
+
+	def search(self, query: str, limit: int) -> tuple[tuple[int, float], ...]:
+		"""
+		Ищет записи, наиболее похожие на запрос.
+
+		:param query: Поисковый запрос.
+		:type query: str
+		:param limit: Максимальное количество результатов.
+		:type limit: int
+		:return: Последовательность пар из ID записи и оценки сходства от 0 до 1 в порядке убывания оценки.
+		:rtype: tuple[tuple[int, float], ...]
+		"""
+
+		query = Normalize(query)
+		if not query or limit < 1: return tuple()
+
+		QueryNgrams = self.__GetNgrams(query)
+		Shared: Counter[tuple[int, int]] = Counter()
+
+		for Ngram in QueryNgrams:
+			if Ngram in self.__Ngrams: Shared.update(self.__Ngrams[Ngram])
+
+		Scores: dict[tuple[int, int], float] = dict()
+
+		for Key, Count in Shared.items():
+			Scores[Key] = Count / (len(QueryNgrams) + self.__Entries[Key][1] - Count)
+
+		Candidates = heapq.nlargest(limit * self.CANDIDATES_FACTOR, Scores.items(), key = lambda Item: Item[1])
+		Result: dict[int, float] = dict()
+
+		for Key, NgramSimilarity in Candidates:
+			EditSimilarity = self.__GetEditSimilarity(query, self.__Entries[Key][0])
+			Score = self.NGRAM_WEIGHT * NgramSimilarity + (1 - self.NGRAM_WEIGHT) * EditSimilarity
+			if Score > Result.get(Key[0], 0.0): Result[Key[0]] = Score
+
+		return tuple(heapq.nlargest(limit, Result.items(), key = lambda Item: (Item[1], -Item[0])))
@@ -0,0 +1,504 @@
+import heapq
+from array import array
+from typing import Iterable, Iterator, Sequence
+
+from Source.Core import Exceptions
+
+class BondGraph:
+	"""Разреженный граф связей записей."""
+
+	#==========================================================================================#
+	# >>>>> СТАТИЧЕСКИЕ АТРИБУТЫ <<<<< #
+	#==========================================================================================#
+
+	COMPACTION_MINIMUM = 64
+	COMPACTION_RATIO = 4
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def names(self) -> tuple[str, ...]:
+		"""Последовательность имён связей."""
+
+		return tuple(self.__Names)
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __BuildCSR(self, sources: array, targets: array) -> tuple[array, array]:
+		"""
+		Строит сжатое построчное представление списка рёбер подсчётом. Порядок рёбер одной строки сохраняется.
+
+		:param sources: ID исходных записей рёбер.
+		:type sources: array
+		:param targets: ID целевых записей рёбер.
+		:type targets: array
+		:return: Массив смещений строк и массив ID целевых записей.
+		:rtype: tuple[array, array]
+		"""
+
+		Offsets = array("i", bytes(4 * (len(self.__Rows) + 1)))
+		for SourceID in sources: Offsets[self.__Rows[SourceID] + 1] += 1
+		for Row in range(len(self.__Rows)): Offsets[Row + 1] += Offsets[Row]
+
+		Cursors = Offsets[:-1]
+		Targets = array("i", bytes(4 * len(targets)))
+
+		for SourceID, TargetID in zip(sources, targets):
+			Row = self.__Rows[SourceID]
+			Targets[Cursors[Row]] = TargetID
+			Cursors[Row] += 1
+
+		return Offsets, Targets
+
+	def __Compile(self, edges: dict[str, tuple[array, array]]):
+		"""
+		Строит основные массивы графа и очищает слой изменений.
+
+		:param edges: Словарь, где ключ – имя связи, а значение – массивы ID привязывающих и привязанных записей.
+		:type edges: dict[str, tuple[array, array]]
+		"""
+
+		NotesID: set[int] = set()
+
+		for Masters, Slaves in edges.values():
+			NotesID.update(Masters)
+			NotesID.update(Slaves)
+
+		self.__Rows: dict[int, int] = {NoteID: Row for Row, NoteID in enumerate(sorted(NotesID))}
+		self.__Forward: dict[str, tuple[array, array]] = dict()
+		self.__Reverse: dict[str, tuple[array, array]] = dict()
+
+		for Name, (Masters, Slaves) in edges.items():
+			self.__Forward[Name] = self.__BuildCSR(Masters, Slaves)
+			self.__Reverse[Name] = self.__BuildCSR(Slaves, Masters)
+
+		self.__ForwardOverlay: dict[str, dict[int, list[int]]] = {Name: dict() for Name in self.__Names}
+		self.__ReverseOverlay: dict[str, dict[int, list[int]]] = {Name: dict() for Name in self.__Names}
+		self.__OverlaySize = 0
+		self.__SortedMasters: dict[int, tuple[int, ...]] = dict()
+		self.__SortedSlaves: dict[int, tuple[int, ...]] = dict()
+		self.__Queries: dict[tuple, tuple[int, ...]] = dict()
+
+	def __CompactIfNeeded(self):
+		"""Перестраивает основные массивы графа, если слой изменений стал слишком большим."""
+
+		if self.__OverlaySize <= max(self.COMPACTION_MINIMUM, len(self.__Rows) // self.COMPACTION_RATIO): return
+		self.__Rebuild()
+
+	def __GetAdjacency(self, overlay: dict[str, dict[int, list[int]]], csr: dict[str, tuple[array, array]], name: str, note_id: int) -> Sequence[int]:
+		"""
+		Возвращает смежные записи из слоя изменений или срез основного массива без копирования.
+
+		:param overlay: Слой изменений.
+		:type overlay: dict[str, dict[int, list[int]]]
+		:param csr: Основные массивы.
+		:type csr: dict[str, tuple[array, array]]
+		:param name: Имя связи.
+		:type name: str
+		:param note_id: ID записи.
+		:type note_id: int
+		:return: Последовательность ID смежных записей.
+		:rtype: Sequence[int]
+		"""
+
+		Overlay = overlay.get(name)
+		if Overlay and note_id in Overlay: return Overlay[note_id]
+
+		Row = self.__Rows.get(note_id)
+		if Row is None or name not in csr: return tuple()
+		Offsets, Targets = csr[name]
+
+		return memoryview(Targets)[Offsets[Row]:Offsets[Row + 1]]
+
+	def __GetNotesID(self) -> list[int]:
+		"""
+		Возвращает отсортированный список ID записей, присутствующих в графе.
+
+		:return: Список ID записей.
+		:rtype: list[int]
+		"""
+
+		NotesID = set(self.__Rows)
+		for Overlay in self.__ForwardOverlay.values(): NotesID.update(Overlay)
+		for Overlay in self.__ReverseOverlay.values(): NotesID.update(Overlay)
+
+		return sorted(NotesID)
+
+	def __IterateNeighbors(self, note_id: int, name: str | None, reverse: bool) -> Iterator[int]:
+		"""
+		Перебирает смежные записи по одной или всем связям.
+
+		:param note_id: ID записи.
+		:type note_id: int
+		:param name: Имя связи или `None` для всех связей.
+		:type name: str | None
+		:param reverse: Указывает, нужно ли перебирать привязавшие записи вместо привязанных.
+		:type reverse: bool
+		:return: Итератор ID смежных записей.
+		:rtype: Iterator[int]
+		"""
+
+		Getter = self.get_masters if reverse else self.get_slaves
+		for Name in (self.__Names if name is None else (name,)): yield from Getter(Name, note_id)
+
+	def __Materialize(self, overlay: dict[str, dict[int, list[int]]], csr: dict[str, tuple[array, array]], name: str, note_id: int) -> list[int]:
+		"""
+		Переносит смежные записи в слой изменений для последующей модификации.
+
+		:param overlay: Слой изменений.
+		:type overlay: dict[str, dict[int, list[int]]]
+		:param csr: Основные массивы.
+		:type csr: dict[str, tuple[array, array]]
+		:param name: Имя связи.
+		:type name: str
+		:param note_id: ID записи.
+		:type note_id: int
+		:return: Изменяемый список ID смежных записей.
+		:rtype: list[int]
+		"""
+
+		Overlay = overlay[name]
+
+		if note_id not in Overlay:
+			Overlay[note_id] = list(self.__GetAdjacency(overlay, csr, name, note_id))
+			self.__OverlaySize += 1
+
+		return Overlay[note_id]
+
+	def __Traverse(self, note_id: int, name: str | None, reverse: bool) -> tuple[int, ...]:
+		"""
+		Итеративным обходом в глубину находит все транзитивно связанные записи. Результат запоминается до следующего изменения графа.
+
+		:param note_id: ID начальной записи.
+		:type note_id: int
+		:param name: Имя связи или `None` для всех связей.
+		:type name: str | None
+		:param reverse: Указывает, нужно ли идти к привязавшим записям вместо привязанных.
+		:type reverse: bool
+		:return: Отсортированная последовательность ID найденных записей без начальной.
+		:rtype: tuple[int, ...]
+		"""
+
+		Key = ("ancestors" if reverse else "descendants", note_id, name)
+
+		if Key not in self.__Queries:
+			Visited = {note_id}
+			Stack = [note_id]
+
+			while Stack:
+				for NeighborID in self.__IterateNeighbors(Stack.pop(), name, reverse):
+					if NeighborID in Visited: continue
+					Visited.add(NeighborID)
+					Stack.append(NeighborID)
+
+			Visited.discard(note_id)
+			self.__Queries[Key] = tuple(sorted(Visited))
+
+		return self.__Queries[Key]
+
+	def __Rebuild(self, mapping: dict[int, int] | None = None):
+		"""
+		Перестраивает основные массивы графа с учётом слоя изменений.
+
+		:param mapping: Словарь замены ID записей, где ключ – старый ID, а значение – новый.
+		:type mapping: dict[int, int] | None
+		"""
+
+		mapping = mapping or dict()
+		Edges = {Name: (array("i"), array("i")) for Name in self.__Names}
+
+		for NoteID, NoteData in self.to_dict().items():
+			NoteID = mapping.get(NoteID, NoteID)
+
+			for Name, SlavesID in NoteData.items():
+				Edges[Name][0].extend([NoteID] * len(SlavesID))
+				Edges[Name][1].extend(mapping.get(SlaveID, SlaveID) for SlaveID in SlavesID)
+
+		self.__Compile(Edges)
+
+	def __Register(self, name: str):
+		"""
+		Регистрирует имя связи.
+
+		:param name: Имя связи.
+		:type name: str
+		"""
+
+		if name in self.__ForwardOverlay: return
+		self.__Names.append(name)
+		self.__ForwardOverlay[name] = dict()
+		self.__ReverseOverlay[name] = dict()
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, names: Iterable[str], data: dict | None = None):
+		"""
+		Разреженный граф связей записей.
+
+		Для каждого имени связи прямые и обратные списки смежности хранятся в сжатом построчном виде: массив смещений строк и массив ID смежных записей. Запросы соседей возвращают срезы массивов без копирования. Изменения накапливаются в небольшом слое списков, который при разрастании сливается с основными массивами.
+
+		:param names: Имена связей.
+		:type names: Iterable[str]
+		:param data: Данные файла _.bonds.json_: словарь, где ключ – ID привязывающей записи, а значение – словарь списков ID привязанных записей по именам связей.
+		:type data: dict | None
+		"""
+
+		self.__Names: list[str] = list(dict.fromkeys(names))
+		Edges = {Name: (array("i"), array("i")) for Name in self.__Names}
+
+		for MasterID, NoteData in (data or dict()).items():
+			MasterID = int(MasterID)
+
+			for Name, SlavesID in NoteData.items():
+				if Name not in Edges:
+					self.__Names.append(Name)
+					Edges[Name] = (array("i"), array("i"))
+
+				Edges[Name][0].extend([MasterID] * len(SlavesID))
+				Edges[Name][1].extend(SlavesID)
+
+		self.__Compile(Edges)
+
+	def add(self, name: str, master_id: int, slave_id: int):
+		"""
+		Добавляет связь.
+
+		:param name: Имя связи.
+		:type name: str
+		:param master_id: ID привязывающей записи.
+		:type master_id: int
+		:param slave_id: ID привязываемой записи.
+		:type slave_id: int
+		"""
+
+		self.__Register(name)
+		self.__Materialize(self.__ForwardOverlay, self.__Forward, name, master_id).append(slave_id)
+		self.__Materialize(self.__ReverseOverlay, self.__Reverse, name, slave_id).append(master_id)
+		self.__SortedSlaves.pop(master_id, None)
+		self.__SortedMasters.pop(slave_id, None)
+		self.__Queries.clear()
+		self.__CompactIfNeeded()
+
+	def get_ancestors(self, note_id: int, name: str | None = None) -> tuple[int, ...]:
+		"""
+		Возвращает ID всех записей, транзитивно привязавших данную.
+
+		:param note_id: ID записи.
+		:type note_id: int
+		:param name: Имя связи. По умолчанию учитываются все связи.
+		:type name: str | None
+		:return: Последовательность ID в порядке возрастания.
+		:rtype: tuple[int, ...]
+		"""
+
+		return self.__Traverse(note_id, name, True)
+
+	def get_descendants(self, note_id: int, name: str | None = None) -> tuple[int, ...]:
+		"""
+		Возвращает ID всех записей, транзитивно привязанных к данной.
+
+		:param note_id: ID записи.
+		:type note_id: int
+		:param name: Имя связи. По умолчанию учитываются все связи.
+		:type name: str | None
+		:return: Последовательность ID в порядке возрастания.
+		:rtype: tuple[int, ...]
+		"""
+
+		return self.__Traverse(note_id, name, False)
+
+	def get_masters(self, name: str, slave_id: int) -> Sequence[int]:
+		"""
+		Возвращает ID привязавших записей по связи. Результат не должен изменяться.
+
+		:param name: Имя связи.
+		:type name: str
+		:param slave_id: ID привязанной записи.
+		:type slave_id: int
+		:return: Последовательность ID привязавших записей.
+		:rtype: Sequence[int]
+		"""
+
+		return self.__GetAdjacency(self.__ReverseOverlay, self.__Reverse, name, slave_id)
+
+	def get_masters_id(self, slave_id: int) -> tuple[int, ...]:
+		"""
+		Возвращает отсортированные ID записей, привязавших данную по любой связи.
+
+		:param slave_id: ID привязанной записи.
+		:type slave_id: int
+		:return: Последовательность уникальных ID в порядке возрастания.
+		:rtype: tuple[int, ...]
+		"""
+
+		if slave_id not in self.__SortedMasters:
+			MastersID: set[int] = set()
+			for Name in self.__Names: MastersID.update(self.get_masters(Name, slave_id))
+			self.__SortedMasters[slave_id] = tuple(sorted(MastersID))
+
+		return self.__SortedMasters[slave_id]
+
+	def get_slaves(self, name: str, master_id: int) -> Sequence[int]:
+		"""
+		Возвращает ID привязанных записей по связи в порядке привязки. Результат не должен изменяться.
+
+		:param name: Имя связи.
+		:type name: str
+		:param master_id: ID привязывающей записи.
+		:type master_id: int
+		:return: Последовательность ID привязанных записей.
+		:rtype: Sequence[int]
+		"""
+
+		return self.__GetAdjacency(self.__ForwardOverlay, self.__Forward, name, master_id)
+
+	def get_slaves_id(self, master_id: int) -> tuple[int, ...]:
+		"""
+		Возвращает отсортированные ID записей, привязанных к данной по любой связи.
+
+		:param master_id: ID привязывающей записи.
+		:type master_id: int
+		:return: Последовательность уникальных ID в порядке возрастания.
+		:rtype: tuple[int, ...]
+		"""
+
+		if master_id not in self.__SortedSlaves:
+			SlavesID: set[int] = set()
+			for Name in self.__Names: SlavesID.update(self.get_slaves(Name, master_id))
+			self.__SortedSlaves[master_id] = tuple(sorted(SlavesID))
+
+		return self.__SortedSlaves[master_id]
+
+	def get_topological_order(self, name: str | None = None) -> tuple[int, ...]:
+		"""
+		Возвращает ID участвующих в связях записей в топологическом порядке: каждая привязывающая запись предшествует привязанным к ней. Среди равноправных записей первой идёт запись с меньшим ID. Результат запоминается до следующего изменения графа.
+
+		:param name: Имя связи. По умолчанию учитываются все связи.
+		:type name: str | None
+		:return: Последовательность ID записей.
+		:rtype: tuple[int, ...]
+		:raises BondCycleDetected: Связи образуют цикл.
+		"""
+
+		Key = ("topological", name)
+
+		if Key not in self.__Queries:
+			NotesID = self.__GetNotesID()
+			InDegrees = dict.fromkeys(NotesID, 0)
+
+			for NoteID in NotesID:
+				for SlaveID in self.__IterateNeighbors(NoteID, name, False): InDegrees[SlaveID] += 1
+
+			Queue = [NoteID for NoteID, InDegree in InDegrees.items() if not InDegree]
+			heapq.heapify(Queue)
+			Order = list()
+
+			while Queue:
+				NoteID = heapq.heappop(Queue)
+				Order.append(NoteID)
+
+				for SlaveID in self.__IterateNeighbors(NoteID, name, False):
+					InDegrees[SlaveID] -= 1
+					if not InDegrees[SlaveID]: heapq.heappush(Queue, SlaveID)
+
+			if len(Order) < len(NotesID): raise Exceptions.Note.BondCycleDetected(name, tuple(NoteID for NoteID, InDegree in InDegrees.items() if InDegree))
+			self.__Queries[Key] = tuple(Order)
+
+		return self.__Queries[Key]
+
+	def has_masters(self, slave_id: int) -> bool:
+		"""
+		Проверяет, привязана ли запись хотя бы к одной записи.
+
+		:param slave_id: ID записи.
+		:type slave_id: int
+		:return: Возвращает `True`, если привязки найдены.
+		:rtype: bool
+		"""
+
+		return any(len(self.get_masters(Name, slave_id)) for Name in self.__Names)
+
+	def has_slaves(self, master_id: int) -> bool:
+		"""
+		Проверяет, привязаны ли к записи другие записи.
+
+		:param master_id: ID записи.
+		:type master_id: int
+		:return: Возвращает `True`, если привязки найдены.
+		:rtype: bool
+		"""
+
+		return any(len(self.get_slaves(Name, master_id)) for Name in self.__Names)
+
+	def is_reachable(self, source_id: int, target_id: int, name: str | None = None) -> bool:
+		"""
+		Проверяет, привязана ли целевая запись к исходной транзитивно.
+
+		:param source_id: ID исходной записи.
+		:type source_id: int
+		:param target_id: ID целевой записи.
+		:type target_id: int
+		:param name: Имя связи. По умолчанию учитываются все связи.
+		:type name: str | None
+		:return: Возвращает `True`, если целевая запись достижима из исходной.
+		:rtype: bool
+		"""
+
+		return target_id in self.__Traverse(source_id, name, False)
+
+	def renumber(self, mapping: dict[int, int]):
+		"""
+		Заменяет ID записей во всех связях за один проход с перестроением основных массивов.
+
+		:param mapping: Словарь, где ключ – старый ID записи, а значение – новый.
+		:type mapping: dict[int, int]
+		"""
+
+		self.__Rebuild(mapping)
+
+	def remove(self, name: str, master_id: int, slave_id: int) -> bool:
+		"""
+		Удаляет связь.
+
+		:param name: Имя связи.
+		:type name: str
+		:param master_id: ID привязывающей записи.
+		:type master_id: int
+		:param slave_id: ID отвязываемой записи.
+		:type slave_id: int
+		:return: Возвращает `True`, если связь существовала.
+		:rtype: bool
+		"""
+
+		if name not in self.__ForwardOverlay or slave_id not in self.get_slaves(name, master_id): return False
+
+		self.__Materialize(self.__ForwardOverlay, self.__Forward, name, master_id).remove(slave_id)
+		self.__Materialize(self.__ReverseOverlay, self.__Reverse, name, slave_id).remove(master_id)
+		self.__SortedSlaves.pop(master_id, None)
+		self.__SortedMasters.pop(slave_id, None)
+		self.__Queries.clear()
+		self.__CompactIfNeeded()
+
+		return True
+
+	def to_dict(self) -> dict[int, dict[str, list[int]]]:
+		"""
+		Возвращает словарное представление графа для файла _.bonds.json_. Записи без привязанных записей не включаются.
+
+		:return: Словарь, где ключ – ID привязывающей записи, а значение – словарь списков ID привязанных записей по именам связей.
+		:rtype: dict[int, dict[str, list[int]]]
+		"""
+
+		Data = dict()
+
+		for NoteID in self.__GetNotesID():
+			NoteData = {Name: list(self.get_slaves(Name, NoteID)) for Name in self.__Names}
+			if any(NoteData.values()): Data[NoteID] = NoteData
+
+		return Data
@@ -0,0 +1,421 @@
+import bisect
+import math
+from collections import Counter
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Iterable
+
+from dublib.Methods.Data import ToSequence
+
+from .Loader import NotesLoader
+
+if TYPE_CHECKING:
+	from Source.Core.Base.Note import BaseNote
+	from Source.Core.Base.Table import BaseTable
+
+class MetainfoIndex:
+	"""Вторичные индексы полей метаданных и свойств записей таблицы."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def fields(self) -> tuple[str, ...]:
+		"""Последовательность имён полей с построенными индексами."""
+
+		return tuple(self.__Types.keys())
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __Add(self, field: str, note_id: int, entries: dict):
+		"""
+		Добавляет ключи записи в индекс поля.
+
+		:param field: Имя поля.
+		:type field: str
+		:param note_id: ID записи.
+		:type note_id: int
+		:param entries: Словарь, где ключ – ключ значения поля, а значение – его исходное представление.
+		:type entries: dict
+		"""
+
+		if not entries: return
+		self.__Keys[field][note_id] = tuple(entries.keys())
+
+		if self.__Types[field] == "sorted":
+			for Key in entries.keys(): bisect.insort(self.__Sorted[field], (Key, note_id))
+
+		else:
+			for Key, Label in entries.items():
+				self.__Postings[field].setdefault(Key, set()).add(note_id)
+				self.__Labels[field].setdefault(Key, Label)
+
+	def __Build(self, field: str, index: str):
+		"""
+		Строит индекс поля по записям таблицы. Если данные таблицы не загружены, записи считываются во временные объекты и в таблицу не помещаются.
+
+		:param field: Имя поля.
+		:type field: str
+		:param index: Тип индекса.
+		:type index: str
+		"""
+
+		self.__Types[field] = index
+		self.__Keys[field] = dict()
+
+		if index == "sorted": self.__Sorted[field] = list()
+
+		else:
+			self.__Postings[field] = dict()
+			self.__Labels[field] = dict()
+
+		for CurrentNote in self.__GetNotes(): self.__Add(field, CurrentNote.id, self.__GetEntries(index, self.__GetValue(CurrentNote, field)))
+
+	def __Count(self, field: str, notes_id: Iterable[int] | None) -> dict[Any, int]:
+		"""
+		Подсчитывает записи для каждого значения поля по построенному индексу.
+
+		:param field: Имя поля.
+		:type field: str
+		:param notes_id: ID записей, среди которых ведётся подсчёт, или `None` для всех записей.
+		:type notes_id: Iterable[int] | None
+		:return: Словарь, где ключ – значение поля, а значение – количество записей.
+		:rtype: dict[Any, int]
+		"""
+
+		Keys = self.__Keys[field]
+
+		if self.__Types[field] == "sorted":
+			if notes_id is None: return Counter(Key for Key, _ in self.__Sorted[field])
+			return Counter(Key for NoteID in notes_id for Key in Keys.get(NoteID, tuple()))
+
+		Labels = self.__Labels[field]
+		if notes_id is None: return {Labels[Key]: len(Postings) for Key, Postings in self.__Postings[field].items()}
+
+		Counts = Counter(Key for NoteID in notes_id for Key in Keys.get(NoteID, tuple()))
+
+		return {Labels[Key]: Count for Key, Count in Counts.items()}
+
+	def __GetEntries(self, index: str | None, value: Any) -> dict:
+		"""
+		Возвращает ключи значения поля вместе с их исходным представлением. Списки раскладываются на элементы, строки приводятся к единому регистру, элементы перечислений представляются своими значениями. В сортированный индекс попадают только числа.
+
+		:param index: Тип индекса или `None` для ключей неиндексированного поля.
+		:type index: str | None
+		:param value: Значение поля.
+		:type value: Any
+		:return: Словарь, где ключ – ключ значения поля, а значение – его исходное представление.
+		:rtype: dict
+		"""
+
+		if value is None: return dict()
+		Entries: dict[Any, Any] = dict()
+
+		for Element in ToSequence(value):
+			Key = Element.value if isinstance(Element, Enum) else Element
+			if self.__IsNumber(Key): Entries.setdefault(Key, Element)
+			elif type(Key) is str and index != "sorted": Entries.setdefault(Key.casefold(), Element)
+
+		return Entries
+
+	def __GetIndexType(self, field: str) -> str | None:
+		"""
+		Возвращает тип индекса поля. Свойства записей, перечисленные в `FACETS` таблицы, индексируются хеш-индексом.
+
+		:param field: Имя поля.
+		:type field: str
+		:return: Тип индекса или `None`, если индекс не объявлен.
+		:rtype: str | None
+		"""
+
+		if field in self.__Table.FACETS: return "hash"
+
+		return self.__Table.manifest.metainfo_rules.indexes.get(field)
+
+	def __GetNotes(self) -> "Iterable[BaseNote]":
+		"""
+		Возвращает записи таблицы.
+
+		:return: Последовательность записей.
+		:rtype: Iterable[BaseNote]
+		"""
+
+		if self.__Table.is_loaded: return self.__Table.notes
+
+		return NotesLoader(self.__Table).load(self.__Table.notes_id).values()
+
+	def __GetValue(self, note: "BaseNote", field: str) -> Any:
+		"""
+		Возвращает значение свойства записи, перечисленного в `FACETS` таблицы, или значение поля метаданных записи без проверки его описания.
+
+		:param note: Запись.
+		:type note: BaseNote
+		:param field: Имя поля.
+		:type field: str
+		:return: Значение поля.
+		:rtype: Any
+		"""
+
+		if field in self.__Table.FACETS: return getattr(note, field)
+
+		return note.metainfo.to_dict(copy = False).get(field)
+
+	def __IsNumber(self, value: Any) -> bool:
+		"""
+		Проверяет, является ли значение числом.
+
+		:param value: Значение.
+		:type value: Any
+		:return: Состояние проверки.
+		:rtype: bool
+		"""
+
+		return type(value) in (int, float)
+
+	def __Match(self, key: Any, values: tuple | None, minimum: Any, maximum: Any) -> bool:
+		"""
+		Проверяет ключ на соответствие условиям выборки. Границы диапазона сравниваются только с ключами того же рода: числа с числами, строки со строками.
+
+		:param key: Ключ.
+		:type key: Any
+		:param values: Допустимые ключи.
+		:type values: tuple | None
+		:param minimum: Нижняя граница диапазона включительно.
+		:type minimum: Any
+		:param maximum: Верхняя граница диапазона включительно.
+		:type maximum: Any
+		:return: Состояние соответствия.
+		:rtype: bool
+		"""
+
+		if values is not None and key not in values: return False
+
+		for Bound in (minimum, maximum):
+			if Bound is not None and self.__IsNumber(Bound) != self.__IsNumber(key): return False
+
+		if minimum is not None and key < minimum: return False
+		if maximum is not None and key > maximum: return False
+
+		return True
+
+	def __Remove(self, field: str, note_id: int) -> dict:
+		"""
+		Удаляет ключи записи из индекса поля.
+
+		:param field: Имя поля.
+		:type field: str
+		:param note_id: ID записи.
+		:type note_id: int
+		:return: Словарь удалённых ключей и их исходного представления.
+		:rtype: dict
+		"""
+
+		Keys = self.__Keys[field].pop(note_id, tuple())
+		Labels = self.__Labels.get(field)
+		Entries = {Key: Labels[Key] if Labels else Key for Key in Keys}
+
+		if self.__Types[field] == "sorted":
+			Sorted = self.__Sorted[field]
+
+			for Key in Keys:
+				Index = bisect.bisect_left(Sorted, (Key, note_id))
+				if Index < len(Sorted) and Sorted[Index] == (Key, note_id): del Sorted[Index]
+
+		else:
+			for Key in Keys:
+				Postings = self.__Postings[field][Key]
+				Postings.discard(note_id)
+
+				if not Postings:
+					del self.__Postings[field][Key]
+					del self.__Labels[field][Key]
+
+		return Entries
+
+	def __Reset(self):
+		"""Очищает индексы."""
+
+		self.__Types: dict[str, str] = dict()
+		self.__Keys: dict[str, dict[int, tuple]] = dict()
+		self.__Postings: dict[str, dict[Any, set[int]]] = dict()
+		self.__Labels: dict[str, dict[Any, Any]] = dict()
+		self.__Sorted: dict[str, list[tuple[int | float, int]]] = dict()
+
+	def __SelectSorted(self, field: str, values: tuple | None, minimum: Any, maximum: Any) -> set[int]:
+		"""
+		Выбирает записи по сортированному индексу двоичным поиском.
+
+		:param field: Имя поля.
+		:type field: str
+		:param values: Допустимые значения.
+		:type values: tuple | None
+		:param minimum: Нижняя граница диапазона включительно.
+		:type minimum: Any
+		:param maximum: Верхняя граница диапазона включительно.
+		:type maximum: Any
+		:return: Множество ID записей.
+		:rtype: set[int]
+		"""
+
+		Sorted = self.__Sorted[field]
+		if any(Bound is not None and not self.__IsNumber(Bound) for Bound in (minimum, maximum)): return set()
+		Ranges = [(Value, Value) for Value in values if self.__IsNumber(Value)] if values is not None else [(minimum, maximum)]
+		Result: set[int] = set()
+
+		for Lower, Upper in Ranges:
+			if minimum is not None: Lower = max(Lower, minimum) if Lower is not None else minimum
+			if maximum is not None: Upper = min(Upper, maximum) if Upper is not None else maximum
+			Start = bisect.bisect_left(Sorted, (Lower,)) if Lower is not None else 0
+			End = bisect.bisect_right(Sorted, (Upper, math.inf)) if Upper is not None else len(Sorted)
+			Result.update(NoteID for _, NoteID in Sorted[Start:End])
+
+		return Result
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, table: "BaseTable"):
+		"""
+		Вторичные индексы полей метаданных и свойств записей таблицы.
+
+		Индексы полей метаданных объявляются в правилах метаданных манифеста, а свойства записей, например статусы, индексируются хеш-индексом при перечислении в `FACETS` таблицы. Хеш-индекс сопоставляет каждому значению поля, а для списков – каждому элементу, множество ID записей и подходит для категориальных полей. Сортированный индекс хранит упорядоченные пары числового значения и ID записи и отвечает на запросы диапазонов двоичным поиском. Индекс поля строится при первом обращении к нему и далее обновляется при изменении метаданных и сохранении записей.
+
+		:param table: Таблица.
+		:type table: BaseTable
+		"""
+
+		self.__Table = table
+
+		self.__Reset()
+
+	def count(self, field: str, notes_id: Iterable[int] | None = None) -> dict[Any, int]:
+		"""
+		Подсчитывает записи для каждого значения поля. Для записей со списком в поле учитывается каждый элемент. Поля без индекса подсчитываются перебором записей.
+
+		:param field: Имя поля.
+		:type field: str
+		:param notes_id: ID записей, среди которых ведётся подсчёт, например результат поиска или выборки. По умолчанию учитываются все записи.
+		:type notes_id: Iterable[int] | None
+		:return: Словарь, где ключ – значение поля, а значение – количество записей. Ключи упорядочены по убыванию количества.
+		:rtype: dict[Any, int]
+		"""
+
+		Index = self.__GetIndexType(field)
+		if Index and self.__Types.get(field) != Index: self.__Build(field, Index)
+
+		if Index: Counts = self.__Count(field, notes_id)
+
+		else:
+			Labels: dict[Any, tuple[Any, int]] = dict()
+			if notes_id is not None: notes_id = set(notes_id)
+
+			for CurrentNote in self.__GetNotes():
+				if notes_id is not None and CurrentNote.id not in notes_id: continue
+
+				for Key, Label in self.__GetEntries(None, self.__GetValue(CurrentNote, field)).items():
+					Label, Count = Labels.get(Key, (Label, 0))
+					Labels[Key] = (Label, Count + 1)
+
+			Counts = dict(Labels.values())
+
+		return dict(sorted(Counts.items(), key = lambda Item: -Item[1]))
+
+	def invalidate(self):
+		"""Сбрасывает индексы. Они будут построены заново при следующей выборке."""
+
+		self.__Reset()
+
+	def remove(self, note_id: int):
+		"""
+		Удаляет запись из индексов.
+
+		:param note_id: ID записи.
+		:type note_id: int
+		"""
+
+		for Field in self.__Types.keys(): self.__Remove(Field, note_id)
+
+	def renumber(self, mapping: dict[int, int]):
+		"""
+		Переносит ключи записей под новые ID.
+
+		:param mapping: Словарь, где ключ – текущий ID записи, а значение – новый.
+		:type mapping: dict[int, int]
+		"""
+
+		for Field in self.__Types.keys():
+			Entries = {NewID: self.__Remove(Field, OldID) for OldID, NewID in mapping.items()}
+			for NoteID, NoteEntries in Entries.items(): self.__Add(Field, NoteID, NoteEntries)
+
+	def select(self, field: str, values: Iterable[Any] | None = None, minimum: Any = None, maximum: Any = None) -> tuple[int, ...]:
+		"""
+		Выбирает записи, значение поля которых равно одному из переданных и лежит в диапазоне. Для записей со списком в поле достаточно совпадения одного элемента. Строки сравниваются без учёта регистра, элементы перечислений – по своим значениям. Поля без объявленного индекса проверяются перебором записей.
+
+		:param field: Имя поля.
+		:type field: str
+		:param values: Допустимые значения. По умолчанию не ограничены.
+		:type values: Iterable[Any] | None
+		:param minimum: Нижняя граница диапазона включительно.
+		:type minimum: Any
+		:param maximum: Верхняя граница диапазона включительно.
+		:type maximum: Any
+		:return: Отсортированная последовательность ID найденных записей.
+		:rtype: tuple[int, ...]
+		"""
+
+		if values is not None: values = tuple(self.__GetEntries(None, tuple(values)).keys())
+		if type(minimum) is str: minimum = minimum.casefold()
+		if type(maximum) is str: maximum = maximum.casefold()
+
+		Index = self.__GetIndexType(field)
+		if Index and self.__Types.get(field) != Index: self.__Build(field, Index)
+
+		if not Index:
+			Result: set[int] = set()
+
+			for CurrentNote in self.__GetNotes():
+				if any(self.__Match(Key, values, minimum, maximum) for Key in self.__GetEntries(None, self.__GetValue(CurrentNote, field))): Result.add(CurrentNote.id)
+
+		elif Index == "sorted": Result = self.__SelectSorted(field, values, minimum, maximum)
+
+		elif minimum is None and maximum is None:
+			Postings = self.__Postings[field]
+			Result = set().union(*(Postings.get(Value, tuple()) for Value in values)) if values is not None else set(self.__Keys[field].keys())
+
+		else:
+			Result = set()
+
+			for Key, NotesID in self.__Postings[field].items():
+				if self.__Match(Key, values, minimum, maximum): Result |= NotesID
+
+		return tuple(sorted(Result))
+
+	def update(self, note_id: int, field: str, value: Any):
+		"""
+		Обновляет ключи записи в индексе поля. Если индекс поля не построен, вызов игнорируется.
+
+		:param note_id: ID записи.
+		:type note_id: int
+		:param field: Имя поля.
+		:type field: str
+		:param value: Новое значение поля или `None` при его удалении.
+		:type value: Any
+		"""
+
+		if field not in self.__Types: return
+		self.__Remove(field, note_id)
+		self.__Add(field, note_id, self.__GetEntries(self.__Types[field], value))
+
+	def update_note(self, note: "BaseNote"):
+		"""
+		Обновляет ключи записи в построенных индексах свойств записей. Вызывается при сохранении записи.
+
+		:param note: Запись.
+		:type note: BaseNote
+		"""
+
+		for Field in self.__Types.keys():
+			if Field in self.__Table.FACETS: self.update(note.id, Field, getattr(note, Field))
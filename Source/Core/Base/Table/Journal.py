@@ -0,0 +1,201 @@
+import json
+import os
+from typing import TYPE_CHECKING
+
+from dublib.Methods.Filesystem import WriteJSON
+
+if TYPE_CHECKING:
+	from Source.Core.Base.Table import BaseTable
+
+class TableJournal:
+	"""Журнал намерений для многофайловых операций таблицы."""
+
+	#==========================================================================================#
+	# >>>>> СТАТИЧЕСКИЕ АТРИБУТЫ <<<<< #
+	#==========================================================================================#
+
+	FILENAME = ".journal"
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __GetInode(self, path: str) -> int | None:
+		"""
+		Возвращает номер индексного дескриптора файла или каталога таблицы.
+
+		:param path: Путь относительно директории таблицы.
+		:type path: str
+		:return: Номер индексного дескриптора или `None` при отсутствии файла.
+		:rtype: int | None
+		"""
+
+		try: return os.lstat(self.__Table.full_path / path).st_ino
+		except OSError: return None
+
+	def __Move(self, source: str, destination: str, inode: int) -> bool:
+		"""
+		Перемещает файл или каталог таблицы, если по пути источника находится именно он. Благодаря этому повторное выполнение плана пропускает уже сделанные перемещения без отметок о ходе операции.
+
+		:param source: Путь к источнику относительно директории таблицы.
+		:type source: str
+		:param destination: Путь к месту назначения относительно директории таблицы.
+		:type destination: str
+		:param inode: Номер индексного дескриптора перемещаемого файла.
+		:type inode: int
+		:return: Возвращает `True`, если перемещение выполнено.
+		:rtype: bool
+		"""
+
+		if self.__GetInode(source) != inode: return False
+		os.replace(self.__Table.full_path / source, self.__Table.full_path / destination)
+
+		return True
+
+	def __Rollback(self, moves: list[tuple[str, str, int]]):
+		"""
+		Возвращает выполненные перемещения в обратном порядке.
+
+		:param moves: Упорядоченный план перемещений.
+		:type moves: list[tuple[str, str, int]]
+		"""
+
+		for Source, Destination, Inode in reversed(moves): self.__Move(Destination, Source, Inode)
+
+	def __Sync(self, path: str | None = None):
+		"""
+		Сбрасывает на диск файл и директорию таблицы.
+
+		:param path: Путь к файлу относительно директории таблицы. Если не передан, сбрасывается только директория.
+		:type path: str | None
+		"""
+
+		Paths = [self.__Table.full_path / path] if path else list()
+		Paths.append(self.__Table.full_path)
+
+		for CurrentPath in Paths:
+			try:
+				Descriptor = os.open(CurrentPath, os.O_RDONLY)
+
+				try: os.fsync(Descriptor)
+				finally: os.close(Descriptor)
+
+			except OSError: pass
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, table: "BaseTable"):
+		"""
+		Журнал намерений для многофайловых операций таблицы.
+
+		До начала операции в файл _.journal_ записываются упорядоченный план перемещений файлов и каталогов с номерами их индексных дескрипторов, а также итоговое содержимое файла связей, после чего журнал однократно сбрасывается на диск. Поэтому сами перемещения не требуют промежуточных отметок, а файл связей – атомарной записи: при открытии таблицы после сбоя план выполняется повторно с пропуском уже сделанных шагов, файл связей перезаписывается из журнала, а если план невозможно завершить, выполненные перемещения откатываются.
+
+		:param table: Таблица.
+		:type table: BaseTable
+		"""
+
+		self.__Table = table
+
+		self.__Moves: list[tuple[str, str, int]] = list()
+		self.__HasBonds = False
+
+	def begin(self, moves: list[tuple[str, str]], bonds: dict | None = None):
+		"""
+		Записывает намерение операции в журнал.
+
+		:param moves: Упорядоченный план перемещений: пары путей источника и места назначения относительно директории таблицы. Перемещения отсутствующих источников опускаются. Источник, освобождающийся в ходе плана, должен использоваться как место назначения только после его перемещения.
+		:type moves: list[tuple[str, str]]
+		:param bonds: Итоговое словарное представление связей или `None`, если файл связей не изменяется.
+		:type bonds: dict | None
+		:raises OSError: Ошибка записи журнала. Частично записанный журнал удаляется.
+		"""
+
+		Inodes: dict[str, int | None] = dict()
+		self.__Moves = list()
+
+		for Source, Destination in moves:
+			Inode = Inodes.pop(Source) if Source in Inodes else self.__GetInode(Source)
+			if Inode is None: continue
+			self.__Moves.append((Source, Destination, Inode))
+			Inodes[Destination] = Inode
+
+		self.__HasBonds = bonds is not None
+		Data = {"moves": self.__Moves, "bonds": list(bonds.items()) if bonds is not None else None}
+
+		JournalPath = self.__Table.full_path / self.FILENAME
+
+		try:
+			with open(JournalPath, "w", encoding = "utf-8") as FileWriter:
+				json.dump(Data, FileWriter, ensure_ascii = False)
+				FileWriter.flush()
+				os.fsync(FileWriter.fileno())
+
+			self.__Sync()
+
+		except OSError:
+			self.__Moves = list()
+			self.__HasBonds = False
+			JournalPath.unlink(missing_ok = True)
+			raise
+
+	def apply(self):
+		"""
+		Выполняет запланированные перемещения. Если перемещение невозможно, выполненные перемещения откатываются, журнал удаляется, а исключение пробрасывается.
+
+		:raises OSError: Ошибка файловой системы при перемещении.
+		"""
+
+		Moves, self.__Moves = self.__Moves, list()
+		Index = 0
+
+		try:
+			for Index, (Source, Destination, Inode) in enumerate(Moves): self.__Move(Source, Destination, Inode)
+
+		except OSError:
+			self.__Rollback(Moves[:Index])
+			os.remove(self.__Table.full_path / self.FILENAME)
+			raise
+
+	def commit(self):
+		"""Однократно сбрасывает на диск результаты операции и удаляет журнал. Вызывается после записи файла связей, если он был указан в намерении."""
+
+		self.__Sync(".bonds.json" if self.__HasBonds else None)
+		os.remove(self.__Table.full_path / self.FILENAME)
+		self.__HasBonds = False
+
+	def recover(self) -> bool:
+		"""
+		Завершает или откатывает прерванную операцию, если журнал существует.
+
+		:return: Возвращает `True`, если операция была завершена, и `False`, если журнал отсутствовал, был повреждён до начала операции или операция была откачена.
+		:rtype: bool
+		"""
+
+		JournalPath = self.__Table.full_path / self.FILENAME
+		if not JournalPath.exists(): return False
+
+		try:
+			with open(JournalPath, "r", encoding = "utf-8") as FileReader: Data = json.load(FileReader)
+			Moves = [tuple(Move) for Move in Data["moves"]]
+			Bonds = {int(NoteID): NoteData for NoteID, NoteData in Data["bonds"]} if Data["bonds"] is not None else None
+
+		except (OSError, ValueError, TypeError, KeyError):
+			os.remove(JournalPath)
+			return False
+
+		IsCompleted = True
+
+		try:
+			for Source, Destination, Inode in Moves: self.__Move(Source, Destination, Inode)
+
+		except OSError:
+			self.__Rollback(Moves)
+			IsCompleted = False
+
+		if IsCompleted and Bonds is not None: WriteJSON(self.__Table.full_path / ".bonds.json", Bonds)
+		self.__Sync(".bonds.json" if IsCompleted and Bonds is not None else None)
+		os.remove(JournalPath)
+
+		return IsCompleted
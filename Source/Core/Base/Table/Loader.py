@@ -0,0 +1,147 @@
+import gc
+import os
+import tracemalloc
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from dublib.Methods.Filesystem import ReadJSON
+
+from Source.Core.Imports import LazyModule
+
+if TYPE_CHECKING:
+	from Source.Core.Base.Note import BaseNote
+	from Source.Core.Base.Table import BaseTable
+
+process = LazyModule("concurrent.futures.process")
+
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ <<<<< #
+#==========================================================================================#
+
+def ReadNoteFile(path: str) -> dict:
+	"""
+	Читает и декодирует файл записи. Определена на уровне модуля для передачи в пул процессов.
+
+	:param path: Путь к файлу записи.
+	:type path: str
+	:return: Данные записи.
+	:rtype: dict
+	"""
+
+	return ReadJSON(path)
+
+def MeasureNotesMemory(table: "BaseTable", attachments: bool = False) -> tuple[int, int]:
+	"""
+	Измеряет память, занимаемую объектами записей таблицы. Записи повторно загружаются из снимка таблицы под отслеживанием _tracemalloc_, учитываются только оставшиеся после загрузки выделения.
+
+	:param table: Таблица.
+	:type table: BaseTable
+	:param attachments: Указывает, нужно ли создать операторы вложений и объекты слотов, которые по умолчанию создаются при первом обращении.
+	:type attachments: bool
+	:return: Количество записей и занимаемый ими объём памяти в байтах.
+	:rtype: tuple[int, int]
+	"""
+
+	NotesID = table.notes_id
+	gc.collect()
+	tracemalloc.start()
+
+	try:
+		Notes = NotesLoader(table, 1).load(NotesID)
+		if attachments:
+			for CurrentNote in Notes.values(): CurrentNote.attachments.slots
+
+		gc.collect()
+		Size = tracemalloc.get_traced_memory()[0]
+
+	finally: tracemalloc.stop()
+
+	return len(Notes), Size
+
+#==========================================================================================#
+# >>>>> ОСНОВНОЙ КЛАСС <<<<< #
+#==========================================================================================#
+
+class NotesLoader:
+	"""Параллельный загрузчик записей таблицы."""
+
+	#==========================================================================================#
+	# >>>>> СТАТИЧЕСКИЕ АТРИБУТЫ <<<<< #
+	#==========================================================================================#
+
+	PARALLEL_THRESHOLD = 64
+	PROCESS_POOL_THRESHOLD = 20_000
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __GetExecutor(self, notes_count: int) -> Executor:
+		"""
+		Создаёт пул исполнителей: пул процессов для очень больших таблиц, иначе пул потоков.
+
+		:param notes_count: Количество загружаемых записей.
+		:type notes_count: int
+		:return: Пул исполнителей.
+		:rtype: Executor
+		"""
+
+		if notes_count >= self.PROCESS_POOL_THRESHOLD: return process.ProcessPoolExecutor(self.__Workers)
+
+		return ThreadPoolExecutor(self.__Workers)
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, table: "BaseTable", workers: int | None = None):
+		"""
+		Параллельный загрузчик записей таблицы.
+
+		Неизменившиеся записи берутся из снимка таблицы, остальные файлы записей читаются и декодируются в пуле исполнителей. Объекты записей создаются в основном потоке в порядке следования ID.
+
+		:param table: Таблица.
+		:type table: BaseTable
+		:param workers: Количество исполнителей. По умолчанию определяется по количеству процессоров. При значении `1` загрузка выполняется последовательно.
+		:type workers: int | None
+		:raises ValueError: Количество исполнителей меньше единицы.
+		"""
+
+		if workers is not None and workers < 1: raise ValueError("Workers count must be positive.")
+
+		self.__Table = table
+		self.__Workers = workers or min(32, (os.cpu_count() or 1) + 4)
+
+	def load(self, notes_id: tuple[int, ...]) -> "dict[int, BaseNote]":
+		"""
+		Загружает записи.
+
+		:param notes_id: Последовательность ID загружаемых записей.
+		:type notes_id: tuple[int, ...]
+		:return: Словарь записей, где ключ – ID записи.
+		:rtype: dict[int, BaseNote]
+		"""
+
+		NoteClass = self.__Table._NoteClass
+		Driver = self.__Table._Driver
+		Snapshot = self.__Table.snapshot
+
+		Filenames = tuple(f"{ID}.json" for ID in notes_id)
+		Buffer = [Snapshot.get(Filename) for Filename in Filenames]
+		StaleIndexes = tuple(Index for Index, Data in enumerate(Buffer) if Data is None)
+		Paths = tuple(str(self.__Table.full_path / Filenames[Index]) for Index in StaleIndexes)
+
+		if self.__Workers == 1 or len(Paths) < self.PARALLEL_THRESHOLD:
+			StaleData = tuple(ReadNoteFile(CurrentPath) for CurrentPath in Paths)
+
+		else:
+			ChunkSize = max(1, len(Paths) // (self.__Workers * 4))
+			with self.__GetExecutor(len(Paths)) as CurrentExecutor: StaleData = tuple(CurrentExecutor.map(ReadNoteFile, Paths, chunksize = ChunkSize))
+
+		for Index, Data in zip(StaleIndexes, StaleData):
+			Buffer[Index] = Data
+			Snapshot.put(Filenames[Index], Data)
+
+		Snapshot.save()
+
+		return {ID: NoteClass(Driver, self.__Table, ID, Data) for ID, Data in zip(notes_id, Buffer)}
@@ -0,0 +1,221 @@
+import marshal
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from Source.Core.Session.Blobs import HashFile
+
+if TYPE_CHECKING:
+	from Source.Core.Base.Table import BaseTable
+
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ СТРУКТУРЫ ДАННЫХ <<<<< #
+#==========================================================================================#
+
+class ScrubStatuses(Enum):
+	"""Перечисление проблем вложений."""
+
+	Corrupted = "corrupted"
+	Missing = "missing"
+	Modified = "modified"
+	Orphaned = "orphaned"
+
+@dataclass(frozen = True)
+class ScrubIssue:
+	"""Описание проблемы вложения."""
+
+	status: ScrubStatuses
+	note_id: int | None
+	path: str
+
+@dataclass(frozen = True)
+class ScrubReport:
+	"""Результат проверки вложений таблицы."""
+
+	checked: int
+	hashed: int
+	issues: tuple[ScrubIssue, ...]
+
+#==========================================================================================#
+# >>>>> ОСНОВНОЙ КЛАСС <<<<< #
+#==========================================================================================#
+
+class AttachmentsScrubber:
+	"""Проверка целостности вложений таблицы."""
+
+	#==========================================================================================#
+	# >>>>> СТАТИЧЕСКИЕ АТРИБУТЫ <<<<< #
+	#==========================================================================================#
+
+	FILENAME = ".scrub"
+	VERSION = 1
+	IO_CONCURRENCY = 4
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def path(self) -> Path:
+		"""Путь к файлу манифеста хешей."""
+
+		return self.__Table.full_path / self.FILENAME
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __CheckFile(self, path: str, entry: tuple[int, int, str] | None, full: bool) -> tuple[tuple[int, int, str] | None, ScrubStatuses | None, bool]:
+		"""
+		Проверяет файл вложения, хешируя его только при изменении времени изменения или размера либо при полной проверке.
+
+		:param path: Путь к файлу относительно директории вложений.
+		:type path: str
+		:param entry: Запись манифеста: время изменения в наносекундах, размер и хеш содержимого.
+		:type entry: tuple[int, int, str] | None
+		:param full: Указывает, нужно ли хешировать файл независимо от его подписи.
+		:type full: bool
+		:return: Новая запись манифеста или `None` при ошибке чтения, обнаруженная проблема и состояние хеширования файла.
+		:rtype: tuple[tuple[int, int, str] | None, ScrubStatuses | None, bool]
+		"""
+
+		try:
+			Stat = os.stat(self.__Directory / path)
+			Signature = (Stat.st_mtime_ns, Stat.st_size)
+			if entry and entry[:2] == Signature and not full: return (entry, None, False)
+			Hash = HashFile(self.__Directory / path)
+
+		except OSError: return (None, ScrubStatuses.Missing, False)
+
+		Status = None
+
+		if entry and entry[2] != Hash:
+			Status = ScrubStatuses.Corrupted if entry[:2] == Signature else ScrubStatuses.Modified
+			if Status is ScrubStatuses.Corrupted: return (entry, Status, True)
+
+		return ((*Signature, Hash), Status, True)
+
+	def __GetReferences(self) -> dict[str, int]:
+		"""
+		Собирает пути вложений, на которые ссылаются записи таблицы.
+
+		:return: Словарь, где ключ – путь к файлу относительно директории вложений, а значение – ID записи.
+		:rtype: dict[str, int]
+		"""
+
+		References = dict()
+
+		for CurrentNote in self.__Table.notes:
+			Files = list(CurrentNote.attachments.free)
+			Files += [CurrentSlot.file for CurrentSlot in CurrentNote.attachments.slots if CurrentSlot.file]
+			for File in Files: References[f"{CurrentNote.id}/{File}"] = CurrentNote.id
+
+		return References
+
+	def __GetFiles(self) -> set[str]:
+		"""
+		Возвращает пути всех файлов в директории вложений, кроме скрытых временных файлов.
+
+		:return: Набор путей относительно директории вложений.
+		:rtype: set[str]
+		"""
+
+		Files: set[str] = set()
+
+		for Directory, _, Filenames in os.walk(self.__Directory):
+			Relative = Path(Directory).relative_to(self.__Directory)
+			Files.update((Relative / Filename).as_posix() for Filename in Filenames if not Filename.startswith("."))
+
+		return Files
+
+	def __LoadManifest(self) -> dict[str, tuple[int, int, str]]:
+		"""
+		Считывает манифест хешей. Повреждённый или устаревший манифест игнорируется.
+
+		:return: Словарь, где ключ – путь к файлу относительно директории вложений, а значение – время изменения в наносекундах, размер и хеш содержимого.
+		:rtype: dict[str, tuple[int, int, str]]
+		"""
+
+		try:
+			with open(self.path, "rb") as FileReader: Data = marshal.loads(FileReader.read())
+			if type(Data) is dict and Data.get("version") == self.VERSION: return Data["files"]
+
+		except (OSError, EOFError, ValueError, TypeError, KeyError): pass
+
+		return dict()
+
+	def __SaveManifest(self, files: dict[str, tuple[int, int, str]]):
+		"""
+		Сохраняет манифест хешей. Ошибки записи игнорируются, так как манифест является лишь кэшем.
+
+		:param files: Записи манифеста.
+		:type files: dict[str, tuple[int, int, str]]
+		"""
+
+		TemporaryPath = self.path.with_name(self.FILENAME + ".tmp")
+
+		try:
+			with open(TemporaryPath, "wb") as FileWriter: marshal.dump({"version": self.VERSION, "files": files}, FileWriter)
+			os.replace(TemporaryPath, self.path)
+
+		except OSError: pass
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, table: "BaseTable", workers: int | None = None):
+		"""
+		Проверка целостности вложений таблицы.
+
+		Хеши SHA-256 файлов вложений вместе с их временем изменения и размером хранятся в файле _.scrub_ таблицы, поэтому повторная проверка хеширует только изменившиеся файлы. Изменённым считается файл с новыми подписью и содержимым, повреждённым – файл, содержимое которого изменилось при прежней подписи; последнее выявляется только полной проверкой. Данные таблицы должны быть загружены.
+
+		:param table: Таблица.
+		:type table: BaseTable
+		:param workers: Количество одновременно читаемых файлов. По умолчанию `IO_CONCURRENCY`.
+		:type workers: int | None
+		:raises ValueError: Количество исполнителей меньше единицы.
+		"""
+
+		if workers is not None and workers < 1: raise ValueError("Workers count must be positive.")
+
+		self.__Table = table
+		self.__Workers = workers or self.IO_CONCURRENCY
+
+		self.__Directory = self.__Table.full_path / ".attachments"
+
+	def scrub(self, full: bool = False) -> ScrubReport:
+		"""
+		Проверяет существование, размер и хеш содержимого всех вложений таблицы и ищет файлы, на которые не ссылается ни одна запись.
+
+		:param full: Указывает, нужно ли хешировать все файлы, а не только изменившиеся.
+		:type full: bool
+		:return: Результат проверки.
+		:rtype: ScrubReport
+		"""
+
+		References = self.__GetReferences()
+		Files = self.__GetFiles()
+		Manifest = self.__LoadManifest()
+
+		Issues = [ScrubIssue(ScrubStatuses.Missing, References[FilePath], FilePath) for FilePath in sorted(References.keys() - Files)]
+		Issues += [ScrubIssue(ScrubStatuses.Orphaned, None, FilePath) for FilePath in sorted(Files - References.keys())]
+
+		Paths = sorted(References.keys() & Files)
+		Hashed = 0
+		NewManifest = dict()
+
+		with ThreadPoolExecutor(self.__Workers) as Executor:
+			Results = Executor.map(lambda FilePath: self.__CheckFile(FilePath, Manifest.get(FilePath), full), Paths)
+
+			for FilePath, (Entry, Status, IsHashed) in zip(Paths, Results):
+				Hashed += IsHashed
+				if Entry: NewManifest[FilePath] = Entry
+				if Status: Issues.append(ScrubIssue(Status, References[FilePath], FilePath))
+
+		if NewManifest != Manifest: self.__SaveManifest(NewManifest)
+
+		return ScrubReport(len(Paths), Hashed, tuple(Issues))
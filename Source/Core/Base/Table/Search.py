@@ -0,0 +1,399 @@
+import bisect
+import marshal
+import os
+import re
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, AbstractSet
+
+from .Fuzzy import FuzzyIndex
+from .Loader import NotesLoader
+from .Snapshot import GetFileSignature
+
+if TYPE_CHECKING:
+	from Source.Core.Base.Note import BaseNote
+	from Source.Core.Base.Table import BaseTable
+
+class SearchIndex:
+	"""Инвертированный поисковый индекс таблицы."""
+
+	#==========================================================================================#
+	# >>>>> СТАТИЧЕСКИЕ АТРИБУТЫ <<<<< #
+	#==========================================================================================#
+
+	FILENAME = ".search"
+	NGRAM_SIZE = 3
+	RACY_INTERVAL = 2_000_000_000
+	VERSION = 2
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def is_built(self) -> bool:
+		"""Состояние: построен ли индекс."""
+
+		return self.__IsBuilt
+
+	@property
+	def path(self) -> Path:
+		"""Путь к файлу индекса."""
+
+		return self.__Table.full_path / self.FILENAME
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __AddNote(self, note_id: int, strings: tuple[str, ...], title: str | None):
+		"""
+		Добавляет строки записи в индекс.
+
+		:param note_id: ID записи.
+		:type note_id: int
+		:param strings: Строки записи в нижнем регистре.
+		:type strings: tuple[str, ...]
+		:param title: Название записи для вывода результатов без загрузки таблицы.
+		:type title: str | None
+		"""
+
+		self.__Strings[note_id] = strings
+		self.__Titles[note_id] = title
+		if self.__Fuzzy: self.__Fuzzy.add(note_id, strings)
+
+		for Ngram in self.__GetNgrams(strings): self.__Ngrams.setdefault(Ngram, set()).add(note_id)
+
+		for Token in self.__GetTokens(strings):
+			if Token not in self.__Tokens:
+				self.__Tokens[Token] = set()
+				self.__SortedTokens: list[str] | None = None
+
+			self.__Tokens[Token].add(note_id)
+
+	def __GetNgrams(self, strings: tuple[str, ...]) -> set[str]:
+		"""
+		Возвращает множество N-грамм строк.
+
+		:param strings: Строки в нижнем регистре.
+		:type strings: tuple[str, ...]
+		:return: Множество N-грамм.
+		:rtype: set[str]
+		"""
+
+		Size = self.NGRAM_SIZE
+
+		return {String[Index:Index + Size] for String in strings for Index in range(len(String) - Size + 1)}
+
+	def __GetNoteStrings(self, note: "BaseNote") -> tuple[str, ...]:
+		"""
+		Возвращает индексируемые строки записи в нижнем регистре.
+
+		:param note: Запись.
+		:type note: BaseNote
+		:return: Последовательность строк.
+		:rtype: tuple[str, ...]
+		"""
+
+		return tuple(String.lower() for String in note.searchable_strings if String)
+
+	def __GetTokens(self, strings: tuple[str, ...]) -> set[str]:
+		"""
+		Возвращает множество слов строк.
+
+		:param strings: Строки в нижнем регистре.
+		:type strings: tuple[str, ...]
+		:return: Множество слов.
+		:rtype: set[str]
+		"""
+
+		return {Token for String in strings for Token in re.findall(r"\w+", String)}
+
+	def __RemoveNote(self, note_id: int) -> tuple[str, ...] | None:
+		"""
+		Удаляет строки записи из индекса.
+
+		:param note_id: ID записи.
+		:type note_id: int
+		:return: Удалённые строки записи или `None`, если запись не индексирована.
+		:rtype: tuple[str, ...] | None
+		"""
+
+		Strings = self.__Strings.pop(note_id, None)
+		if Strings is None: return None
+		self.__Titles.pop(note_id, None)
+		if self.__Fuzzy: self.__Fuzzy.remove(note_id, Strings)
+
+		for Ngram in self.__GetNgrams(Strings):
+			Postings = self.__Ngrams[Ngram]
+			Postings.discard(note_id)
+			if not Postings: del self.__Ngrams[Ngram]
+
+		for Token in self.__GetTokens(Strings):
+			Postings = self.__Tokens[Token]
+			Postings.discard(note_id)
+
+			if not Postings:
+				del self.__Tokens[Token]
+				self.__SortedTokens = None
+
+		return Strings
+
+	def __Reset(self):
+		"""Очищает индекс."""
+
+		self.__Strings: dict[int, tuple[str, ...]] = dict()
+		self.__Titles: dict[int, str | None] = dict()
+		self.__Ngrams: dict[str, set[int]] = dict()
+		self.__Tokens: dict[str, set[int]] = dict()
+		self.__SortedTokens = None
+		self.__Fuzzy: FuzzyIndex | None = None
+		self.__IsBuilt = False
+		self.__IsChanged = False
+
+	def __SearchPrefix(self, query: str) -> set[int]:
+		"""
+		Ищет записи, содержащие слова с указанным началом.
+
+		:param query: Начало слова в нижнем регистре.
+		:type query: str
+		:return: Множество ID записей.
+		:rtype: set[int]
+		"""
+
+		if self.__SortedTokens is None: self.__SortedTokens = sorted(self.__Tokens.keys())
+		SortedTokens = self.__SortedTokens
+
+		Result: set[int] = set()
+		Index = bisect.bisect_left(SortedTokens, query)
+
+		while Index < len(SortedTokens) and SortedTokens[Index].startswith(query):
+			Result |= self.__Tokens[SortedTokens[Index]]
+			Index += 1
+
+		return Result
+
+	def __SearchSubstring(self, query: str) -> set[int]:
+		"""
+		Ищет записи, строки которых содержат подстроку.
+
+		Кандидаты отбираются пересечением списков N-грамм запроса и проверяются прямым сравнением. Запросы короче N-граммы проверяются по кэшу строк.
+
+		:param query: Подстрока в нижнем регистре.
+		:type query: str
+		:return: Множество ID записей.
+		:rtype: set[int]
+		"""
+
+		if len(query) < self.NGRAM_SIZE: Candidates: AbstractSet[int] = self.__Strings.keys()
+
+		else:
+			Postings = list()
+
+			for Ngram in self.__GetNgrams((query,)):
+				if Ngram not in self.__Ngrams: return set()
+				Postings.append(self.__Ngrams[Ngram])
+
+			Postings.sort(key = len)
+			Candidates = set(Postings[0])
+
+			for CurrentPostings in Postings[1:]:
+				Candidates &= CurrentPostings
+				if not Candidates: return set()
+
+		return {NoteID for NoteID in Candidates if any(query in String for String in self.__Strings[NoteID])}
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, table: "BaseTable"):
+		"""
+		Инвертированный поисковый индекс таблицы.
+
+		Хранит списки N-грамм и слов индексируемых строк записей. Индекс строится при первом поиске после загрузки данных таблицы и далее обновляется при изменении записей.
+
+		:param table: Таблица.
+		:type table: BaseTable
+		"""
+
+		self.__Table = table
+
+		self.__Reset()
+
+	def build(self):
+		"""
+		Строит индекс, используя сохранённый индекс для неизменившихся записей.
+
+		Если данные таблицы не загружены, записи считываются во временные объекты и в таблицу не помещаются.
+		"""
+
+		if not self.load():
+			self.__Reset()
+			Notes = self.__Table.notes if self.__Table.is_loaded else NotesLoader(self.__Table).load(self.__Table.notes_id).values()
+			for CurrentNote in Notes: self.__AddNote(CurrentNote.id, self.__GetNoteStrings(CurrentNote), CurrentNote.name)
+			self.__IsBuilt = True
+			self.__IsChanged = True
+
+	def fuzzy_search(self, query: str, limit: int = 10) -> tuple[tuple[int, float], ...]:
+		"""
+		Выполняет нечёткий поиск с ранжированием. Нечёткий индекс строится при первом вызове.
+
+		:param query: Поисковый запрос.
+		:type query: str
+		:param limit: Максимальное количество результатов.
+		:type limit: int
+		:return: Последовательность пар из ID записи и оценки сходства от 0 до 1 в порядке убывания оценки.
+		:rtype: tuple[tuple[int, float], ...]
+		"""
+
+		if not self.__IsBuilt: self.build()
+
+		if not self.__Fuzzy:
+			self.__Fuzzy = FuzzyIndex()
+			for NoteID, Strings in self.__Strings.items(): self.__Fuzzy.add(NoteID, Strings)
+
+		return self.__Fuzzy.search(query, limit)
+
+	def get_title(self, note_id: int) -> str | None:
+		"""
+		Возвращает название индексированной записи.
+
+		:param note_id: ID записи.
+		:type note_id: int
+		:return: Название записи или `None`, если оно не задано или запись не индексирована.
+		:rtype: str | None
+		"""
+
+		return self.__Titles.get(note_id)
+
+	def invalidate(self):
+		"""Сбрасывает индекс. Он будет построен заново при следующем поиске."""
+
+		self.__Reset()
+
+	def load(self) -> bool:
+		"""
+		Загружает сохранённый индекс и переиндексирует записи, файлы которых изменились.
+
+		Для записей, не загруженных в таблицу, создаются временные объекты.
+
+		:return: Возвращает `True`, если сохранённый индекс был загружен.
+		:rtype: bool
+		"""
+
+		try:
+			with open(self.path, "rb") as FileReader: Data = marshal.loads(FileReader.read())
+			if type(Data) is not dict or Data.get("version") != self.VERSION: return False
+			Signatures: dict[int, tuple[int, int, int] | None] = Data["signatures"]
+			Strings: dict[int, tuple[str, ...]] = Data["strings"]
+			Titles: dict[int, str | None] = Data["titles"]
+			Ngrams: dict[str, set[int]] = Data["ngrams"]
+			Tokens: dict[str, set[int]] = Data["tokens"]
+
+		except (OSError, EOFError, ValueError, TypeError, KeyError): return False
+
+		self.__Reset()
+		self.__Strings, self.__Titles, self.__Ngrams, self.__Tokens = Strings, Titles, Ngrams, Tokens
+		self.__IsBuilt = True
+
+		NotesID = self.__Table.notes_id
+
+		for NoteID in set(Strings.keys()) - set(NotesID): self.remove(NoteID)
+
+		for NoteID in NotesID:
+			if NoteID in Strings and Signatures.get(NoteID) == GetFileSignature(self.__Table.full_path / f"{NoteID}.json"): continue
+			if self.__Table.is_note_exists(NoteID): CurrentNote = self.__Table.get_note(NoteID)
+			else: CurrentNote = self.__Table._NoteClass(self.__Table._Driver, self.__Table, NoteID)
+			self.update(CurrentNote)
+
+		return True
+
+	def remove(self, note_id: int):
+		"""
+		Удаляет запись из индекса.
+
+		:param note_id: ID записи.
+		:type note_id: int
+		"""
+
+		if not self.__IsBuilt: return
+		self.__RemoveNote(note_id)
+		self.__IsChanged = True
+
+	def renumber(self, mapping: dict[int, int]):
+		"""
+		Переносит строки записей под новые ID.
+
+		:param mapping: Словарь, где ключ – текущий ID записи, а значение – новый.
+		:type mapping: dict[int, int]
+		"""
+
+		if not self.__IsBuilt: return
+		Entries = {NewID: (self.__Titles.get(OldID), self.__RemoveNote(OldID)) for OldID, NewID in mapping.items()}
+
+		for NoteID, (Title, Strings) in Entries.items():
+			if Strings is not None: self.__AddNote(NoteID, Strings, Title)
+
+		self.__IsChanged = True
+
+	def save(self):
+		"""Сохраняет индекс в файл _.search_ в директории таблицы при наличии изменений. Ошибки записи игнорируются."""
+
+		if not self.__IsBuilt or not self.__IsChanged: return
+
+		Now = time.time_ns()
+		Signatures = dict()
+
+		for NoteID in self.__Strings.keys():
+			Signature = GetFileSignature(self.__Table.full_path / f"{NoteID}.json")
+			Signatures[NoteID] = Signature if Signature and Now - Signature[0] >= self.RACY_INTERVAL else None
+
+		Data = {
+			"version": self.VERSION,
+			"signatures": Signatures,
+			"strings": self.__Strings,
+			"titles": self.__Titles,
+			"ngrams": self.__Ngrams,
+			"tokens": self.__Tokens
+		}
+		TemporaryPath = self.path.with_name(self.FILENAME + ".tmp")
+
+		try:
+			with open(TemporaryPath, "wb") as FileWriter: marshal.dump(Data, FileWriter)
+			os.replace(TemporaryPath, self.path)
+
+		except OSError: return
+
+		self.__IsChanged = False
+
+	def search(self, query: str, prefix: bool = False) -> tuple[int, ...]:
+		"""
+		Ищет записи по индексу. При необходимости индекс строится.
+
+		:param query: Поисковый запрос.
+		:type query: str
+		:param prefix: Указывает, нужно ли искать запрос только в начале слов. По умолчанию запрос ищется как подстрока.
+		:type prefix: bool
+		:return: Отсортированная последовательность ID найденных записей.
+		:rtype: tuple[int, ...]
+		"""
+
+		if not self.__IsBuilt: self.build()
+		query = query.lower()
+		Result = self.__SearchPrefix(query) if prefix else self.__SearchSubstring(query)
+
+		return tuple(sorted(Result))
+
+	def update(self, note: "BaseNote"):
+		"""
+		Переиндексирует запись.
+
+		:param note: Запись.
+		:type note: BaseNote
+		"""
+
+		if not self.__IsBuilt: return
+		self.__RemoveNote(note.id)
+		self.__AddNote(note.id, self.__GetNoteStrings(note), note.name)
+		self.__IsChanged = True
@@ -0,0 +1,181 @@
+import marshal
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from dublib.Methods.Filesystem import ReadJSON
+
+if TYPE_CHECKING:
+	from Source.Core.Base.Table import BaseTable
+
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ <<<<< #
+#==========================================================================================#
+
+def GetFileSignature(path: Path) -> tuple[int, int, int] | None:
+	"""
+	Возвращает подпись файла для проверки актуальности сохранённых производных данных: время изменения в наносекундах, размер и номер индексного дескриптора. Последний отличает файлы, переименованные при изменении ID записей, так как переименование сохраняет время изменения и размер.
+
+	:param path: Путь к файлу.
+	:type path: Path
+	:return: Подпись файла или `None` при его отсутствии.
+	:rtype: tuple[int, int, int] | None
+	"""
+
+	try: Stat = os.stat(path)
+	except OSError: return None
+
+	return (Stat.st_mtime_ns, Stat.st_size, Stat.st_ino)
+
+#==========================================================================================#
+# >>>>> ОСНОВНОЙ КЛАСС <<<<< #
+#==========================================================================================#
+
+class TableSnapshot:
+	"""Упакованный снимок файлов JSON таблицы."""
+
+	#==========================================================================================#
+	# >>>>> СТАТИЧЕСКИЕ АТРИБУТЫ <<<<< #
+	#==========================================================================================#
+
+	FILENAME = ".snapshot"
+	VERSION = 2
+	RACY_INTERVAL = 2_000_000_000
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def path(self) -> Path:
+		"""Путь к файлу снимка."""
+
+		return self.__Table.full_path / self.FILENAME
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __GetRecords(self) -> dict[str, tuple[int, int, int, bytes]]:
+		"""
+		Возвращает записи снимка, при первом обращении считывая файл. Повреждённый или устаревший снимок игнорируется.
+
+		:return: Словарь, где ключ – имя файла, а значение – время изменения в наносекундах, размер, номер индексного дескриптора и упакованные данные.
+		:rtype: dict[str, tuple[int, int, int, bytes]]
+		"""
+
+		Records = self.__Records
+
+		if Records is None:
+			Records = dict()
+
+			try:
+				with open(self.path, "rb") as FileReader: Data = marshal.loads(FileReader.read())
+				if type(Data) is dict and Data.get("version") == self.VERSION: Records = Data["files"]
+
+			except (OSError, EOFError, ValueError, TypeError, KeyError): pass
+
+			self.__Records: dict[str, tuple[int, int, int, bytes]] | None = Records
+
+		return Records
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, table: "BaseTable"):
+		"""
+		Упакованный снимок файлов JSON таблицы.
+
+		Снимок хранит декодированные данные записей и связей в одном файле _.snapshot_ и позволяет прочитать их за одну операцию ввода-вывода. Источником истины остаются файлы JSON: запись снимка используется, только если время изменения, размер и индексный дескриптор файла совпадают с сохранёнными.
+
+		:param table: Таблица.
+		:type table: BaseTable
+		"""
+
+		self.__Table = table
+
+		self.__Records = None
+		self.__Signatures: dict[str, tuple[int, int, int]] = dict()
+		self.__Touched: dict[str, tuple[int, int, int, bytes]] = dict()
+		self.__IsChanged = False
+
+	def get(self, filename: str) -> Any | None:
+		"""
+		Возвращает данные файла из снимка, если файл не изменялся.
+
+		Подпись файла запоминается и используется при последующем вызове `put()`, поэтому её снятие предшествует чтению файла.
+
+		:param filename: Имя файла в директории таблицы.
+		:type filename: str
+		:return: Данные файла или `None`, если требуется чтение файла.
+		:rtype: Any | None
+		"""
+
+		Signature = GetFileSignature(self.__Table.full_path / filename)
+		if not Signature: return None
+		self.__Signatures[filename] = Signature
+
+		Record = self.__GetRecords().get(filename)
+
+		if Record and Record[:3] == Signature:
+			self.__Touched[filename] = Record
+			return marshal.loads(Record[3])
+
+		return None
+
+	def put(self, filename: str, data: Any):
+		"""
+		Помещает прочитанные данные файла в снимок.
+
+		:param filename: Имя файла в директории таблицы.
+		:type filename: str
+		:param data: Данные файла.
+		:type data: Any
+		"""
+
+		Signature = self.__Signatures.get(filename)
+		if not Signature or time.time_ns() - Signature[0] < self.RACY_INTERVAL: return
+
+		self.__Touched[filename] = (*Signature, marshal.dumps(data))
+		self.__IsChanged = True
+
+	def read(self, filename: str) -> Any | None:
+		"""
+		Возвращает данные файла JSON из снимка или считывает файл и помещает его данные в снимок.
+
+		:param filename: Имя файла в директории таблицы.
+		:type filename: str
+		:return: Данные файла или `None` при его отсутствии.
+		:rtype: Any | None
+		"""
+
+		Data = self.get(filename)
+
+		if Data is None and filename in self.__Signatures:
+			Data = ReadJSON(self.__Table.full_path / filename)
+			self.put(filename, Data)
+
+		return Data
+
+	def save(self):
+		"""
+		Сохраняет снимок, если в него были помещены новые данные или часть файлов не использовалась.
+
+		В снимок попадают только файлы, к которым было обращение с момента прошлого сохранения. Ошибки записи игнорируются, так как снимок является лишь кэшем.
+		"""
+
+		Records = self.__GetRecords()
+		if not self.__IsChanged and Records.keys() == self.__Touched.keys(): return
+
+		TemporaryPath = self.path.with_name(self.FILENAME + ".tmp")
+
+		try:
+			with open(TemporaryPath, "wb") as FileWriter: marshal.dump({"version": self.VERSION, "files": self.__Touched}, FileWriter)
+			os.replace(TemporaryPath, self.path)
+
+		except OSError: return
+
+		self.__Records = dict(self.__Touched)
+		self.__IsChanged = False
@@ -1,15 +1,25 @@
+import atexit
+import contextlib
 import importlib
 import os
 import shutil
+import threading
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Literal
 
 from dublib.Methods.Filesystem import ListDir
 
 from Source.Core import Exceptions
 
 from ..Manifest import Manifest
+from ..Note.Enums import CallbacksTypes
+from .Columns import ColumnarView
 from .Connector import Connector
+from .Indexes import MetainfoIndex
+from .Journal import TableJournal
+from .Loader import NotesLoader
+from .Search import SearchIndex
+from .Snapshot import TableSnapshot
 
 if TYPE_CHECKING:
 	from Source.Core.Session.Driver import Driver
@@ -20,28 +30,71 @@ if TYPE_CHECKING:
 class BaseTable:
 	"""Базовая таблица."""
 
+	#==========================================================================================#
+	# >>>>> СТАТИЧЕСКИЕ АТРИБУТЫ <<<<< #
+	#==========================================================================================#
+
+	COLUMNS: dict[str, str] = {"name": "string"}
+	FACETS: tuple[str, ...] = tuple()
+
 	#==========================================================================================#
 	# >>>>> СВОЙСТВА <<<<< #
 	#==========================================================================================#
 
+	@property
+	def columns(self) -> ColumnarView:
+		"""Колоночное представление скалярных полей записей."""
+
+		return self._Columns
+
 	@property
 	def connector(self) -> Connector:
 		"""Оператор связей."""
 
 		return self._Connector
 
+	@property
+	def driver(self) -> "Driver":
+		"""Драйвер хранилища."""
+
+		return self._Driver
+
 	@property
 	def full_path(self) -> Path:
 		"""Полный путь к директории таблицы."""
 
 		return self._Descriptor.full_path
 
+	@property
+	def is_batch(self) -> bool:
+		"""Состояние: выполняется ли пакетное редактирование таблицы."""
+
+		return self._Batch is not None
+
+	@property
+	def is_loaded(self) -> bool:
+		"""Состояние: загружены ли данные таблицы."""
+
+		return self._IsLoaded
+
+	@property
+	def is_write_behind(self) -> bool:
+		"""Состояние: включён ли режим отложенной записи."""
+
+		return self._WriteBehindInterval is not None
+
 	@property
 	def manifest(self) -> Manifest:
 		"""Манифест таблицы."""
 
 		return self._Descriptor.manifest
 
+	@property
+	def metainfo_index(self) -> MetainfoIndex:
+		"""Вторичные индексы полей метаданных."""
+
+		return self._MetainfoIndex
+
 	@property
 	def name(self) -> str:
 		"""Название таблицы."""
@@ -60,6 +113,18 @@ class BaseTable:
 
 		return self._GetNotesID()
 
+	@property
+	def search_index(self) -> SearchIndex:
+		"""Поисковый индекс."""
+
+		return self._SearchIndex
+
+	@property
+	def snapshot(self) -> TableSnapshot:
+		"""Упакованный снимок файлов JSON таблицы."""
+
+		return self._Snapshot
+
 	@property
 	def virtual_path(self) -> Path:
 		"""Виртуальный путь к таблице."""
@@ -101,22 +166,174 @@ class BaseTable:
 
 	def _GetNotesID(self) -> tuple[int, ...]:
 		"""
-		Возвращает список ID записей в таблице, полученный путём сканирования файлов JSON.
+		Возвращает список ID записей в таблице, полученный путём сканирования файлов JSON. Если директория таблицы не изменялась, список берётся из каталога хранилища.
 
 		:return: Последовательность ID записей.
 		:rtype: tuple[int]
 		"""
 
-		ListID = list()
+		Catalog = self._Driver.catalog
+		CachedID = Catalog.get_notes_id(self.virtual_path) if Catalog else None
+		if CachedID is not None: return CachedID
+
+		ModificationTime = os.stat(self.full_path).st_mtime_ns
 		Files = ListDir(self.full_path)
 		Files = list(filter(lambda File: File.endswith(".json") and File[:-5].isdigit(), Files))
+		ListID = tuple(int(File[:-5]) for File in Files)
+		if Catalog: Catalog.update_notes_id(self.virtual_path, ModificationTime, ListID)
 
-		for File in Files: 
-			if not File.replace(".json", "").isdigit(): Files.remove(File)
+		return ListID
 
-		for File in Files: ListID.append(int(File.replace(".json", "")))
-		
-		return tuple(ListID)
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __GetRenumberingPlan(self, mapping: dict[int, int]) -> list[tuple[int | None, int | None]]:
+		"""
+		Строит порядок перемещений для перенумерации, при котором место назначения каждого перемещения свободно. Цепочки перемещаются с конца, а каждый цикл разрывается одним перемещением через временную позицию.
+
+		:param mapping: Словарь, где ключ – текущий ID записи, а значение – новый. Тождественные пары не допускаются.
+		:type mapping: dict[int, int]
+		:return: Список пар ID источника и места назначения, где `None` обозначает временную позицию.
+		:rtype: list[tuple[int | None, int | None]]
+		"""
+
+		Sources = {NewID: OldID for OldID, NewID in mapping.items()}
+		Remaining = dict(mapping)
+		Plan: list[tuple[int | None, int | None]] = list()
+
+		def MoveChain(note_id: int | None):
+			while note_id is not None and note_id in Remaining:
+				Plan.append((note_id, Remaining.pop(note_id)))
+				note_id = Sources.get(note_id)
+
+		for OldID, NewID in mapping.items():
+			if NewID not in mapping: MoveChain(OldID)
+
+		while Remaining:
+			OldID = next(iter(Remaining))
+			NewID = Remaining.pop(OldID)
+			Plan.append((OldID, None))
+			MoveChain(Sources[OldID])
+			Plan.append((None, NewID))
+
+		return Plan
+
+	def __GetRenumberingMoves(self, mapping: dict[int, int]) -> list[tuple[str, str]]:
+		"""
+		Возвращает план перемещений файлов записей и каталогов вложений для перенумерации.
+
+		:param mapping: Словарь, где ключ – текущий ID записи, а значение – новый. Тождественные пары не допускаются.
+		:type mapping: dict[int, int]
+		:return: Упорядоченный список пар путей источника и места назначения относительно директории таблицы.
+		:rtype: list[tuple[str, str]]
+		"""
+
+		Moves = list()
+
+		for SourceID, DestinationID in self.__GetRenumberingPlan(mapping):
+			Source = str(SourceID) if SourceID is not None else ".renumber"
+			Destination = str(DestinationID) if DestinationID is not None else ".renumber"
+			Moves.append((f"{Source}.json", f"{Destination}.json"))
+			Moves.append((f".attachments/{Source}", f".attachments/{Destination}"))
+
+		return Moves
+
+	def __RunCallbacks(self):
+		"""
+		Обрабатывает очередь оповещений о сохранении привязанных записей.
+
+		Ожидающие записи оповещаются, начиная с наиболее глубокой в топологическом порядке связей, поэтому запись обрабатывается после всех привязанных к ней записей, изменённых в ходе той же обработки. Оповещения, поставленные в очередь во время обработки, выполняются в том же цикле, в том числе повторные оповещения уже обработанных записей.
+
+		:raises BondCycleDetected: Связи образуют цикл. Очередь оповещений очищается, так как порядок их обработки не определён.
+		"""
+
+		if self._CallbacksHold or self._IsRunningCallbacks or not self._PendingCallbacks: return
+		self._IsRunningCallbacks: bool = True
+
+		try:
+			try: Ranks = {NoteID: Rank for Rank, NoteID in enumerate(self._Connector.bonds.graph.get_topological_order())}
+
+			except Exceptions.Note.BondCycleDetected:
+				self._PendingCallbacks.clear()
+				raise
+
+			while self._PendingCallbacks:
+				Master = max(self._PendingCallbacks, key = lambda CurrentNote: Ranks.get(CurrentNote.id, -1))
+				Slave = self._PendingCallbacks.pop(Master)
+				Master.run_callback(CallbacksTypes.SlaveNoteSaved, Slave)
+
+		finally: self._IsRunningCallbacks = False
+
+	def __CommitBatch(self):
+		"""Завершает пакетное редактирование: удаляет файлы удалённых записей, однократно записывает изменённые записи и связи."""
+
+		Steps = self._Batch or list()
+		self._Batch: list[tuple] | None = None
+
+		for Step in Steps:
+			if Step[0] == "delete": os.remove(Step[2])
+
+		self.flush()
+		if self._Connector.bonds.is_changed: self._Connector.bonds.save()
+
+	def __RollbackBatch(self, notes: "dict[int, BaseNote]", bonds: dict):
+		"""
+		Откатывает пакетное редактирование: возвращает файлы и ID записей, перечитывает изменённые записи и восстанавливает связи.
+
+		Шаги отменяются в обратном порядке прямыми операциями над файлами, без проверок `renumber()`, так как состояние таблицы в памяти к этому моменту уже не соответствует файлам. Состояние в памяти восстанавливается, а пакетное редактирование завершается, даже если отмена шага над файлами завершилась ошибкой.
+
+		:param notes: Словарь записей на момент начала пакетного редактирования.
+		:type notes: dict[int, BaseNote]
+		:param bonds: Словарное представление связей на момент начала пакетного редактирования.
+		:type bonds: dict
+		:raises OSError: Ошибка файловой системы при отмене шага.
+		"""
+
+		Steps = self._Batch or list()
+
+		try:
+			for Step in reversed(Steps):
+
+				match Step[0]:
+
+					case "create":
+						CreatedNote, CreatedID, CurrentID = Step[1], Step[2], Step[1].id
+						if self._Notes.get(CurrentID) is CreatedNote: del self._Notes[CurrentID]
+						for Index in (self._SearchIndex, self._MetainfoIndex, self._Columns): Index.remove(CurrentID)
+						(self.full_path / f"{CreatedID}.json").unlink(missing_ok = True)
+						shutil.rmtree(self.full_path / f".attachments/{CreatedID}", ignore_errors = True)
+
+					case "delete": os.replace(Step[2], self.full_path / f"{Step[1]}.json")
+
+					case "renumber":
+						self._Journal.begin(self.__GetRenumberingMoves({NewID: OldID for OldID, NewID in Step[1].items()}))
+						self._Journal.apply()
+						self._Journal.commit()
+
+		finally:
+			self._Batch = None
+
+			with self._DirtyLock:
+				DirtyNotes = tuple(self._DirtyNotes)
+				self._DirtyNotes.clear()
+				if self._FlushTimer: self._FlushTimer.cancel()
+				self._FlushTimer: threading.Timer | None = None
+
+			for NoteID, CurrentNote in notes.items():
+				if CurrentNote.id != NoteID: CurrentNote.set_id(NoteID, relocate = False)
+
+			self._Notes.clear()
+			self._Notes.update(notes)
+			self._Connector.bonds.restore(bonds)
+			if any(Step[0] == "renumber" for Step in Steps): self._Connector.bonds.write()
+
+			for CurrentNote in DirtyNotes:
+				if self._Notes.get(CurrentNote.id) is CurrentNote: CurrentNote.reload()
+
+			self._SearchIndex.invalidate()
+			self._MetainfoIndex.invalidate()
+			self._Columns.invalidate()
 
 	#==========================================================================================#
 	# >>>>> ПЕРЕОПРЕДЕЛЯЕМЫЕ МЕТОДЫ <<<<< #
@@ -152,20 +369,146 @@ class BaseTable:
 		self._Descriptor = descriptor
 
 		self._Notes: "dict[int, BaseNote]" = dict()
+		self._IsLoaded = False
+		self._Batch = None
+		self._DirtyNotes: "dict[BaseNote, None]" = dict()
+		self._PendingCallbacks: "dict[BaseNote, BaseNote]" = dict()
+		self._CallbacksHold: int = 0
+		self._IsRunningCallbacks = False
+		self._DirtyLock: threading.RLock = threading.RLock()
+		self._FlushTimer = None
+		self._WriteBehindInterval: float | None = None
 		self._NoteClass = self._GetNoteClass()
-		self._Connector = Connector(self)
+		self._Snapshot = TableSnapshot(self)
+		self._Journal: TableJournal = TableJournal(self)
+		self._Journal.recover()
+		self._SearchIndex: SearchIndex = SearchIndex(self)
+		self._MetainfoIndex: MetainfoIndex = MetainfoIndex(self)
+		self._Columns: ColumnarView = ColumnarView(self)
+		self._Connector: Connector = Connector(self)
 		
 		self._PostInitMethod()
 
+	@contextlib.contextmanager
+	def batch(self) -> Iterator["BaseTable"]:
+		"""
+		Контекст пакетного редактирования таблицы.
+
+		Внутри контекста изменения применяются в памяти: сохранение записей и файла связей, а также перестроение кэша связей откладываются. При выходе из контекста каждая изменённая запись и файл связей записываются однократно. Если из контекста выбрасывается исключение, ID, файлы и данные записей, а также связи возвращаются в исходное состояние. Вложенные контексты присоединяются к внешнему.
+
+		:return: Таблица.
+		:rtype: Iterator[BaseTable]
+		"""
+
+		if self._Batch is not None:
+			yield self
+			return
+
+		self.flush()
+		Notes = dict(self._Notes)
+		Bonds = self._Connector.bonds.to_dict()
+		self._Batch = list()
+
+		try: yield self
+
+		except BaseException:
+			self.__RollbackBatch(Notes, Bonds)
+			raise
+
+		self.__CommitBatch()
+
+	def close(self):
+		"""Записывает отложенные изменения и сохраняет вспомогательные данные таблицы перед завершением работы с ней."""
+
+		self.flush()
+		self._SearchIndex.save()
+
 	def delete(self):
 		"""Удаляет таблицу."""
 
+		self.disable_write_behind(flush = False)
 		shutil.rmtree(self.full_path)
 
-	def load_data(self):
-		"""Загружает данные таблицы."""
+	def disable_write_behind(self, flush: bool = True):
+		"""
+		Отключает режим отложенной записи.
+
+		:param flush: Указывает, нужно ли записать отложенные изменения.
+		:type flush: bool
+		"""
+
+		if self._WriteBehindInterval is None: return
+		self._WriteBehindInterval = None
+		atexit.unregister(self.flush)
+
+		if flush: self.flush()
+
+		else:
+			with self._DirtyLock:
+				self._DirtyNotes.clear()
+				if self._FlushTimer: self._FlushTimer.cancel()
+				self._FlushTimer = None
+
+	def enable_write_behind(self, interval: float = 5.0):
+		"""
+		Включает режим отложенной записи.
+
+		В этом режиме сохранение существующих записей лишь помечает их изменёнными, а запись на диск выполняется по таймеру, при закрытии таблицы, при завершении процесса или вызове `flush()`. Количество операций записи ограничено количеством изменённых записей, а не количеством изменений.
+
+		:param interval: Интервал в секундах между изменением записи и её записью на диск.
+		:type interval: float
+		:raises ValueError: Неположительный интервал.
+		"""
+
+		if interval <= 0: raise ValueError("Interval must be positive.")
+		if self._WriteBehindInterval is None: atexit.register(self.flush)
+		self._WriteBehindInterval = interval
+
+	def flush(self):
+		"""
+		Записывает на диск все изменённые записи, ожидающие отложенной записи. Во время пакетного редактирования не выполняется.
+
+		Оповещения записей, к которым привязаны записанные записи, обрабатываются после записи. Так как в режиме отложенной записи сохранение оповещённых записей лишь снова помечает их изменёнными, запись и оповещение повторяются, пока не опустеют и набор изменённых записей, и очередь оповещений.
+
+		:raises BondCycleDetected: Связи образуют цикл.
+		"""
+
+		if self._Batch is not None: return
 
-		for ID in self._GetNotesID(): self._Notes[ID] = self._NoteClass(self._Driver, self, ID)
+		with self._DirtyLock:
+			if self._FlushTimer: self._FlushTimer.cancel()
+			self._FlushTimer = None
+
+			while self._DirtyNotes or (self._PendingCallbacks and not self._IsRunningCallbacks):
+				self._CallbacksHold += 1
+
+				try:
+					while self._DirtyNotes:
+						CurrentNote = next(iter(self._DirtyNotes))
+						del self._DirtyNotes[CurrentNote]
+						CurrentNote.write()
+
+				finally: self._CallbacksHold -= 1
+
+				self.__RunCallbacks()
+
+			if self._FlushTimer: self._FlushTimer.cancel()
+			self._FlushTimer = None
+
+	def load_data(self, workers: int | None = None):
+		"""
+		Загружает данные таблицы. Неизменившиеся записи берутся из снимка таблицы, остальные файлы записей читаются параллельно.
+
+		:param workers: Количество исполнителей загрузки. По умолчанию определяется по количеству процессоров. При значении `1` загрузка выполняется последовательно.
+		:type workers: int | None
+		:raises ValueError: Количество исполнителей меньше единицы.
+		"""
+
+		self._Notes = NotesLoader(self, workers).load(self._GetNotesID())
+		self._IsLoaded = True
+		self._SearchIndex.invalidate()
+		self._MetainfoIndex.invalidate()
+		self._Columns.invalidate()
 		self._PostLoadMethod()
 
 	def rename(self, name: str):
@@ -211,9 +554,7 @@ class BaseTable:
 
 			case None:
 				if IsTargetNoteExists: raise Exceptions.Table.OperationError("Unable insert. Target ID already exists.")
-				self._Notes[new_id] = self._Notes[note_id]
-				self._Notes[new_id].set_id(new_id)
-				del self._Notes[note_id]
+				self.renumber({note_id: new_id})
 
 			case "i":
 
@@ -221,39 +562,22 @@ class BaseTable:
 					self.change_note_id(note_id, new_id)
 					return
 
-				self.change_note_id(note_id, 0)
-
-				AffectedNotesID = sorted(CurrentNote.id for CurrentNote in self._Notes.values() if CurrentNote.id >= new_id)
-				Buffer = list()
+				Mapping = {note_id: new_id}
+				CurrentID = new_id
 
-				for CurrentID in AffectedNotesID:
+				while CurrentID in self._Notes and CurrentID != note_id:
+					Mapping[CurrentID] = CurrentID + 1
+					CurrentID += 1
 
-					if not Buffer:
-						Buffer.append(CurrentID)
-						continue
-
-					if CurrentID - Buffer[-1] != 1: break 
-					Buffer.append(CurrentID)
-
-				AffectedNotesID = list(reversed(Buffer))
-				for CurrentID in AffectedNotesID: self.change_note_id(CurrentID, CurrentID + 1)
-				self.change_note_id(0, new_id)
+				self.renumber(Mapping)
 
 			case "o":
 				self.delete_note(new_id)
-				self._Notes[note_id].set_id(new_id)
+				self.renumber({note_id: new_id})
 
 			case "s":
 				if not IsTargetNoteExists: raise Exceptions.Table.OperationError("Unable swap. Target ID is free.")
-				FirstNote = self._Notes[note_id]
-				SecondNote = self._Notes[new_id]
-
-				FirstNote.set_id(0)
-				SecondNote.set_id(note_id)
-				FirstNote.set_id(new_id)
-
-				self._Notes[note_id] = SecondNote
-				self._Notes[new_id] = FirstNote
+				self.renumber({note_id: new_id, new_id: note_id})
 
 	def create_note(self) -> "BaseNote":
 		"""
@@ -265,12 +589,13 @@ class BaseTable:
 
 		NewNoteID = self._GenerateNewNoteID()
 		self._Notes[NewNoteID] = self._NoteClass(self._Driver, self, NewNoteID)
+		if self._Batch is not None: self._Batch.append(("create", self._Notes[NewNoteID], NewNoteID))
 
 		return self._Notes[NewNoteID]
 
 	def delete_note(self, note_id: int):
 		"""
-		Удаляет запись.
+		Удаляет запись. Во время пакетного редактирования файл записи до завершения контекста лишь откладывается в сторону.
 
 		:param note_id: ID записи.
 		:type note_id: int
@@ -278,8 +603,20 @@ class BaseTable:
 		"""
 
 		if note_id not in self._Notes: raise Exceptions.Table.NoteNotFound(note_id)
+
+		with self._DirtyLock: self._DirtyNotes.pop(self._Notes[note_id], None)
 		del self._Notes[note_id]
-		os.remove(self.full_path / f"{note_id}.json")
+		self._SearchIndex.remove(note_id)
+		self._MetainfoIndex.remove(note_id)
+		self._Columns.remove(note_id)
+		NotePath = self.full_path / f"{note_id}.json"
+
+		if self._Batch is not None:
+			DeletedPath = self.full_path / f".{note_id}.{len(self._Batch)}.deleted"
+			os.replace(NotePath, DeletedPath)
+			self._Batch.append(("delete", note_id, DeletedPath))
+
+		else: os.remove(NotePath)
 
 	def get_note(self, note_id: int) -> "BaseNote":
 		"""
@@ -296,6 +633,152 @@ class BaseTable:
 
 		return self._Notes[note_id]
 	
+	def renumber(self, mapping: dict[int, int]):
+		"""
+		Массово изменяет ID записей.
+
+		Файлы записей и каталоги вложений перемещаются в порядке, безопасном для цепочек и циклов замен, с одним временным перемещением на цикл. Связи перестраиваются и записываются однократно. Намерение операции фиксируется в журнале таблицы, поэтому прерванная перенумерация завершается или откатывается при следующем открытии таблицы. Все изменения ID записей выполняются этим методом.
+
+		:param mapping: Словарь, где ключ – текущий ID записи, а значение – новый.
+		:type mapping: dict[int, int]
+		:raises NoteNotFound: Запись не найдена в таблице.
+		:raises OperationError: Новые ID повторяются или заняты записями, не участвующими в перенумерации.
+		:raises OSError: Ошибка файловой системы. Выполненные перемещения откатываются.
+		"""
+
+		Mapping = {OldID: NewID for OldID, NewID in mapping.items() if OldID != NewID}
+		if not Mapping: return
+
+		for OldID, NewID in Mapping.items():
+			if OldID not in self._Notes: raise Exceptions.Table.NoteNotFound(OldID)
+			if NewID in self._Notes and NewID not in Mapping: raise Exceptions.Table.OperationError(f"Unable renumber. Target ID {NewID} already exists.")
+
+		if len(set(Mapping.values())) != len(Mapping): raise Exceptions.Table.OperationError("Unable renumber. Target IDs must be unique.")
+
+		Bonds = self._Connector.bonds
+		BondsData = dict()
+
+		for NoteID, NoteData in Bonds.to_dict().items():
+			BondsData[Mapping.get(NoteID, NoteID)] = {Name: [Mapping.get(SlaveID, SlaveID) for SlaveID in SlavesID] for Name, SlavesID in NoteData.items()}
+
+		IsRenumbered = False
+
+		try:
+			self._Journal.begin(self.__GetRenumberingMoves(Mapping), dict(sorted(BondsData.items())))
+			Bonds.renumber(Mapping)
+			IsRenumbered = True
+			self._Journal.apply()
+
+		except OSError:
+			if IsRenumbered: Bonds.renumber({NewID: OldID for OldID, NewID in Mapping.items()})
+			raise
+
+		Bonds.write(atomic = False)
+		self._Journal.commit()
+
+		Notes = {NoteID: CurrentNote for NoteID, CurrentNote in self._Notes.items() if NoteID not in Mapping}
+
+		for OldID, NewID in Mapping.items():
+			Notes[NewID] = self._Notes[OldID]
+			Notes[NewID].set_id(NewID, relocate = False)
+
+		self._Notes = dict(sorted(Notes.items()))
+		self._SearchIndex.renumber(Mapping)
+		self._MetainfoIndex.renumber(Mapping)
+		self._Columns.invalidate()
+
+		if self._Batch is not None: self._Batch.append(("renumber", Mapping))
+
+	def facet(self, field: str, notes: "Iterable[BaseNote] | None" = None) -> dict[Any, int]:
+		"""
+		Подсчитывает записи для каждого значения поля метаданных или свойства записи, перечисленного в `FACETS`, используя вторичный индекс поля.
+
+		:param field: Имя поля метаданных или свойства записи.
+		:type field: str
+		:param notes: Записи, среди которых ведётся подсчёт, например результат поиска или выборки. По умолчанию учитываются все записи.
+		:type notes: Iterable[BaseNote] | None
+		:return: Словарь, где ключ – значение поля, а значение – количество записей. Ключи упорядочены по убыванию количества.
+		:rtype: dict[Any, int]
+		"""
+
+		NotesID = tuple(CurrentNote.id for CurrentNote in notes) if notes is not None else None
+
+		return self._MetainfoIndex.count(field, NotesID)
+
+	def filter(self, field: str, values: Iterable[Any] | None = None, minimum: Any = None, maximum: Any = None) -> "tuple[BaseNote, ...]":
+		"""
+		Выбирает записи по значению поля метаданных, используя вторичный индекс поля, если он объявлен.
+
+		:param field: Имя поля.
+		:type field: str
+		:param values: Допустимые значения. По умолчанию не ограничены.
+		:type values: Iterable[Any] | None
+		:param minimum: Нижняя граница диапазона включительно.
+		:type minimum: Any
+		:param maximum: Верхняя граница диапазона включительно.
+		:type maximum: Any
+		:return: Найденные записи в порядке возрастания ID.
+		:rtype: tuple[BaseNote, ...]
+		"""
+
+		return tuple(self._Notes[NoteID] for NoteID in self._MetainfoIndex.select(field, values, minimum, maximum) if NoteID in self._Notes)
+
+	def search(self, query: str, prefix: bool = False) -> "tuple[BaseNote, ...]":
+		"""
+		Ищет записи по индексируемым строкам.
+
+		:param query: Поисковый запрос.
+		:type query: str
+		:param prefix: Указывает, нужно ли искать запрос только в начале слов. По умолчанию запрос ищется как подстрока.
+		:type prefix: bool
+		:return: Найденные записи в порядке возрастания ID.
+		:rtype: tuple[BaseNote, ...]
+		"""
+
+		return tuple(self._Notes[NoteID] for NoteID in self._SearchIndex.search(query, prefix) if NoteID in self._Notes)
+
+	def fuzzy_search(self, query: str, limit: int = 10) -> "tuple[BaseNote, ...]":
+		"""
+		Выполняет нечёткий поиск записей с учётом опечаток и транслитерации.
+
+		:param query: Поисковый запрос.
+		:type query: str
+		:param limit: Максимальное количество результатов.
+		:type limit: int
+		:return: Найденные записи в порядке убывания сходства.
+		:rtype: tuple[BaseNote, ...]
+		"""
+
+		return tuple(self._Notes[NoteID] for NoteID, _ in self._SearchIndex.fuzzy_search(query, limit) if NoteID in self._Notes)
+
+	def mark_note_dirty(self, note: "BaseNote"):
+		"""
+		Помечает запись изменённой для отложенной записи и запускает таймер записи.
+
+		:param note: Запись.
+		:type note: BaseNote
+		"""
+
+		with self._DirtyLock:
+			self._DirtyNotes[note] = None
+
+			if not self._FlushTimer and self._WriteBehindInterval:
+				self._FlushTimer = threading.Timer(self._WriteBehindInterval, self.flush)
+				self._FlushTimer.daemon = True
+				self._FlushTimer.start()
+
+	def notify_note_saved(self, note: "BaseNote"):
+		"""
+		Ставит в очередь оповещение записей, к которым привязана сохранённая запись. Повторные оповещения одной записи объединяются. Вне записи отложенных изменений очередь обрабатывается сразу.
+
+		:param note: Сохранённая запись.
+		:type note: BaseNote
+		:raises BondCycleDetected: Связи образуют цикл.
+		"""
+
+		for Master in note.bonds.masters: self._PendingCallbacks[Master] = note
+		self.__RunCallbacks()
+
 	def is_note_exists(self, note_id: int) -> bool:
 		"""
 		Проверяет, существует ли запись с указанным ID.
@@ -45,6 +45,21 @@ class MetainfoFieldIncorrectTyping(Exception):
 
 		super().__init__(field)
 
+class MetainfoFieldIncorrectValue(Exception):
+	"""Исключение: значение не входит в список допустимых значений поля метаданных."""
+
+	def __init__(self, field: str, value: float | int | str):
+		"""
+		Исключение: значение не входит в список допустимых значений поля метаданных.
+
+		:param field: Имя поля метаданных.
+		:type field: str
+		:param value: Значение.
+		:type value: float | int | str
+		"""
+
+		super().__init__(f"Value \"{value}\" isn't allowed for field \"{field}\".")
+
 class MetainfoFieldEnlistingDenied(Exception):
 	"""Исключение: использование списков в поле метаданных запрещено."""
 
@@ -159,4 +174,20 @@ class BondNotDescribed(Exception):
 		:type bond_name: str
 		"""
 
-		super().__init__(bond_name)
\ No newline at end of file
+		super().__init__(bond_name)
+
+class BondCycleDetected(Exception):
+	"""Исключение: связи образуют цикл."""
+
+	def __init__(self, bond_name: str | None, notes_id: tuple[int, ...]):
+		"""
+		Исключение: связи образуют цикл.
+
+		:param bond_name: Имя связи или `None`, если учитываются все связи.
+		:type bond_name: str | None
+		:param notes_id: ID записей, участвующих в цикле.
+		:type notes_id: tuple[int, ...]
+		"""
+
+		BondName = f"\"{bond_name}\" bonds" if bond_name else "Bonds"
+		super().__init__(f"{BondName} form a cycle through notes: " + ", ".join(str(NoteID) for NoteID in notes_id) + ".")
\ No newline at end of file
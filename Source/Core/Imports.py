@@ -0,0 +1,97 @@
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+COLD_START_MODULES = (
+	"dublib.CLI.Terminalyzer",
+	"Source.EntryPoint",
+	"Source.Core.Session",
+	"Source.Interfaces.CLI"
+)
+IMPORT_BUDGET = 200_000
+LAZY_MODULES: set[str] = set()
+
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ <<<<< #
+#==========================================================================================#
+
+def ProfileImports(modules: tuple[str, ...] = COLD_START_MODULES) -> tuple[list[tuple[str, int, int, int]], tuple[str, ...]]:
+	"""
+	Измеряет время импорта модулей в новом интерпретаторе с флагом `-X importtime`, то есть при холодном запуске без уже загруженных модулей.
+
+	:param modules: Последовательность имён импортируемых модулей.
+	:type modules: tuple[str, ...]
+	:return: Список записей с именем модуля, собственным и совокупным временем импорта в микросекундах и глубиной вложенности, а также имена ленивых модулей, загруженных при импорте.
+	:rtype: tuple[list[tuple[str, int, int, int]], tuple[str, ...]]
+	:raises RuntimeError: Импорт завершился ошибкой.
+	"""
+
+	Script = "; ".join((
+		f"import {', '.join(modules)}",
+		"import sys",
+		"from Source.Core.Imports import LAZY_MODULES",
+		"print(*sorted(Name for Name in LAZY_MODULES if Name in sys.modules), sep = '\\n')"
+	))
+	Result = subprocess.run(
+		(sys.executable, "-X", "importtime", "-c", Script),
+		capture_output = True,
+		cwd = Path(__file__).parents[2],
+		text = True
+	)
+	if Result.returncode: raise RuntimeError(Result.stderr.strip().splitlines()[-1])
+
+	Records = list()
+
+	for Line in Result.stderr.splitlines():
+		if not Line.startswith("import time:"): continue
+		Fields = Line[12:].split("|")
+		if not Fields[0].strip().isdigit(): continue
+		Name = Fields[2].rstrip()
+		Depth = (len(Name) - len(Name.lstrip())) // 2
+		Records.append((Name.strip(), int(Fields[0]), int(Fields[1]), Depth))
+
+	return Records, tuple(Result.stdout.split())
+
+#==========================================================================================#
+# >>>>> ОСНОВНОЙ КЛАСС <<<<< #
+#==========================================================================================#
+
+class LazyModule:
+	"""Модуль, импортируемый при первом обращении к его атрибутам."""
+
+	def __init__(self, name: str):
+		"""
+		Модуль, импортируемый при первом обращении к его атрибутам.
+
+		Объект подменяет модуль на уровне импортирующего модуля, поэтому обращения вида `module.attribute` не требуют изменений. Имя модуля регистрируется, чтобы профилировщик холодного запуска сообщал о его преждевременной загрузке.
+
+		:param name: Полное имя модуля.
+		:type name: str
+		"""
+
+		self.__Name = name
+		self.__Module: ModuleType | None = None
+
+		LAZY_MODULES.add(name)
+
+	def __getattr__(self, name: str) -> Any:
+		"""
+		Импортирует модуль при первом обращении и возвращает его атрибут.
+
+		:param name: Имя атрибута.
+		:type name: str
+		:return: Атрибут модуля.
+		:rtype: Any
+		"""
+
+		if self.__Module is None: self.__Module = importlib.import_module(self.__Name)
+
+		return getattr(self.__Module, name)
+
+	def __repr__(self) -> str:
+		"""Возвращает строковое представление."""
+
+		return f"<lazy module '{self.__Name}'>"
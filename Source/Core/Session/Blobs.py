@@ -0,0 +1,300 @@
+import hashlib
+import os
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable
+
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ <<<<< #
+#==========================================================================================#
+
+def CopyFile(source: Path, destination: Path):
+	"""
+	Копирует файл во временный файл рядом с местом назначения и атомарно заменяет им файл назначения. Существующий файл назначения, который может быть жёсткой ссылкой на содержимое, таким образом не перезаписывается на месте, и остальные ссылки на содержимое не изменяются.
+
+	:param source: Путь к исходному файлу.
+	:type source: Path
+	:param destination: Путь к копии.
+	:type destination: Path
+	:raises OSError: Ошибка копирования.
+	"""
+
+	TemporaryPath = destination.with_name(f".{destination.name}.copy")
+	TemporaryPath.unlink(missing_ok = True)
+
+	try:
+		if not Reflink(source, TemporaryPath): shutil.copy(source, TemporaryPath)
+		os.replace(TemporaryPath, destination)
+
+	except OSError:
+		TemporaryPath.unlink(missing_ok = True)
+		raise
+
+def HashFile(path: Path, chunk_size: int = 1 << 20) -> str:
+	"""
+	Вычисляет хеш SHA-256 содержимого файла, читая его блоками. При обработке больших блоков _hashlib_ освобождает GIL, поэтому хеширование в пуле потоков выполняется параллельно.
+
+	:param path: Путь к файлу.
+	:type path: Path
+	:param chunk_size: Размер блока чтения в байтах.
+	:type chunk_size: int
+	:return: Шестнадцатеричное представление хеша.
+	:rtype: str
+	:raises OSError: Ошибка чтения файла.
+	"""
+
+	Hash = hashlib.sha256()
+
+	with open(path, "rb") as FileReader:
+		while Chunk := FileReader.read(chunk_size): Hash.update(Chunk)
+
+	return Hash.hexdigest()
+
+def Reflink(source: Path, destination: Path) -> bool:
+	"""
+	Создаёт копию файла с общими блоками данных (copy-on-write), если файловая система это поддерживает.
+
+	:param source: Путь к исходному файлу.
+	:type source: Path
+	:param destination: Путь к копии. Не должен существовать.
+	:type destination: Path
+	:return: Возвращает `True`, если копия создана.
+	:rtype: bool
+	"""
+
+	try:
+		import fcntl
+	except ImportError: return False
+
+	FICLONE = 0x40049409
+
+	try:
+		with open(source, "rb") as FileReader, open(destination, "xb") as FileWriter: fcntl.ioctl(FileWriter.fileno(), FICLONE, FileReader.fileno())
+
+	except OSError:
+		try: os.remove(destination)
+		except OSError: pass
+
+		return False
+
+	return True
+
+#==========================================================================================#
+# >>>>> ОСНОВНОЙ КЛАСС <<<<< #
+#==========================================================================================#
+
+class BlobStore:
+	"""Контентно-адресуемое хранилище файлов вложений."""
+
+	#==========================================================================================#
+	# >>>>> СТАТИЧЕСКИЕ АТРИБУТЫ <<<<< #
+	#==========================================================================================#
+
+	DIRECTORY = ".blobs"
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def directory(self) -> Path:
+		"""Путь к директории хранилища содержимого."""
+
+		return self.__Directory
+
+	@property
+	def is_enabled(self) -> bool:
+		"""Состояние: включено ли хранилище содержимого для хранилища записей."""
+
+		return self.__Directory.is_dir()
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __GetBlobPath(self, hash: str) -> Path:
+		"""
+		Возвращает путь к файлу содержимого по его хешу.
+
+		:param hash: Хеш содержимого.
+		:type hash: str
+		:return: Путь к файлу содержимого.
+		:rtype: Path
+		"""
+
+		return self.__Directory / hash[:2] / hash
+
+	def __GetExecutor(self) -> ThreadPoolExecutor:
+		"""
+		Возвращает пул потоков хеширования, создавая его при первом обращении.
+
+		:return: Пул потоков.
+		:rtype: ThreadPoolExecutor
+		"""
+
+		Executor = self.__Executor
+
+		if Executor is None:
+			Executor = ThreadPoolExecutor(self.__Workers, thread_name_prefix = "BlobStore")
+			self.__Executor: ThreadPoolExecutor | None = Executor
+
+		return Executor
+
+	def __Link(self, blob: Path, path: Path) -> bool:
+		"""
+		Заменяет файл ссылкой на содержимое: жёсткой ссылкой, а если это невозможно, копией с общими блоками данных.
+
+		:param blob: Путь к файлу содержимого.
+		:type blob: Path
+		:param path: Путь к заменяемому или создаваемому файлу.
+		:type path: Path
+		:return: Возвращает `True`, если файл заменён ссылкой.
+		:rtype: bool
+		"""
+
+		TemporaryPath = path.with_name(f".{path.name}.blob")
+		TemporaryPath.unlink(missing_ok = True)
+
+		try: os.link(blob, TemporaryPath)
+		except OSError:
+			if not Reflink(blob, TemporaryPath): return False
+
+		try: os.replace(TemporaryPath, path)
+		except OSError:
+			os.remove(TemporaryPath)
+			return False
+
+		return True
+
+	def __Deduplicate(self, path: Path) -> int:
+		"""
+		Хеширует файл и заменяет его ссылкой на содержимое. Новое содержимое помещается в хранилище жёсткой ссылкой на сам файл, без копирования. Файлы, уже имеющие несколько жёстких ссылок, а также изменившиеся во время хеширования, пропускаются.
+
+		:param path: Путь к файлу.
+		:type path: Path
+		:return: Количество освобождённых байтов.
+		:rtype: int
+		"""
+
+		try:
+			Stat = os.stat(path)
+			if Stat.st_nlink > 1: return 0
+			Hash = HashFile(path)
+			CurrentStat = os.stat(path)
+			if (CurrentStat.st_ino, CurrentStat.st_size, CurrentStat.st_mtime_ns) != (Stat.st_ino, Stat.st_size, Stat.st_mtime_ns): return 0
+
+		except OSError: return 0
+
+		Blob = self.__GetBlobPath(Hash)
+
+		try:
+			os.makedirs(Blob.parent, exist_ok = True)
+			os.link(path, Blob)
+			return 0
+
+		except FileExistsError: pass
+		except OSError: return 0
+
+		try:
+			if os.stat(Blob).st_ino == Stat.st_ino: return 0
+		except OSError: return 0
+
+		return Stat.st_size if self.__Link(Blob, path) else 0
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, storage_directory: Path, workers: int | None = None):
+		"""
+		Контентно-адресуемое хранилище файлов вложений.
+
+		Содержимое хранится в директории _.blobs_ хранилища записей под именем, равным хешу SHA-256. Файлы вложений записей остаются на своих местах, но являются жёсткими ссылками на содержимое, поэтому одинаковые файлы в разных записях и таблицах занимают место на диске однократно, а счётчик ссылок файловой системы служит счётчиком использования. Если жёсткая ссылка невозможна, используется копия с общими блоками данных. Содержимое вложений не должно изменяться на месте, так как изменение затронет все ссылки.
+
+		Хранилище необязательно и включается только явно, созданием директории. Файлы вложений никогда не перезаписываются на месте: новое содержимое записывается во временный файл, который затем заменяет файл вложения, разрывая его связь с остальными ссылками.
+
+		:param storage_directory: Директория хранилища записей.
+		:type storage_directory: Path
+		:param workers: Количество потоков хеширования. По умолчанию определяется по количеству процессоров.
+		:type workers: int | None
+		"""
+
+		self.__Directory = storage_directory / self.DIRECTORY
+		self.__Workers = workers
+		self.__Executor = None
+
+	def collect(self) -> int:
+		"""
+		Удаляет содержимое, на которое не ссылается ни одно вложение.
+
+		:return: Количество освобождённых байтов.
+		:rtype: int
+		"""
+
+		Released = 0
+		if not self.is_enabled: return Released
+
+		for Directory in os.scandir(self.__Directory):
+			if not Directory.is_dir(): continue
+
+			for Blob in os.scandir(Directory.path):
+				try:
+					Stat = Blob.stat()
+					if Stat.st_nlink > 1: continue
+					os.remove(Blob.path)
+					Released += Stat.st_size
+
+				except OSError: pass
+
+		return Released
+
+	def copy(self, source: Path, destination: Path):
+		"""
+		Копирует файл. Если такое содержимое уже есть в хранилище, вместо копирования создаётся ссылка на него. Иначе файл копируется с общими блоками данных, если это возможно, и ставится в очередь на фоновое помещение в хранилище. Существующий файл назначения заменяется, а не перезаписывается на месте.
+
+		:param source: Путь к исходному файлу.
+		:type source: Path
+		:param destination: Путь к копии.
+		:type destination: Path
+		"""
+
+		if self.is_enabled:
+			Blob = self.__GetBlobPath(HashFile(source))
+			if Blob.exists() and self.__Link(Blob, destination): return
+
+		CopyFile(source, destination)
+		self.submit(destination)
+
+	def deduplicate(self, paths: Iterable[Path]) -> int:
+		"""
+		Помещает файлы в хранилище, параллельно хешируя их в пуле потоков.
+
+		:param paths: Последовательность путей к файлам.
+		:type paths: Iterable[Path]
+		:return: Количество освобождённых байтов.
+		:rtype: int
+		"""
+
+		if not self.is_enabled: return 0
+
+		return sum(self.__GetExecutor().map(self.__Deduplicate, paths))
+
+	def enable(self):
+		"""Включает хранилище содержимого."""
+
+		os.makedirs(self.__Directory, exist_ok = True)
+
+	def submit(self, path: Path) -> Future | None:
+		"""
+		Ставит файл в очередь на фоновое помещение в хранилище.
+
+		:param path: Путь к файлу.
+		:type path: Path
+		:return: Задача пула потоков или `None`, если хранилище выключено.
+		:rtype: Future | None
+		"""
+
+		if not self.is_enabled: return None
+
+		return self.__GetExecutor().submit(self.__Deduplicate, path)
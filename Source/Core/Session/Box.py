@@ -1,12 +1,13 @@
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from Source.Core import Exceptions
 
 from .TableDescriptor import TableDescriptor
 
 if TYPE_CHECKING:
+	from .Catalog import StorageCatalog
 	from .Driver import Driver
 
 class RootBox:
@@ -29,7 +30,7 @@ class RootBox:
 	def items(self) -> "tuple[Box | TableDescriptor, ...]":
 		"""Последовательность содержащихся в контейнере элементов."""
 
-		return tuple(self._Items.values())
+		return tuple(self._GetItems().values())
 	
 	@property
 	def virtual_path(self) -> Path:
@@ -60,9 +61,22 @@ class RootBox:
 		self._VirtualPath = virtual_path
 		self._FullPath = self._Driver.storage_directory / self._VirtualPath
 		
-		self._Items: dict[str, Box | TableDescriptor] = dict()
+		self._Items: dict[str, Box | TableDescriptor] | None = None
 
-		self.reload()
+		if not self._Driver.is_lazy: self.reload()
+
+	def _GetItems(self) -> "dict[str, Box | TableDescriptor]":
+		"""
+		Возвращает словарь элементов контейнера. В ленивом режиме при первом обращении сканирует директорию.
+
+		:return: Словарь элементов контейнера.
+		:rtype: dict[str, Box | TableDescriptor]
+		:raises FileNotFoundError: Директория контейнера не найдена.
+		"""
+
+		if self._Items is None: self.reload()
+
+		return cast("dict[str, Box | TableDescriptor]", self._Items)
 
 	#==========================================================================================#
 	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
@@ -87,8 +101,9 @@ class RootBox:
 		:type item: Box | TableDescriptor
 		"""
 
-		if item.name in self._Items: raise Exceptions.Driver.BoxItemOverride(item.virtual_path)
-		self._Items[item.name] = item
+		Items = self._GetItems()
+		if item.name in Items: raise Exceptions.Driver.BoxItemOverride(item.virtual_path)
+		Items[item.name] = item
 
 	def create_box(self, name: str) -> "Box":
 		"""
@@ -141,7 +156,7 @@ class RootBox:
 		:raises KeyError: Элемент не найден.
 		"""
 
-		return self._Items[name]
+		return self._GetItems()[name]
 
 	def pop_item(self, name: str) -> "Box | TableDescriptor":
 		"""
@@ -154,26 +169,38 @@ class RootBox:
 		:raises ItemNotFound: Элемент не найден.
 		"""
 
-		if name not in self._Items: raise Exceptions.Driver.ItemNotFound(self._VirtualPath / name)
-		Item = self.get_item(name)
-		del self._Items[name]
+		Items = self._GetItems()
+		if name not in Items: raise Exceptions.Driver.ItemNotFound(self._VirtualPath / name)
+		Item = Items.pop(name)
 
 		return Item
 
 	def reload(self):
 		"""
-		Сканирует и обновляет элементы контейнера.
+		Сканирует и обновляет элементы контейнера. Если директория контейнера не изменялась, состав элементов берётся из каталога хранилища. Скрытые директории пропускаются.
 		
 		:raises FileNotFoundError: Директория контейнера не найдена.
 		"""
 
-		Elements = tuple(Value.name for Value in os.scandir(self.full_path) if Value.is_dir())
+		Catalog = cast("StorageCatalog", self._Driver.catalog)
+		Kinds = Catalog.get_box_items(self.virtual_path)
+
+		if Kinds is None:
+			ModificationTime = os.stat(self.full_path).st_mtime_ns
+			Kinds = dict()
+
+			for Value in os.scandir(self.full_path):
+				if not Value.is_dir() or Value.name.startswith("."): continue
+				Kinds[Value.name] = None if self._Driver.is_box(self.virtual_path / Value.name) else "table"
+
+			Catalog.update_box_items(self.virtual_path, ModificationTime, Kinds)
+
 		Items = dict()
 
-		for Element in Elements:
+		for Element, Kind in Kinds.items():
 			ElementVirtualPath = self.virtual_path / Element
 
-			if self._Driver.is_box(ElementVirtualPath):
+			if Kind is None:
 				if not self._Driver.is_box_initialized(ElementVirtualPath): self._Driver.init_box(self, Element)
 				Items[Element] = self._Driver.get_box(ElementVirtualPath)
 
@@ -181,6 +208,22 @@ class RootBox:
 
 		self._Items = Items
 
+	def walk_tables(self) -> "tuple[TableDescriptor, ...]":
+		"""
+		Возвращает дескрипторы всех таблиц в поддереве контейнера. Объекты таблиц не инициализируются.
+
+		:return: Последовательность дескрипторов таблиц в порядке обхода в глубину.
+		:rtype: tuple[TableDescriptor, ...]
+		"""
+
+		Descriptors: list[TableDescriptor] = list()
+
+		for Item in self._GetItems().values():
+			if isinstance(Item, RootBox): Descriptors += Item.walk_tables()
+			else: Descriptors.append(Item)
+
+		return tuple(Descriptors)
+
 class Box(RootBox):
 	"""Контейнер."""
 
@@ -0,0 +1,72 @@
+from typing import Any, Callable, Iterable
+
+class SessionCache:
+	"""Кэш производных значений сессии."""
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self):
+		"""
+		Кэш производных значений сессии.
+
+		Дорогостоящие значения регистрируются вместе с функцией их вычисления и событиями, при которых они устаревают. Значение вычисляется при первом запросе и хранится до инвалидации вручную или оповещением о событии.
+		"""
+
+		self.__Factories: dict[str, Callable[[], Any]] = dict()
+		self.__Hooks: dict[str, set[str]] = dict()
+		self.__Values: dict[str, Any] = dict()
+
+	def register(self, key: str, factory: Callable[[], Any], events: Iterable[str] = tuple()):
+		"""
+		Регистрирует кэшируемое значение.
+
+		:param key: Ключ значения.
+		:type key: str
+		:param factory: Функция вычисления значения.
+		:type factory: Callable[[], Any]
+		:param events: Набор событий, при которых значение устаревает.
+		:type events: Iterable[str]
+		:raises KeyError: Значение с таким ключом уже зарегистрировано.
+		"""
+
+		if key in self.__Factories: raise KeyError(key)
+		self.__Factories[key] = factory
+		for Event in events: self.__Hooks.setdefault(Event, set()).add(key)
+
+	def get(self, key: str) -> Any:
+		"""
+		Возвращает значение, при необходимости вычисляя его.
+
+		:param key: Ключ значения.
+		:type key: str
+		:return: Значение.
+		:rtype: Any
+		:raises KeyError: Значение не зарегистрировано.
+		"""
+
+		if key not in self.__Values: self.__Values[key] = self.__Factories[key]()
+
+		return self.__Values[key]
+
+	def invalidate(self, key: str | None = None):
+		"""
+		Сбрасывает значение, которое будет вычислено заново при следующем запросе.
+
+		:param key: Ключ значения. Если не передан, сбрасываются все значения.
+		:type key: str | None
+		"""
+
+		if key is None: self.__Values.clear()
+		else: self.__Values.pop(key, None)
+
+	def notify(self, event: str):
+		"""
+		Сбрасывает значения, устаревающие при событии.
+
+		:param event: Событие.
+		:type event: str
+		"""
+
+		for Key in self.__Hooks.get(event, tuple()): self.__Values.pop(Key, None)
@@ -0,0 +1,258 @@
+import hashlib
+import os
+import threading
+import time
+from json import JSONDecodeError
+from pathlib import Path
+
+from dublib.Methods.Filesystem import ReadJSON, WriteJSON
+
+class StorageCatalog:
+	"""Каталог хранилища: кэш структуры контейнеров, типов таблиц и списков ID записей."""
+
+	#==========================================================================================#
+	# >>>>> СТАТИЧЕСКИЕ АТРИБУТЫ <<<<< #
+	#==========================================================================================#
+
+	VERSION = 1
+	RACY_INTERVAL = 2_000_000_000
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def path(self) -> Path:
+		"""Путь к файлу каталога."""
+
+		return self.__Path
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __GetModificationTime(self, path: Path) -> int | None:
+		"""
+		Возвращает время последнего изменения директории или файла в наносекундах.
+
+		:param path: Путь к директории или файлу.
+		:type path: Path
+		:return: Время последнего изменения или `None` при отсутствии объекта.
+		:rtype: int | None
+		"""
+
+		try: return os.stat(path).st_mtime_ns
+		except OSError: return None
+
+	def __HashFile(self, path: Path) -> str | None:
+		"""
+		Вычисляет хеш SHA-1 содержимого файла.
+
+		:param path: Путь к файлу.
+		:type path: Path
+		:return: Хеш или `None` при ошибке чтения.
+		:rtype: str | None
+		"""
+
+		try:
+			with open(path, "rb") as FileReader: return hashlib.sha1(FileReader.read()).hexdigest()
+
+		except OSError: return None
+
+	def __IsRacy(self, modification_time: int) -> bool:
+		"""
+		Проверяет, слишком ли близко время изменения к текущему для надёжной проверки по нему.
+
+		:param modification_time: Время последнего изменения в наносекундах.
+		:type modification_time: int
+		:return: Возвращает `True`, если запись в каталог не будет надёжной.
+		:rtype: bool
+		"""
+
+		return time.time_ns() - modification_time < self.RACY_INTERVAL
+
+	def __Load(self):
+		"""Читает файл каталога. Повреждённый или устаревший каталог игнорируется."""
+
+		try: Data = ReadJSON(self.__Path)
+		except (OSError, JSONDecodeError, ValueError): return
+
+		if type(Data) is not dict or Data.get("version") != self.VERSION: return
+		self.__Boxes: dict[str, dict] = Data.get("boxes") or dict()
+		self.__Tables: dict[str, dict] = Data.get("tables") or dict()
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, storage_directory: Path):
+		"""
+		Каталог хранилища: кэш структуры контейнеров, типов таблиц и списков ID записей.
+
+		Записи каталога сверяются с временем изменения директорий, поэтому повторное сканирование выполняется только для изменившихся директорий.
+
+		:param storage_directory: Путь к директории хранилища.
+		:type storage_directory: Path
+		"""
+
+		self.__StorageDirectory = storage_directory
+		self.__Path = storage_directory / ".otakudb" / "catalog.json"
+
+		self.__Boxes = dict()
+		self.__Tables = dict()
+		self.__IsChanged = False
+		self.__Lock = threading.Lock()
+
+		self.__Load()
+
+	def forget(self, virtual_path: Path):
+		"""
+		Удаляет из каталога все записи по виртуальному пути и вложенным в него.
+
+		:param virtual_path: Виртуальный путь к контейнеру или таблице.
+		:type virtual_path: Path
+		"""
+
+		Key = virtual_path.as_posix()
+		Prefix = Key + "/"
+
+		with self.__Lock:
+
+			for Records in (self.__Boxes, self.__Tables):
+				for CurrentKey in tuple(Records.keys()):
+					if CurrentKey == Key or CurrentKey.startswith(Prefix):
+						del Records[CurrentKey]
+						self.__IsChanged = True
+
+	def get_box_items(self, virtual_path: Path) -> dict[str, str | None] | None:
+		"""
+		Возвращает закэшированное содержимое контейнера, если его директория не изменялась, а вид каждого элемента соответствует наличию манифеста в его директории. Появление или удаление манифеста не изменяет время изменения директории контейнера, поэтому проверяется отдельно.
+
+		:param virtual_path: Виртуальный путь к контейнеру.
+		:type virtual_path: Path
+		:return: Словарь, где ключ – имя элемента, а значение – `None` для контейнера или `"table"` для таблицы; `None`, если требуется сканирование.
+		:rtype: dict[str, str | None] | None
+		"""
+
+		Record = self.__Boxes.get(virtual_path.as_posix())
+		if not Record: return None
+
+		Directory = self.__StorageDirectory / virtual_path
+		if Record["mtime"] != self.__GetModificationTime(Directory): return None
+
+		for Name, Kind in Record["items"].items():
+			if (Kind is None) == (Directory / Name / "manifest.json").exists(): return None
+
+		return Record["items"]
+
+	def get_notes_id(self, virtual_path: Path) -> tuple[int, ...] | None:
+		"""
+		Возвращает закэшированный список ID записей таблицы, если её директория не изменялась.
+
+		:param virtual_path: Виртуальный путь к таблице.
+		:type virtual_path: Path
+		:return: Последовательность ID записей или `None`, если требуется сканирование.
+		:rtype: tuple[int, ...] | None
+		"""
+
+		Record = self.__Tables.get(virtual_path.as_posix(), dict()).get("notes")
+		if not Record: return None
+		if Record["mtime"] != self.__GetModificationTime(self.__StorageDirectory / virtual_path): return None
+
+		return tuple(Record["id"])
+
+	def get_table_type(self, virtual_path: Path) -> str | None:
+		"""
+		Возвращает закэшированный тип таблицы, если её манифест не изменялся. При расхождении времени изменения манифест сверяется по хешу.
+
+		:param virtual_path: Виртуальный путь к таблице.
+		:type virtual_path: Path
+		:return: Тип таблицы или `None`, если требуется чтение манифеста.
+		:rtype: str | None
+		"""
+
+		Record = self.__Tables.get(virtual_path.as_posix(), dict()).get("manifest")
+		if not Record: return None
+
+		ManifestPath = self.__StorageDirectory / virtual_path / "manifest.json"
+		ModificationTime = self.__GetModificationTime(ManifestPath)
+		if ModificationTime is None: return None
+
+		if Record["mtime"] != ModificationTime:
+			if Record["hash"] != self.__HashFile(ManifestPath): return None
+			if not self.__IsRacy(ModificationTime):
+				with self.__Lock:
+					Record["mtime"] = ModificationTime
+					self.__IsChanged = True
+
+		return Record["type"]
+
+	def save(self):
+		"""Сохраняет каталог при наличии изменений. Ошибки записи игнорируются, так как каталог является лишь кэшем."""
+
+		with self.__Lock:
+			if not self.__IsChanged: return
+			Data = {"version": self.VERSION, "boxes": dict(self.__Boxes), "tables": dict(self.__Tables)}
+			self.__IsChanged = False
+
+		try:
+			os.makedirs(self.__Path.parent, exist_ok = True)
+			WriteJSON(self.__Path, Data, pretty = False, atomic = True)
+
+		except OSError: pass
+
+	def update_box_items(self, virtual_path: Path, modification_time: int, items: dict[str, str | None]):
+		"""
+		Записывает содержимое контейнера.
+
+		:param virtual_path: Виртуальный путь к контейнеру.
+		:type virtual_path: Path
+		:param modification_time: Время изменения директории контейнера, полученное до сканирования.
+		:type modification_time: int
+		:param items: Словарь, где ключ – имя элемента, а значение – `None` для контейнера или `"table"` для таблицы.
+		:type items: dict[str, str | None]
+		"""
+
+		if self.__IsRacy(modification_time): return
+
+		with self.__Lock:
+			self.__Boxes[virtual_path.as_posix()] = {"mtime": modification_time, "items": items}
+			self.__IsChanged = True
+
+	def update_notes_id(self, virtual_path: Path, modification_time: int, notes_id: tuple[int, ...]):
+		"""
+		Записывает список ID записей таблицы.
+
+		:param virtual_path: Виртуальный путь к таблице.
+		:type virtual_path: Path
+		:param modification_time: Время изменения директории таблицы, полученное до сканирования.
+		:type modification_time: int
+		:param notes_id: Последовательность ID записей.
+		:type notes_id: tuple[int, ...]
+		"""
+
+		if self.__IsRacy(modification_time): return
+
+		with self.__Lock:
+			self.__Tables.setdefault(virtual_path.as_posix(), dict())["notes"] = {"mtime": modification_time, "id": list(notes_id)}
+			self.__IsChanged = True
+
+	def update_table_type(self, virtual_path: Path, type: str):
+		"""
+		Записывает тип таблицы и хеш её манифеста.
+
+		:param virtual_path: Виртуальный путь к таблице.
+		:type virtual_path: Path
+		:param type: Тип таблицы.
+		:type type: str
+		"""
+
+		ManifestPath = self.__StorageDirectory / virtual_path / "manifest.json"
+		ModificationTime = self.__GetModificationTime(ManifestPath)
+		if ModificationTime is None or self.__IsRacy(ModificationTime): return
+		Hash = self.__HashFile(ManifestPath)
+		if not Hash: return
+
+		with self.__Lock:
+			self.__Tables.setdefault(virtual_path.as_posix(), dict())["manifest"] = {"mtime": ModificationTime, "hash": Hash, "type": type}
+			self.__IsChanged = True
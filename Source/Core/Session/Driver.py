@@ -1,3 +1,4 @@
+import atexit
 import functools
 import importlib
 import os
@@ -9,7 +10,9 @@ from dublib.Methods.Filesystem import ListDir
 
 from Source.Core import Exceptions
 
+from .Blobs import BlobStore
 from .Box import Box, RootBox
+from .Catalog import StorageCatalog
 from .TableDescriptor import TableDescriptor
 
 if TYPE_CHECKING:
@@ -26,6 +29,24 @@ class Driver:
 	# >>>>> СВОЙСТВА <<<<< #
 	#==========================================================================================#
 
+	@property
+	def blobs(self) -> BlobStore | None:
+		"""Хранилище содержимого вложений."""
+
+		return self.__Blobs
+
+	@property
+	def catalog(self) -> StorageCatalog | None:
+		"""Каталог хранилища."""
+
+		return self.__Catalog
+
+	@property
+	def is_lazy(self) -> bool:
+		"""Состояние: примонтировано ли хранилище в ленивом режиме."""
+
+		return self.__IsLazy
+
 	@property
 	def root_box(self) -> RootBox | None:
 		"""Корневой контейнер."""
@@ -47,6 +68,41 @@ class Driver:
 
 		return tuple(Types)
 
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __ResolveBox(self, virtual_path: Path) -> Box:
+		"""
+		Последовательно инициализирует контейнеры по виртуальному пути, начиная с корня хранилища.
+
+		:param virtual_path: Виртуальный путь к контейнеру.
+		:type virtual_path: Path
+		:return: Контейнер.
+		:rtype: Box
+		:raises ItemNotFound: Контейнер не найден.
+		"""
+
+		CurrentBox = cast(RootBox, self.__RootBox)
+
+		for PathPart in virtual_path.parts:
+			if PathPart == virtual_path.anchor: continue
+
+			try: Item = CurrentBox.get_item(PathPart)
+			except (KeyError, FileNotFoundError): raise Exceptions.Driver.ItemNotFound(virtual_path)
+
+			if type(Item) is not Box: raise Exceptions.Driver.ItemNotFound(virtual_path)
+			CurrentBox = Item
+
+		if type(CurrentBox) is not Box: raise Exceptions.Driver.ItemNotFound(virtual_path)
+
+		return CurrentBox
+
+	def __SaveCatalog(self):
+		"""Сохраняет каталог хранилища, если оно примонтировано."""
+
+		if self.__Catalog: self.__Catalog.save()
+
 	#==========================================================================================#
 	# >>>>> ДЕКОРАТОРЫ <<<<< #
 	#==========================================================================================#
@@ -80,25 +136,45 @@ class Driver:
 		self.__StorageDirectory: Path | None = None
 		self.__Boxes: dict[str, Box] = dict()
 		self.__RootBox: RootBox | None = None
+		self.__IsLazy = False
+		self.__Catalog: StorageCatalog | None = None
+		self.__Blobs: BlobStore | None = None
+
+		atexit.register(self.__SaveCatalog)
 
-	def mount(self, directory: Path):
+	def mount(self, directory: Path, lazy: bool = False):
 		"""
 		Монтирует директорию как хранилище.
 
+		Структура хранилища восстанавливается из каталога, повторно сканируются только изменившиеся директории. В ленивом режиме содержимое контейнеров сканируется при первом обращении к ним, а манифесты, модули таблиц и связи загружаются при первом обращении к `TableDescriptor.table`.
+
 		:param directory: Директория хранилища или `None` для отключения.
 		:type directory: Path | None
+		:param lazy: Указывает, нужно ли примонтировать хранилище в ленивом режиме.
+		:type lazy: bool
 		:raises FileNotFoundError: Директория хранилища не найдена.
 		"""
 		
 		if directory.exists():
+			self.__SaveCatalog()
 			self.__StorageDirectory = directory
+			self.__Boxes = dict()
+			self.__IsLazy = lazy
+			self.__Catalog = StorageCatalog(directory)
+			self.__Blobs = BlobStore(directory)
 			self.__RootBox = RootBox(self)
+			self.__SaveCatalog()
+
 		else: raise FileNotFoundError(directory)
 
 	def unmount(self):
 		"""Отмонтирует хранилище."""
 
+		self.__SaveCatalog()
+		self.__Catalog = None
+		self.__Blobs = None
 		self.__StorageDirectory = None
+		self.__Boxes = dict()
 		self.__RootBox = None
 
 	#==========================================================================================#
@@ -147,6 +223,7 @@ class Driver:
 		TargetBox = self.get_box(TargetBoxVirtualPath)
 		parent_box.pop_item(name)
 		self.free_box(TargetBoxVirtualPath)
+		cast(StorageCatalog, self.__Catalog).forget(TargetBoxVirtualPath)
 
 		if purge: shutil.rmtree(TargetBox.full_path)
 		else: 
@@ -181,6 +258,7 @@ class Driver:
 		try:
 			return self.__Boxes[virtual_path.as_posix()]
 		except KeyError:
+			if self.__IsLazy: return self.__ResolveBox(virtual_path)
 			raise Exceptions.Driver.ItemNotFound(virtual_path)
 
 	@require_storage
@@ -286,4 +364,5 @@ class Driver:
 		"""
 
 		Descriptor = box.pop_item(name)
+		cast(StorageCatalog, self.__Catalog).forget(Descriptor.virtual_path)
 		shutil.rmtree(Descriptor.full_path)
\ No newline at end of file
@@ -1,6 +1,6 @@
 import importlib
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from Source.Core import Exceptions
 from Source.Core.Base.Manifest import Manifest
@@ -24,11 +24,21 @@ class TableDescriptor:
 
 		return self.__FullPath
 
+	@property
+	def is_table_initialized(self) -> bool:
+		"""Состояние: инициализирован ли объект таблицы."""
+
+		return self.__TableObject is not None
+
 	@property
 	def manifest(self) -> Manifest:
 		"""Манифест таблицы."""
 
-		return self.__Manifest
+		if not self.__Manifest:
+			self.__Manifest: Manifest | None = Manifest(self.__FullPath).load()
+			if self.__Driver.catalog: self.__Driver.catalog.update_table_type(self.__VirtualPath, cast(str, self.__Manifest.type))
+
+		return cast(Manifest, self.__Manifest)
 	
 	@property
 	def name(self) -> str:
@@ -42,11 +52,23 @@ class TableDescriptor:
 
 		return self.__VirtualPath
 
+	@property
+	def type(self) -> str:
+		"""Тип таблицы. При наличии актуальной записи в каталоге хранилища манифест не загружается."""
+
+		if not self.__Manifest and self.__Driver.catalog:
+			Type = self.__Driver.catalog.get_table_type(self.__VirtualPath)
+			if Type: return Type
+
+		return cast(str, self.manifest.type)
+
 	@property
 	def table(self) -> "BaseTable":
 		"""Таблица."""
 
-		return self.__TableObject
+		if not self.__TableObject: self.__InintializeTable()
+
+		return cast("BaseTable", self.__TableObject)
 	
 	#==========================================================================================#
 	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
@@ -55,9 +77,9 @@ class TableDescriptor:
 	def __InintializeTable(self):
 		"""Иницилазирует таблицу.."""
 
-		ImportPath = f"Source.Tables.{self.__Manifest.type}.table"
+		ImportPath = f"Source.Tables.{self.manifest.type}.table"
 		TableModule = importlib.import_module(ImportPath)
-		self.__TableObject = TableModule.Table(self.__Driver, self)
+		self.__TableObject: "BaseTable | None" = TableModule.Table(self.__Driver, self)
 
 	#==========================================================================================#
 	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
@@ -73,7 +95,7 @@ class TableDescriptor:
 		:type box: Box | RootBox
 		:param name: Имя таблицы.
 		:type name: str
-		:param manifest: Манифест таблицы. При отсутствии загружается автоматически.
+		:param manifest: Манифест таблицы. При отсутствии загружается автоматически (в ленивом режиме – при первом обращении).
 		:type manifest: Manifest | None
 		:raises FileNotFoundError: Директория таблицы не найдена.
 		"""
@@ -90,9 +112,10 @@ class TableDescriptor:
 
 		if not self.__FullPath.exists(): raise FileNotFoundError(self.__FullPath)
 
-		self.__Manifest = manifest or Manifest(self.__FullPath).load()
+		self.__Manifest = manifest
+		self.__TableObject = None
 
-		self.__InintializeTable()
+		if not self.__Driver.is_lazy: self.__InintializeTable()
 	
 	def rename(self, name: str):
 		"""
@@ -106,7 +129,8 @@ class TableDescriptor:
 			raise Exceptions.Driver.StorageUnmounted()
 
 		self.__Box.pop_item(self.__Name)
+		if self.__Driver.catalog: self.__Driver.catalog.forget(self.__VirtualPath)
 		self.__VirtualPath = self.__VirtualPath.parent / name
 		self.__FullPath = self.__Driver.storage_directory / self.__VirtualPath
 		self.__Box.add_item(self)
-		self.__Manifest.set_directory(self.full_path)
\ No newline at end of file
+		if self.__Manifest: self.__Manifest.set_directory(self.full_path)
\ No newline at end of file
@@ -1,12 +1,15 @@
 from os import PathLike
 from pathlib import Path
 
-from dulwich import porcelain
+from Source.Core.Imports import LazyModule
 
+from .Cache import SessionCache
 from .Data import SessionData
 from .Driver import Driver
 from .Navigator import Navigator
 
+porcelain = LazyModule("dulwich.porcelain")
+
 class Session:
 	"""Сессия взаимодействия."""
 
@@ -14,6 +17,12 @@ class Session:
 	# >>>>> СВОЙСТВА <<<<< #
 	#==========================================================================================#
 
+	@property
+	def cache(self) -> SessionCache:
+		"""Кэш производных значений сессии."""
+
+		return self.__Cache
+
 	@property
 	def data(self) -> SessionData:
 		"""Данные сессии."""
@@ -24,8 +33,7 @@ class Session:
 	def database_version(self) -> str | None:
 		"""Версия OtakuDB."""
 
-		try: return porcelain.describe("")
-		except Exception: pass
+		return self.__Cache.get("database_version")
 	
 	@property
 	def driver(self) -> Driver:
@@ -39,6 +47,21 @@ class Session:
 
 		return self.__Navigator
 
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __GetDatabaseVersion(self) -> str | None:
+		"""
+		Определяет версию OtakuDB по описанию репозитория _git_.
+
+		:return: Версия OtakuDB или `None`, если её не удалось определить.
+		:rtype: str | None
+		"""
+
+		try: return porcelain.describe("")
+		except Exception: pass
+
 	#==========================================================================================#
 	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
@@ -49,17 +72,23 @@ class Session:
 		self.__Driver = Driver()
 		self.__Navigator: Navigator | None = None
 		self.__Data = SessionData()
+		self.__Cache = SessionCache()
+
+		self.__Cache.register("database_version", self.__GetDatabaseVersion)
 
-	def mount(self, storage: PathLike):
+	def mount(self, storage: PathLike, lazy: bool = False):
 		"""
-		Монтирует директорию как хранилище.
+		Монтирует директорию как хранилище. Сбрасывает значения кэша сессии, зарегистрированные для события `mount`.
 
 		:param storage: Путь к хранилищу.
 		:type storage: PathLike
+		:param lazy: Указывает, нужно ли примонтировать хранилище в ленивом режиме.
+		:type lazy: bool
 		:raises FileNotFoundError: Директория не существует.
 		"""
 
 		storage = Path(storage)
-		self.__Driver.mount(storage)
+		self.__Driver.mount(storage, lazy)
 		self.__Navigator = Navigator(self.__Driver)
-		self.__Data.set_last_mounted_storage(storage)
\ No newline at end of file
+		self.__Data.set_last_mounted_storage(storage)
+		self.__Cache.notify("mount")
\ No newline at end of file
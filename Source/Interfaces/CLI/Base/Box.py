@@ -1,3 +1,5 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -5,8 +7,10 @@ from dublib.CLI.Templates.Bus import PrintError
 from dublib.CLI.Terminalyzer import Command, ParsedCommandData, ValidableTypes
 
 from Source.Core import Exceptions
+from Source.Core.Base.Table.Scrub import AttachmentsScrubber
 
 from ..Options.Local import TableInterfaceOptions
+from ..Templates import PrintScrubReport
 
 if TYPE_CHECKING:
 	from Source.Core.Session import Session
@@ -39,6 +43,9 @@ class BaseBoxCLI:
 		ComPos.set_argument()
 		CommandsList.append(Com)
 
+		Com = Command("dedup", "Enable content-addressed attachments store and deduplicate attachments of all tables in current box and nested boxes.")
+		CommandsList.append(Com)
+
 		Com = Command("ls", "List box content.")
 		CommandsList.append(Com)
 
@@ -51,6 +58,8 @@ class BaseBoxCLI:
 		Com = Command("open", "Load table data and open CLI.")
 		ComPos = Com.create_position("TABLE", "Name of table.", important = True)
 		ComPos.set_argument()
+		Com.base.add_flag("-b", description = "Enable write-behind mode: changed notes are written in batches.")
+		Com.base.add_key("--workers", type = ValidableTypes.UnsignedInteger, description = "Count of workers for parallel notes loading. Set 1 to load serially.")
 		CommandsList.append(Com)
 
 		Com = Command("rmdir", "Delete directory (box). By default only for empty boxes.")
@@ -59,6 +68,17 @@ class BaseBoxCLI:
 		Com.base.add_flag("-p", description = "Purge all data in box if exists.")
 		CommandsList.append(Com)
 
+		Com = Command("scrub", "Check attachments of all tables in current box and nested boxes.")
+		Com.base.add_flag("-f", description = "Rehash all files to detect silent corruption.")
+		Com.base.add_key("--workers", type = ValidableTypes.UnsignedInteger, description = "Count of files read concurrently.")
+		CommandsList.append(Com)
+
+		Com = Command("search", "Search notes in all tables of current box and nested boxes.")
+		ComPos = Com.create_position("QUERY", description = "Search query (part of name or another names).", important = True)
+		ComPos.set_argument()
+		Com.base.add_flag("-p", description = "Match only beginnings of words.")
+		CommandsList.append(Com)
+
 		Com = Command("tables", "Prints all tables types.")
 		CommandsList.append(Com)
 
@@ -108,6 +128,25 @@ class BaseBoxCLI:
 		except Exceptions.Driver.ItemAlreadyExists: PrintError("Item already exists.")
 		except Exceptions.Driver.IncorrectTableType: PrintError(f"Missing \"{table_type}\" table type.")
 
+	def _dedup(self):
+		"""Включает хранилище содержимого и помещает в него вложения всех таблиц поддерева текущего контейнера."""
+
+		Blobs = self._Session.driver.blobs
+
+		if Blobs is None:
+			PrintError("Storage not mounted.")
+			return
+
+		Blobs.enable()
+		Paths = list()
+
+		for Descriptor in self._Session.navigator.current_box.walk_tables():
+			for Directory, _, Files in os.walk(Descriptor.full_path / ".attachments"):
+				Paths += [Path(Directory) / File for File in Files if not File.startswith(".")]
+
+		Released = Blobs.deduplicate(Paths) + Blobs.collect()
+		print(f"Files processed: {len(Paths)}. Released: {Released / 1048576:.1f} MiB.")
+
 	def _mkdir(self, name: str, open: bool):
 		"""
 		Создаёт контейнер.
@@ -143,12 +182,16 @@ class BaseBoxCLI:
 		for CurrentBox in Boxes: print("📁", CurrentBox.name)
 		for CurrentDescriptor in Descriptors: print("📦", CurrentDescriptor.name)
 
-	def _open(self, table_name: str):
+	def _open(self, table_name: str, workers: int | None = None, write_behind: bool = False):
 		"""
 		Загружает данные таблицы и открывает её CLI.
 
 		:param table_name: Имя таблицы.
 		:type table_name: str
+		:param workers: Количество исполнителей параллельной загрузки записей.
+		:type workers: int | None
+		:param write_behind: Указывает, нужно ли включить режим отложенной записи.
+		:type write_behind: bool
 		"""
 
 		CurrentBox = self._Session.navigator.current_box
@@ -165,7 +208,12 @@ class BaseBoxCLI:
 			PrintError(f"Current box doesn't contain table \"{table_name}\".")
 			return
 		
-		Descriptor.table.load_data()
+		try: Descriptor.table.load_data(workers)
+		except ValueError as ExceptionData:
+			PrintError(str(ExceptionData))
+			return
+
+		if write_behind: Descriptor.table.enable_write_behind()
 		self._Interface.set_current_object(Descriptor.table)
 
 	def _rmdir(self, name: str, purge: bool):
@@ -201,6 +249,80 @@ class BaseBoxCLI:
 		except Exceptions.Driver.BoxNotEmpty: PrintError("Box isn't empty.")
 		except Exceptions.Driver.ItemNotFound: PrintError("Item not found.")
 
+	def _scrub(self, full: bool = False, workers: int | None = None):
+		"""
+		Проверяет вложения всех таблиц поддерева текущего контейнера. Незагруженные таблицы загружаются.
+
+		:param full: Указывает, нужно ли хешировать все файлы, а не только изменившиеся.
+		:type full: bool
+		:param workers: Количество одновременно читаемых файлов.
+		:type workers: int | None
+		"""
+
+		for Descriptor in self._Session.navigator.current_box.walk_tables():
+			if not bool(Descriptor.manifest.attachments.rule) and not (Descriptor.full_path / ".attachments").exists(): continue
+
+			try:
+				if not Descriptor.table.is_loaded: Descriptor.table.load_data()
+				Report = AttachmentsScrubber(Descriptor.table, workers).scrub(full)
+
+			except Exception as ExceptionData:
+				PrintError(f"Unable to scrub \"{Descriptor.virtual_path.as_posix()}\": {ExceptionData}")
+				continue
+
+			print("📦", Descriptor.virtual_path.as_posix())
+			PrintScrubReport(Report, "    ")
+
+	def _search(self, query: str, prefix: bool = False):
+		"""
+		Ищет записи во всех таблицах поддерева текущего контейнера.
+
+		Таблицы опрашиваются параллельно по своим поисковым индексам без загрузки данных, а результаты выводятся по мере готовности, сгруппированные по виртуальному пути таблицы.
+
+		:param query: Поисковый запрос.
+		:type query: str
+		:param prefix: Указывает, нужно ли искать запрос только в начале слов.
+		:type prefix: bool
+		"""
+
+		def SearchInTable(descriptor: "TableDescriptor") -> tuple[int, ...]:
+			"""
+			Выполняет поиск по индексу таблицы и сохраняет индекс.
+
+			:param descriptor: Дескриптор таблицы.
+			:type descriptor: TableDescriptor
+			:return: Последовательность ID найденных записей.
+			:rtype: tuple[int, ...]
+			"""
+
+			Index = descriptor.table.search_index
+			Result = Index.search(query, prefix)
+			Index.save()
+
+			return Result
+
+		Descriptors = self._Session.navigator.current_box.walk_tables()
+		IsFound = False
+
+		with ThreadPoolExecutor() as Executor:
+			Futures = {Executor.submit(SearchInTable, Descriptor): Descriptor for Descriptor in Descriptors}
+
+			for CurrentFuture in as_completed(Futures):
+				Descriptor = Futures[CurrentFuture]
+
+				try: Result = CurrentFuture.result()
+				except Exception as ExceptionData:
+					PrintError(f"Unable to search in \"{Descriptor.virtual_path.as_posix()}\": {ExceptionData}")
+					continue
+
+				if not Result: continue
+				IsFound = True
+				print("📦", Descriptor.virtual_path.as_posix())
+
+				for NoteID in Result: print(f"    #{NoteID}", Descriptor.table.search_index.get_title(NoteID) or "")
+
+		if not IsFound: print("No results.")
+
 	def _tables(self):
 		"""Выводит список доступных типов таблиц."""
 
@@ -224,10 +346,13 @@ class BaseBoxCLI:
 		match command.name:
 			case "cd": self._cd(command.get_position_value("PATH"))
 			case "create": self._create(command.get_position_value("TYPE"), command.get_position_value("NAME"))
+			case "dedup": self._dedup()
 			case "mkdir": self._mkdir(command.get_position_value("NAME"), command.check_flag("-o"))
 			case "ls": self._ls()
-			case "open": self._open(command.get_position_value("TABLE"))
+			case "open": self._open(command.get_position_value("TABLE"), command.get_key_value("--workers", expected_type = int), command.check_flag("-b"))
 			case "rmdir": self._rmdir(command.get_position_value("NAME"))
+			case "scrub": self._scrub(command.check_flag("-f"), command.get_key_value("--workers", expected_type = int))
+			case "search": self._search(command.get_position_value("QUERY"), command.check_flag("-p"))
 			case "tables": self._tables()
 
 	#==========================================================================================#
@@ -263,7 +388,7 @@ class BaseBoxCLI:
 	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
-	def __init__(self, session: "Session", interface: Interface, box: "Box"):
+	def __init__(self, session: "Session", interface: "Interface", box: "Box"):
 		"""
 		Базовый интерпретатор CLI контейнера.
 
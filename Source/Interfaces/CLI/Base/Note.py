@@ -285,7 +285,12 @@ class BaseNoteCLI:
 
 		if value in (0, "*"): value = None
 		try: self._Note.metainfo.set_field_value(key, value)
-		except Exceptions.Note.MetainfoBlocked as ExceptionData: PrintError(ExceptionData)
+		except (
+			Exceptions.Note.MetainfoBlocked,
+			Exceptions.Note.MetainfoFieldEnlistingDenied,
+			Exceptions.Note.MetainfoFieldIncorrectTyping,
+			Exceptions.Note.MetainfoFieldIncorrectValue
+		) as ExceptionData: PrintError(ExceptionData)
 
 	#==========================================================================================#
 	# >>>>> ПЕРЕОПРЕДЕЛЯЕМЫЕ МЕТОДЫ <<<<< #
@@ -356,7 +361,7 @@ class BaseNoteCLI:
 	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
-	def __init__(self, session: "Session", interface: Interface, note: "BaseNote"):
+	def __init__(self, session: "Session", interface: "Interface", note: "BaseNote"):
 		"""
 		Базовый интерпретатор CLI записи.
 
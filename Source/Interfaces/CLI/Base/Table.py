@@ -1,16 +1,21 @@
-from typing import TYPE_CHECKING
+from enum import Enum
+from typing import TYPE_CHECKING, Iterable
 
-import questionary
 from prettytable import PLAIN_COLUMNS, PrettyTable
 
 from dublib.CLI.Templates import Confirmation
 from dublib.CLI.Templates.Bus import PrintError, PrintWarning
 from dublib.CLI.Terminalyzer import Command, ParsedCommandData, ValidableTypes
 from dublib.CLI.TextStyler import FastStyler
+from dublib.CLI.Validators import Validator_Number
 from dublib.Methods.System import Clear
 
 from Source.Core import Exceptions
+from Source.Core.Base.Table.Loader import MeasureNotesMemory
+from Source.Core.Base.Table.Scrub import AttachmentsScrubber
+from Source.Core.Imports import LazyModule
 from Source.Interfaces.CLI.Options.Local import TableInterfaceOptions
+from Source.Interfaces.CLI.Templates import PrintScrubReport, PrintTable
 
 if TYPE_CHECKING:
 	from Source.Core.Base.Note import BaseNote
@@ -18,9 +23,17 @@ if TYPE_CHECKING:
 	from Source.Core.Session import Session
 	from Source.Interfaces.CLI import Interface
 
+questionary = LazyModule("questionary")
+
 class BaseTableCLI:
 	"""Базовый интерпретатор CLI таблицы."""
 
+	#==========================================================================================#
+	# >>>>> СТАТИЧЕСКИЕ АТРИБУТЫ <<<<< #
+	#==========================================================================================#
+
+	SORTING_COLUMNS: dict[str, str] = {"ID": "id"}
+
 	#==========================================================================================#
 	# >>>>> СВОЙСТВА <<<<< #
 	#==========================================================================================#
@@ -61,6 +74,26 @@ class BaseTableCLI:
 		Com.base.add_flag("-y", description = "Automatically confirms deletion.")
 		CommandsList.append(Com)
 
+		Com = Command("facet", "Show count of notes for every value of metainfo field or note property.")
+		ComPos = Com.create_position("FIELD", description = "Metainfo field or note property name.", important = True)
+		ComPos.set_argument()
+		Com.base.add_flag("-a", description = "Count all notes instead of last search or filter result.")
+		CommandsList.append(Com)
+
+		Com = Command("filter", "Show notes with metainfo field matching values or range.")
+		ComPos = Com.create_position("FIELD", description = "Metainfo field name.", important = True)
+		ComPos.set_argument()
+		ComPos = Com.create_position("VALUES", description = "Allowed values separated by semicolon. Case insensitive.")
+		ComPos.set_argument()
+		Com.base.add_key("--min", description = "Lower bound of range (inclusive).")
+		Com.base.add_key("--max", description = "Upper bound of range (inclusive).")
+		Com.base.add_flag("-r", description = "Reverse list.")
+		CommandsList.append(Com)
+
+		Com = Command("memory", "Measure memory occupied by notes of table.")
+		Com.base.add_flag("-a", description = "Also build attachments and slots objects.")
+		CommandsList.append(Com)
+
 		Com = Command("new", "Create new note.")
 		Com.base.add_flag("-o", description = "Open note after creation.")
 		CommandsList.append(Com)
@@ -75,9 +108,16 @@ class BaseTableCLI:
 		ComPos.set_argument()
 		CommandsList.append(Com)
 
+		Com = Command("scrub", "Check existence, size and content hash of all attachments and report orphaned files.")
+		Com.base.add_flag("-f", description = "Rehash all files to detect silent corruption.")
+		Com.base.add_key("--workers", type = ValidableTypes.UnsignedInteger, description = "Count of files read concurrently.")
+		CommandsList.append(Com)
+
 		Com = Command("search", "Search notes.")
 		ComPos = Com.create_position("QUERY", description = "Search query (part of name or another names).", important = True)
 		ComPos.set_argument()
+		Com.base.add_flag("-p", description = "Match only beginnings of words.")
+		Com.base.add_key("--fuzzy", type = ValidableTypes.UnsignedInteger, description = "Typo-tolerant ranked search. Shows top N results.")
 		CommandsList.append(Com)
 
 		Com = Command("view", "Show list of notes.")
@@ -172,6 +212,91 @@ class BaseTableCLI:
 		self._Table.delete()
 		self._Interface.set_current_object(self._Session.navigator.current_box)
 
+	def _facet(self, field: str, all: bool = False):
+		"""
+		Выводит количество записей для каждого значения поля среди результатов последнего поиска или выборки.
+
+		:param field: Имя поля метаданных или свойства записи.
+		:type field: str
+		:param all: Указывает, нужно ли учитывать все записи таблицы.
+		:type all: bool
+		"""
+
+		MetainfoRules = self._Table.manifest.metainfo_rules
+
+		if field not in self._Table.FACETS and field not in MetainfoRules.fields_names and not MetainfoRules.is_free_allowed:
+			PrintError(f"Field \"{field}\" not described.")
+			return
+
+		Notes = None
+		if not all and self._Selection is not None: Notes = tuple(self._Table.get_note(NoteID) for NoteID in self._Selection if self._Table.is_note_exists(NoteID))
+		Counts = self._Table.facet(field, Notes)
+
+		if not Counts:
+			print("No values.")
+			return
+
+		Values = [Value.value if isinstance(Value, Enum) else Value for Value in Counts.keys()]
+		print("Notes:", len(Notes) if Notes is not None else len(self._Table.notes))
+		PrintTable({"Value": Values, "Count": list(Counts.values())})
+
+	def _filter(self, command: ParsedCommandData):
+		"""
+		Выводит список записей, значение поля метаданных которых соответствует условиям.
+
+		:param command: Данные команды.
+		:type command: ParsedCommandData
+		"""
+
+		def ParseValue(value: str | float | int | None) -> str | float | int | None:
+			"""
+			Преобразует числовую строку в число так же, как это делается при записи метаданных.
+
+			:param value: Значение.
+			:type value: str | float | int | None
+			:return: Преобразованное значение.
+			:rtype: str | float | int | None
+			"""
+
+			if type(value) is str and Validator_Number.validate(value.strip()): return Validator_Number.convert(value.strip())
+			return value
+
+		Field = command.get_position_value("FIELD")
+		MetainfoRules = self._Table.manifest.metainfo_rules
+
+		if Field not in self._Table.FACETS and Field not in MetainfoRules.fields_names and not MetainfoRules.is_free_allowed:
+			PrintError(f"Field \"{Field}\" not described.")
+			return
+
+		Values = command.get_position_value("VALUES")
+		if Values is not None: Values = tuple(ParseValue(Value) for Value in str(Values).split(";") if Value.strip())
+		Minimum = ParseValue(command.get_key_value("--min"))
+		Maximum = ParseValue(command.get_key_value("--max"))
+
+		if self._InterfaceOptions.autoclear: Clear()
+		print("Filter by:", Field)
+		Notes = self._Table.filter(Field, Values, Minimum, Maximum)
+		self._Selection: tuple[int, ...] | None = tuple(CurrentNote.id for CurrentNote in Notes)
+
+		if Notes: self._PrintNotes(Notes, reverse = command.check_flag("-r"))
+		else: print("No results.")
+
+	def _memory(self, attachments: bool = False):
+		"""
+		Выводит объём памяти, занимаемый записями таблицы.
+
+		:param attachments: Указывает, нужно ли учитывать операторы вложений и объекты слотов.
+		:type attachments: bool
+		"""
+
+		Count, Size = MeasureNotesMemory(self._Table, attachments)
+
+		if not Count:
+			print("No notes.")
+			return
+
+		print(f"Notes: {Count}. Memory: {Size} bytes ({Size // Count} bytes per note).")
+
 	def _new(self, open: bool = False):
 		"""
 		Создаёт новую запись.
@@ -214,11 +339,25 @@ class BaseTableCLI:
 		:raises MetainfoFieldNotDescribed: Поле метаданных отсутствует.
 		"""
 
-		Value = note.metainfo.get_field_value(field)
-		
-		if type(Value) is list:
-			ElementsCount = len(Value)
-			Value = Value[0]
+		return self._GenerateCellFromValue(column, note.metainfo.get_field_value(field))
+
+	def _GenerateCellFromValue(self, column: str, value: float | int | list | tuple | str | None) -> str | None:
+		"""
+		Генерирует содержимое ячейки таблицы из значения поля метаданных, например взятого из колоночного представления таблицы. Автоматически обрабатывает наборы значений и максимульную ширину столбика.
+
+		:param column: Имя колонки.
+		:type column: str
+		:param value: Значение поля метаданных. Наборы значений передаются списком или кортежем.
+		:type value: float | int | list | tuple | str | None
+		:return: Значение ячейки.
+		:rtype: str | None
+		"""
+
+		Value = value
+
+		if type(value) in (list, tuple):
+			ElementsCount = len(value)
+			Value = value[0]
 
 			OtherCount = ElementsCount - 1
 			OtherLabel = f" (and {OtherCount} other)"
@@ -245,11 +384,41 @@ class BaseTableCLI:
 			case "column": self._column(command)
 			case "columns": self._columns()
 			case "delete": self._delete(command.check_flag("-y"))
+			case "facet": self._facet(command.get_position_value("FIELD"), command.check_flag("-a"))
+			case "filter": self._filter(command)
+			case "memory": self._memory(command.check_flag("-a"))
 			case "new": self._new(command.check_flag("-o"))
 			case "open": self._open(command.arguments[0])
 			case "rename": self._Table.rename(command.arguments[0])
+			case "scrub": PrintScrubReport(AttachmentsScrubber(self._Table, command.get_key_value("--workers", expected_type = int)).scrub(command.check_flag("-f")))
 			case "view": self.view(reverse = command.check_flag("-r"))
-			case "search": self.view(command.get_position_value("QUERY"))
+			case "search": self.view(command.get_position_value("QUERY"), prefix = command.check_flag("-p"), fuzzy = command.get_key_value("--fuzzy", expected_type = int))
+
+	def _PrintNotes(self, notes: "Iterable[BaseNote]", sort_by: str | None = "ID", reverse: bool = False):
+		"""
+		Выводит таблицу записей с включёнными колонками.
+
+		Строки записей берутся из колоночного представления таблицы. Сортировка по колонкам, перечисленным в `SORTING_COLUMNS`, выполняется по значениям представления до форматирования ячеек.
+
+		:param notes: Последовательность записей.
+		:type notes: Iterable[BaseNote]
+		:param sort_by: Название колонки, по которой выполняется сортировка.
+		:type sort_by: str | None
+		:param reverse: Переключает реверсирование отображаемого контента.
+		:type reverse: bool
+		"""
+
+		View = self._Table.columns
+		Rows = View.get_rows(CurrentNote.id for CurrentNote in notes)
+
+		if sort_by in self.SORTING_COLUMNS:
+			Rows = View.sort(Rows, self.SORTING_COLUMNS[sort_by], reverse)
+			sort_by, reverse = None, False
+
+		Columns = self._GenerateTableColumns(Rows)
+		Columns = {Key: Columns.get(Key) or [""] * len(Rows) for Key in self._InterfaceOptions.columns.names}
+
+		self._PrintTable(Columns, sort_by = sort_by, reverse = reverse)
 
 	def _PrintTable(self, columns: dict[str, list], sort_by: str | None = None, reverse: bool = False):
 		"""
@@ -317,6 +486,31 @@ class BaseTableCLI:
 
 		return list()
 
+	def _GenerateTableColumns(self, rows: list[int]) -> dict[str, list]:
+		"""
+		Генерирует данные для заполнения колонок таблицы по строкам колоночного представления таблицы.
+
+		По умолчанию строки заполняются по одной записи методом `_GenerateTableRow()`. Таблицы, объявившие нужные колонки в `COLUMNS`, могут переопределить метод и читать значения из представления целыми колонками.
+
+		:param rows: Индексы строк колоночного представления в порядке вывода.
+		:type rows: list[int]
+		:return: Словарь, в котором ключи – названия колонок, а значения – списки значений ячеек.
+		:rtype: dict[str, list]
+		"""
+
+		RowData: dict = {Key: None for Key in self._InterfaceOptions.columns.names}
+		Columns: dict = {Key: list() for Key in RowData.keys()}
+
+		for NoteID in self._Table.columns.get_values("id", rows):
+			RowData = self._GenerateTableRow(RowData, self._Table.get_note(NoteID))
+			
+			for ColumnName in Columns.keys():
+				Value = RowData[ColumnName]
+				if Value is None: Value = ""
+				Columns[ColumnName].append(Value)
+
+		return Columns
+
 	def _GenerateTableRow(self, container: dict[str, int | str | None], note: "BaseNote") -> dict[str, int | str | None]:
 		"""
 		Генерирует данные для заполнения строки таблицы.
@@ -343,7 +537,7 @@ class BaseTableCLI:
 	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
-	def __init__(self, session: "Session", interface: Interface, table: "BaseTable"):
+	def __init__(self, session: "Session", interface: "Interface", table: "BaseTable"):
 		"""
 		Базовый интерпретатор CLI таблицы.
 
@@ -360,6 +554,7 @@ class BaseTableCLI:
 		self._Table = table
 
 		self._InterfaceOptions = TableInterfaceOptions(self._Table.manifest.interfaces_options)
+		self._Selection = None
 
 		self._PostInitMethod()
 
@@ -378,11 +573,23 @@ class BaseTableCLI:
 
 		return command.name in tuple(CurrentCommand.name for CurrentCommand in self.commands)
 	
-	def view(self, search_query: str | None = None, reverse: bool = False):
-		"""Выводит список записей таблицы."""
+	def view(self, search_query: str | None = None, reverse: bool = False, prefix: bool = False, fuzzy: int | None = None):
+		"""
+		Выводит список записей таблицы.
+
+		:param search_query: Поисковый запрос.
+		:type search_query: str | None
+		:param reverse: Переключает реверсирование отображаемого контента.
+		:type reverse: bool
+		:param prefix: Указывает, нужно ли искать запрос только в начале слов.
+		:type prefix: bool
+		:param fuzzy: Количество результатов нечёткого поиска. Если указано, записи выводятся в порядке убывания сходства с запросом.
+		:type fuzzy: int | None
+		"""
 
 		if self._InterfaceOptions.autoclear: Clear()
 
+		self._Selection = None
 		Notes = self._Table.notes
 		if not Notes:
 			print("Table is empty.")
@@ -392,31 +599,14 @@ class BaseTableCLI:
 		#==========================================================================================#
 		if search_query:
 			print("Search by:", search_query)
-			SearchResult = list()
-			search_query = search_query.lower()
+			if fuzzy: SearchResult = self._Table.fuzzy_search(search_query, fuzzy)
+			else: SearchResult = self._Table.search(search_query, prefix)
 
-			for CurrentNote in Notes:
-				for String in CurrentNote.searchable_strings:
-					if search_query in String.lower():
-						SearchResult.append(CurrentNote)
-						break
+			self._Selection = tuple(CurrentNote.id for CurrentNote in SearchResult)
 
-			if SearchResult: Notes = tuple(SearchResult)
+			if SearchResult: Notes = SearchResult
 			else:
 				print("No results.")
 				return
 
-		#---> Вывод записей.
-		#==========================================================================================#
-		RowData: dict = {Key: None for Key in self._InterfaceOptions.columns.names}
-		Columns: dict = {Key: list() for Key in RowData.keys()}
-
-		for CurrentNote in Notes:
-			RowData = self._GenerateTableRow(RowData, CurrentNote)
-			
-			for ColumnName in Columns.keys():
-				Value = RowData[ColumnName]
-				if Value is None: Value = ""
-				Columns[ColumnName].append(Value)
-
-		self._PrintTable(Columns, sort_by = "ID", reverse = reverse)
\ No newline at end of file
+		self._PrintNotes(Notes, sort_by = None if search_query and fuzzy else "ID", reverse = reverse)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Sequence
+from typing import TYPE_CHECKING, Sequence
 
 from prettytable import PLAIN_COLUMNS, PrettyTable
 
@@ -6,6 +6,9 @@ from dublib.CLI.TextStyler import FastStyler
 
 from .Options.Local import ColumnOptions
 
+if TYPE_CHECKING:
+	from Source.Core.Base.Table.Scrub import ScrubReport
+
 #==========================================================================================#
 # >>>>> ШАБЛОНЫ МЕТОДОВ ВВОДА-ВЫВОДА <<<<< #
 #==========================================================================================#
@@ -39,4 +42,20 @@ def PrintTable(columns: dict[str, list], options: Sequence[ColumnOptions] | None
 	TableObject.reversesort = reverse
 	TableObject.sort_key = lambda x: 0 if x[0] == "" else x[0]
 	if sort_by: TableObject.sortby = FastStyler(sort_by).decorate.bold
-	print(TableObject)
\ No newline at end of file
+	print(TableObject)
+
+def PrintScrubReport(report: "ScrubReport", indent: str = ""):
+	"""
+	Выводит результат проверки вложений таблицы.
+
+	:param report: Результат проверки.
+	:type report: ScrubReport
+	:param indent: Отступ строк.
+	:type indent: str
+	"""
+
+	for Issue in report.issues:
+		NoteID = f"#{Issue.note_id}" if Issue.note_id is not None else "-"
+		print(f"{indent}{Issue.status.value:<10}{NoteID:<8}{Issue.path}")
+
+	print(f"{indent}Checked: {report.checked}. Hashed: {report.hashed}. Issues: {len(report.issues)}.")
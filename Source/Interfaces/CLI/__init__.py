@@ -55,6 +55,13 @@ class Interface:
 	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
+	def __CloseTable(self):
+		"""Закрывает таблицу текущего рабочего объекта, если таковая имеется."""
+
+		match self.__InterractionLevel:
+			case InterractionLevels.Table: self.__CurrentObject.close()
+			case InterractionLevels.Note: self.__CurrentObject.table.close()
+
 	def __Execute(self, command: ParsedCommandData):
 		"""
 		Обрабатывает команду.
@@ -77,7 +84,10 @@ class Interface:
 
 		match command.name:
 			case "clear": Clear()
-			case "exit": exit()
+			case "exit":
+				self.__CloseTable()
+				exit()
+
 			case "mount": self.__MountStorage(command.get_position_value("PATH"))
 
 		return command.name in tuple(CurrentCommand.name for CurrentCommand in self.global_commands)
@@ -123,7 +133,7 @@ class Interface:
 		"""
 
 		try:
-			self.__Session.mount(path)
+			self.__Session.mount(path, lazy = True)
 			self.set_current_object(self.__Session.navigator.current_box)
 
 		except ZeroDivisionError: PrintError("Storage directory not found.")
@@ -218,6 +228,7 @@ class Interface:
 		:type object: Box | BaseTable | BaseNote | None
 		"""
 
+		if object.__class__.__name__ in ("Box", "RootBox"): self.__CloseTable()
 		self.__CurrentObject = object
 
 		match object.__class__.__name__:
@@ -257,6 +268,7 @@ class Interface:
 			try: InputLine = input(self.get_selector_string())
 			except KeyboardInterrupt: 
 				print("exit")
+				self.__CloseTable()
 				exit()
 
 			InputLine = InputLine.strip()
@@ -22,6 +22,7 @@ class Generator(ManifestGenerator):
 			types = str,
 			values = ("game", "manga", "novel", "original", "ranobe"),
 			description = "Base for anime.",
+			index = "hash",
 			save = False
 		)
 
@@ -8,6 +8,8 @@ if TYPE_CHECKING:
 class Part:
 	"""Часть тайтла."""
 
+	__slots__ = ("__Note", "__Data")
+
 	#==========================================================================================#
 	# >>>>> СВОЙСТВА <<<<< #
 	#==========================================================================================#
@@ -12,6 +12,8 @@ from .Part import Part
 class Note(BaseNote):
 	"""Запись о просмотре аниме."""
 
+	__slots__ = ("__Parts",)
+
 	#==========================================================================================#
 	# >>>>> СВОЙСТВА <<<<< #
 	#==========================================================================================#
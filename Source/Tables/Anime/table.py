@@ -3,6 +3,8 @@ from Source.Core.Base.Table import BaseTable
 class Table(BaseTable):
 	"""Таблица просмотров аниме."""
 
+	FACETS = ("status",)
+
 	@property
 	def max_estimation(self) -> int:
 		"""Максимальная допустимая оценка."""
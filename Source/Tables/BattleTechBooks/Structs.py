@@ -5,7 +5,7 @@ from enum import Enum
 # >>>>> СТРУКТУРЫ ДАННЫХ <<<<< #
 #==========================================================================================#
 
-@dataclass
+@dataclass(frozen = True, order = True)
 class Era:
 	index: int | float
 	name: str
@@ -1,19 +1,180 @@
-from typing import TYPE_CHECKING
-
-import dateparser
+import marshal
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
 
 from Source.Core import Exceptions
 
 if TYPE_CHECKING:
 	from Source.Core.Base.Table import BaseTable
 
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ <<<<< #
+#==========================================================================================#
+
+DATEPARSER_SETTINGS = {
+	"PREFER_DAY_OF_MONTH": "first",
+	"PREFER_MONTH_OF_YEAR": "first"
+}
+
+MONTHS = {
+	"january": 1, "february": 2, "march": 3, "april": 4, "may": 5, "june": 6,
+	"july": 7, "august": 8, "september": 9, "october": 10, "november": 11, "december": 12
+}
+MONTHS.update({Name[:3]: Number for Name, Number in MONTHS.items()})
+
+ISO_PATTERN = re.compile(r"(\d{4})(?:-(\d{1,2})(?:-(\d{1,2}))?)?")
+MONTH_PATTERN = re.compile(r"([a-z]+)\.?,?\s+(\d{4})")
+DOTTED_PATTERN = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})")
+
+def ParseDateFast(publication_date: str) -> tuple[int, ...] | None:
+	"""
+	Разбирает дату распространённых форматов без обращения к _dateparser_: `YYYY`, `YYYY-MM`, `YYYY-MM-DD`, `Month YYYY` с английским названием месяца и `DD.MM.YYYY`. Недостающие день и месяц заменяются первыми. Для числовой даты с точками, как и в _dateparser_, первым считается месяц, если такая дата существует.
+
+	:param publication_date: Дата публикации.
+	:type publication_date: str
+	:return: Год, месяц и день или `None`, если формат не распознан.
+	:rtype: tuple[int, ...] | None
+	"""
+
+	Value = publication_date.strip().lower()
+
+	if Match := ISO_PATTERN.fullmatch(Value):
+		Year, Month, Day = int(Match[1]), int(Match[2] or 1), int(Match[3] or 1)
+		Variants: tuple[tuple[int, int, int], ...] = ((Year, Month, Day),)
+
+	elif Match := MONTH_PATTERN.fullmatch(Value):
+		if Match[1] not in MONTHS: return None
+		Variants = ((int(Match[2]), MONTHS[Match[1]], 1),)
+
+	elif Match := DOTTED_PATTERN.fullmatch(Value):
+		First, Second, Year = int(Match[1]), int(Match[2]), int(Match[3])
+		Variants = ((Year, First, Second), (Year, Second, First))
+
+	else: return None
+
+	for Fields in Variants:
+		try: datetime(*Fields)
+		except ValueError: continue
+
+		return Fields
+
+	return None
+
+def ParseDate(publication_date: str) -> tuple[int, ...] | None:
+	"""
+	Разбирает дату публикации, используя _dateparser_ только для нераспознанных быстрым разбором форматов. Определена на уровне модуля для передачи в пул процессов.
+
+	:param publication_date: Дата публикации.
+	:type publication_date: str
+	:return: Поля даты в местном времени от года до секунды или `None`, если дату не удалось разобрать.
+	:rtype: tuple[int, ...] | None
+	"""
+
+	Fields = ParseDateFast(publication_date)
+	if Fields: return Fields
+
+	import dateparser
+
+	Datetime = dateparser.parse(publication_date, settings = DATEPARSER_SETTINGS)
+	if not Datetime: return None
+	if Datetime.tzinfo: Datetime = Datetime.astimezone().replace(tzinfo = None)
+
+	return tuple(Datetime.timetuple()[:6])
+
+#==========================================================================================#
+# >>>>> ОСНОВНОЙ КЛАСС <<<<< #
+#==========================================================================================#
+
 class Chronolog:
 	"""Сортировщик записей по дате публикации."""
 
+	#==========================================================================================#
+	# >>>>> СТАТИЧЕСКИЕ АТРИБУТЫ <<<<< #
+	#==========================================================================================#
+
+	FILENAME = ".chronolog"
+	VERSION = 1
+	PARALLEL_THRESHOLD = 32
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def path(self) -> Path:
+		"""Путь к файлу таблицы разобранных дат."""
+
+		return self.__Table.full_path / self.FILENAME
+
 	#==========================================================================================#
 	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
+	def __GetDates(self) -> dict[str, tuple[int, ...] | None]:
+		"""
+		Возвращает таблицу разобранных дат, при первом обращении считывая файл. Повреждённый или устаревший файл игнорируется.
+
+		:return: Словарь, где ключ – исходная строка даты, а значение – поля даты или `None` для неразобранных строк.
+		:rtype: dict[str, tuple[int, ...] | None]
+		"""
+
+		Dates = self.__Dates
+
+		if Dates is None:
+			Dates = dict()
+
+			try:
+				with open(self.path, "rb") as FileReader: Data = marshal.loads(FileReader.read())
+				if type(Data) is dict and Data.get("version") == self.VERSION: Dates = Data["dates"]
+
+			except (OSError, EOFError, ValueError, TypeError, KeyError): pass
+
+			self.__Dates: dict[str, tuple[int, ...] | None] | None = Dates
+
+		return Dates
+
+	def __ParseDates(self, publication_dates: set[str]):
+		"""
+		Разбирает отсутствующие в таблице даты и сохраняет её, если она пополнилась. Даты, не распознанные быстрым разбором, при большом их количестве разбираются в пуле процессов.
+
+		:param publication_dates: Набор строк дат.
+		:type publication_dates: set[str]
+		"""
+
+		Dates = self.__GetDates()
+		Missing = publication_dates - Dates.keys()
+		if not Missing: return
+		Remainder = list()
+
+		for PublicationDate in Missing:
+			Fields = ParseDateFast(PublicationDate)
+			if Fields: Dates[PublicationDate] = Fields
+			else: Remainder.append(PublicationDate)
+
+		if self.__Workers == 1 or len(Remainder) < self.PARALLEL_THRESHOLD: Results = tuple(ParseDate(PublicationDate) for PublicationDate in Remainder)
+
+		else:
+			ChunkSize = max(1, len(Remainder) // (self.__Workers * 4))
+			with ProcessPoolExecutor(self.__Workers) as CurrentExecutor: Results = tuple(CurrentExecutor.map(ParseDate, Remainder, chunksize = ChunkSize))
+
+		Dates.update(zip(Remainder, Results))
+		self.__SaveDates()
+
+	def __SaveDates(self):
+		"""Сохраняет таблицу разобранных дат. Ошибки записи игнорируются, так как таблица является лишь кэшем."""
+
+		TemporaryPath = self.path.with_name(self.FILENAME + ".tmp")
+
+		try:
+			with open(TemporaryPath, "wb") as FileWriter: marshal.dump({"version": self.VERSION, "dates": self.__Dates}, FileWriter)
+			os.replace(TemporaryPath, self.path)
+
+		except OSError: pass
+
 	def __GetTimestamp(self, publication_date: str | None) -> int:
 		"""
 		Возвращает UNIX Timestamp на основании переданного значения.
@@ -25,10 +186,11 @@ class Chronolog:
 		"""
 
 		if not publication_date: return 0
-		Datetime = dateparser.parse(publication_date, settings = self.__DateparserSettings)
-		if not Datetime: return 0
+		Fields = self.__GetDates().get(publication_date)
+		if not Fields: return 0
+		Year, Month, Day, Hour, Minute, Second = (Fields + (0, 0, 0))[:6]
 
-		return int(Datetime.timestamp())
+		return int(datetime(Year, Month, Day, Hour, Minute, Second).timestamp())
 
 	def __SortByTimestamps(self, data: dict[int, int]) -> dict[int, int]:
 		"""
@@ -46,24 +208,29 @@ class Chronolog:
 	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
-	def __init__(self, table: "BaseTable"):
+	def __init__(self, table: "BaseTable", workers: int | None = None):
 		"""
 		Сортировщик записей по дате публикации.
 
+		Разобранные даты хранятся в файле _.chronolog_ таблицы в виде полей местного времени, а не UNIX Timestamp, поэтому остаются верными при смене часового пояса. Распространённые форматы разбираются без _dateparser_, который импортируется только для остальных строк.
+
 		:param table: Таблица.
 		:type table: BaseTable
+		:param workers: Количество процессов для разбора необычных дат. По умолчанию определяется по количеству процессоров. При значении `1` разбор выполняется последовательно.
+		:type workers: int | None
+		:raises ValueError: Количество исполнителей меньше единицы.
 		"""
 
+		if workers is not None and workers < 1: raise ValueError("Workers count must be positive.")
+
 		self.__Table = table
+		self.__Workers = workers or os.cpu_count() or 1
 
-		self.__DateparserSettings = {
-			"PREFER_DAY_OF_MONTH": "first",
-			"PREFER_MONTH_OF_YEAR": "first"
-		}
+		self.__Dates = None
 
 	def apply(self, data: dict[int, int], sort: bool = True):
 		"""
-		Назначает записям новые ID, соответствующие их порядковому индексу после сортировки.
+		Назначает записям новые ID, соответствующие их порядковому индексу после сортировки. Изменения выполняются одной массовой перенумерацией таблицы.
 
 		:param data: Словарь, в котором ключ – ID записи, значение – UNIX Timestamp даты публикации.
 		:type data: dict[int, int]
@@ -72,16 +239,7 @@ class Chronolog:
 		"""
 
 		if sort: data = self.__SortByTimestamps(data)
-		Index = 0
-
-		for OldID in data.keys():
-			Index -= 1
-			self.__Table.change_note_id(OldID, Index)
-
-		Index = 0
-		for OldID in data.keys():
-			Index += 1
-			self.__Table.change_note_id(Index * -1, Index)
+		self.__Table.renumber({OldID: Index for Index, OldID in enumerate(data.keys(), 1)})
 
 	def calculate_timestamps(self) -> dict[int, int]:
 		"""
@@ -93,14 +251,17 @@ class Chronolog:
 		:rtype: dict[int, int]
 		"""
 
-		Timestamps = dict()
+		PublicationDates: dict[int, str | None] = dict()
 
 		for CurrentNote in self.__Table.notes:
 			PublicationDate = None
-			
-			try: PublicationDate = CurrentNote.metainfo.get_field_value("publication_date")
+
+			try: PublicationDate = cast("str | None", CurrentNote.metainfo.get_field_value("publication_date"))
 			except Exceptions.Note.MetainfoFieldNotDescribed: pass
-			
-			Timestamps[CurrentNote.id] = self.__GetTimestamp(PublicationDate)
-		
+
+			PublicationDates[CurrentNote.id] = PublicationDate
+
+		self.__ParseDates({PublicationDate for PublicationDate in PublicationDates.values() if PublicationDate})
+		Timestamps = {NoteID: self.__GetTimestamp(PublicationDate) for NoteID, PublicationDate in PublicationDates.items()}
+
 		return self.__SortByTimestamps(Timestamps)
@@ -43,28 +43,21 @@ class TableCLI(BaseTableCLI):
 	def _statistics(self):
 		"""Выводит статистику чтения произведений."""
 
-		Notes: "tuple[Note, ...]" = self._Table.notes
-		Total = len(Notes)
-		Novels = 0
-		Stories = 0
-		Compilations = 0
-		Undefined = 0
+		View = self._Table.columns
+		Total = len(View)
+		TypesCounts = View.count("type")
+		StatusesCounts = View.count("status")
+		CollectionStatusesCounts = View.count("collection_status")
 
-		Completed = 0
+		Novels = TypesCounts.get(Types.Novel, 0)
+		Stories = TypesCounts.get(Types.Story, 0)
+		Compilations = TypesCounts.get(Types.Compilation, 0)
+		Undefined = Total - Novels - Stories - Compilations
 
-		CollectedBooks = 0
-		CollectedEbooks = 0
+		Completed = StatusesCounts.get(Statuses.Completed, 0)
 
-		for CurrentNote in Notes:
-			if CurrentNote.type == Types.Novel: Novels += 1
-			elif CurrentNote.type == Types.Story: Stories += 1
-			elif CurrentNote.type == Types.Compilation: Compilations += 1
-			else: Undefined += 1
-
-			if CurrentNote.status == Statuses.Completed: Completed += 1
-
-			if CurrentNote.collection_status == CollectionStatuses.Ebook: CollectedEbooks += 1
-			elif CurrentNote.collection_status == CollectionStatuses.Collected: CollectedBooks += 1
+		CollectedBooks = CollectionStatusesCounts.get(CollectionStatuses.Collected, 0)
+		CollectedEbooks = CollectionStatusesCounts.get(CollectionStatuses.Ebook, 0)
 
 		if Undefined: Undefined = f", {Undefined} undefined"
 		else: Undefined = ""
@@ -114,74 +107,73 @@ class TableCLI(BaseTableCLI):
 
 		return CommandsList
 
-	def _GenerateTableRow(self, container: dict[str, None], note: "Note") -> dict[str, str | None]:
+	def _GenerateTableColumns(self, rows: list[int]) -> dict[str, list]:
 		"""
-		Генерирует данные для заполнения строки таблицы.
-
-		:param container: Словарь, в котром ключи являются названиями колонок.
-		:type container: dict[str, None]
-		:param note: Запись.
-		:type note: Note
-		:return: Словарь с подставленными значениями.
-		:rtype: dict[str, str | None]
+		Генерирует данные для заполнения колонок таблицы по строкам колоночного представления таблицы.
+
+		:param rows: Индексы строк колоночного представления в порядке вывода.
+		:type rows: list[int]
+		:return: Словарь, в котором ключи – названия колонок, а значения – списки значений ячеек.
+		:rtype: dict[str, list]
 		"""
 
+		View = self._Table.columns
+		Columns = dict()
+
 		#---> ID
 		#==========================================================================================#
-		container["ID"] = note.id
+		Columns["ID"] = View.get_values("id", rows)
 
 		#---> Status
 		#==========================================================================================#
-		match note.status:
-			case Statuses.Announced: container["Status"] = FastStyler(Statuses.Announced.value).colorize.magenta
-			case Statuses.Planned: container["Status"] = FastStyler(Statuses.Planned.value).colorize.blue
-			case Statuses.Reading: container["Status"] = FastStyler(Statuses.Reading.value).colorize.yellow
-			case Statuses.Completed: container["Status"] = FastStyler(Statuses.Completed.value).colorize.green
-			case Statuses.Dropped: container["Status"] = FastStyler(Statuses.Dropped.value).colorize.red
-			case Statuses.Skipped: container["Status"] = FastStyler(Statuses.Skipped.value).colorize.cyan
-			case None: container["Status"] = ""
-
-		container["Status"] = {
+		StatusesLabels = {
+			Statuses.Announced: FastStyler(Statuses.Announced.value).colorize.magenta,
+			Statuses.Planned: FastStyler(Statuses.Planned.value).colorize.blue,
+			Statuses.Reading: FastStyler(Statuses.Reading.value).colorize.yellow,
+			Statuses.Completed: FastStyler(Statuses.Completed.value).colorize.green,
+			Statuses.Dropped: FastStyler(Statuses.Dropped.value).colorize.red,
+			Statuses.Skipped: FastStyler(Statuses.Skipped.value).colorize.cyan,
+			None: ""
+		}
+		CollectionStatusesLabels = {
 			CollectionStatuses.Collected: "📦 ",
 			CollectionStatuses.Ebook: "🌍 ",
 			CollectionStatuses.Wishlist: "🎁 ",
 			CollectionStatuses.Ordered: "🚚 ",
 			None: "   "
-		}[note.collection_status] + container["Status"]
+		}
+		Columns["Status"] = [CollectionStatusesLabels[CollectionStatus] + StatusesLabels[Status] for Status, CollectionStatus in zip(View.get_values("status", rows), View.get_values("collection_status", rows))]
 
 		#---> Name
 		#==========================================================================================#
-		container["Name"] = note.localized_name or note.name
+		Columns["Name"] = [LocalizedName or Name or "" for LocalizedName, Name in zip(View.get_values("localized_name", rows), View.get_values("name", rows))]
 
 		#---> Type
 		#==========================================================================================#
-		container["Type"] = note.type.value
+		Columns["Type"] = [Type.value for Type in View.get_values("type", rows)]
 
 		#---> Estimation
 		#==========================================================================================#
-		container["Estimation"] = ""
+		EstimationsLabels = {None: "", 0: ""}
+
+		for Estimation in range(1, 6):
+			EstimationsLabels[Estimation] = "★ " * Estimation
+			if Estimation == 5: EstimationsLabels[Estimation] = FastStyler(EstimationsLabels[Estimation]).colorize.green
+			elif Estimation in (3, 4): EstimationsLabels[Estimation] = FastStyler(EstimationsLabels[Estimation]).colorize.yellow
+			elif Estimation in (1, 2): EstimationsLabels[Estimation] = FastStyler(EstimationsLabels[Estimation]).colorize.red
 
-		if note.estimation:
-			Estimation = "★ " * note.estimation
-			if note.estimation == 5: Estimation = FastStyler(Estimation).colorize.green
-			elif note.estimation in (3, 4): Estimation = FastStyler(Estimation).colorize.yellow
-			elif note.estimation in (1, 2): Estimation = FastStyler(Estimation).colorize.red
-			container["Estimation"] = Estimation
+		Columns["Estimation"] = [EstimationsLabels[Estimation] if Estimation in EstimationsLabels else "★ " * Estimation for Estimation in View.get_values("estimation", rows)]
 
 		#---> Era
 		#==========================================================================================#
-		NoteEra = note.era
-		if NoteEra: NoteEra = NoteEra.name
-		else: NoteEra = ""
-		container["Era"] = NoteEra
+		Columns["Era"] = [NoteEra.name if NoteEra else "" for NoteEra in View.get_values("era", rows)]
 
 		#---> Метаданные.
 		#==========================================================================================#
-		container["Author"] = self._GenerateCellFromMetainfo(note, "Author", "author")
-		container["Publication"] = self._GenerateCellFromMetainfo(note, "Publication", "publication_date")
-		container["Series"] = self._GenerateCellFromMetainfo(note, "Series", "series")
+		for Column, Field in (("Author", "author"), ("Publication", "publication_date"), ("Series", "series")):
+			Columns[Column] = [self._GenerateCellFromValue(Column, Value) or "" for Value in View.get_values(Field, rows)]
 
-		return container
+		return Columns
 
 class NoteCLI(BaseNoteCLI):
 	"""Интерпретатор CLI записи."""
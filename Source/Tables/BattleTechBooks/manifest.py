@@ -25,12 +25,14 @@ class Generator(ManifestGenerator):
 			types = str,
 			allow_list = True,
 			description = "One or more authors.",
+			index = "hash",
 			save = False
 		)
 		manifest.metainfo_rules.create_field_parameters(
 			field = "publisher",
 			types = str,
 			description = "Publisher of paper book.",
+			index = "hash",
 			save = False
 		)
 		manifest.metainfo_rules.create_field_parameters(
@@ -39,6 +41,7 @@ class Generator(ManifestGenerator):
 			allow_list = True,
 			values = ("Blitzkrieg", "MechWarrior"),
 			description = "Series to which the book belongs.",
+			index = "hash",
 			save = False
 		)
 		manifest.metainfo_rules.create_field_parameters(
@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 class Note(BaseNote):
 	"""Запись о прочтении произведения по вселенной BattleTech."""
 
+	__slots__ = ()
+
 	#==========================================================================================#
 	# >>>>> СВОЙСТВА <<<<< #
 	#==========================================================================================#
@@ -129,7 +131,7 @@ class Note(BaseNote):
 
 		if self.collection_status: return
 
-		if self._Attachments.get_slot("ebook").file: self.set_collection_status(CollectionStatuses.Ebook)
+		if self.attachments.get_slot("ebook").file: self.set_collection_status(CollectionStatuses.Ebook)
 
 	#==========================================================================================#
 	# >>>>> ПЕРЕОПРЕДЕЛЯЕМЫЕ ТРИГГЕРНЫЕ МЕТОДЫ <<<<< #
@@ -5,6 +5,24 @@ from .Structs import Era
 class Table(BaseTable):
 	"""Таблица прочтения произведений BattleTech."""
 
+	#==========================================================================================#
+	# >>>>> СТАТИЧЕСКИЕ АТРИБУТЫ <<<<< #
+	#==========================================================================================#
+
+	COLUMNS = {
+		"name": "string",
+		"localized_name": "string",
+		"status": "category",
+		"collection_status": "category",
+		"type": "category",
+		"estimation": "integer",
+		"era": "category",
+		"author": "category",
+		"publication_date": "category",
+		"series": "category"
+	}
+	FACETS = ("collection_status", "status", "type")
+
 	#==========================================================================================#
 	# >>>>> СВОЙСТВА <<<<< #
 	#==========================================================================================#	
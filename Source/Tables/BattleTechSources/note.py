@@ -11,6 +11,8 @@ from .Enums import CollectionStatuses, Statuses, Types
 class Note(BaseNote):
 	"""Запись о прочтении соурсбука BattleTech."""
 
+	__slots__ = ()
+
 	#==========================================================================================#
 	# >>>>> СВОЙСТВА <<<<< #
 	#==========================================================================================#
@@ -55,7 +57,7 @@ class Note(BaseNote):
 
 		if self.collection_status == CollectionStatuses.Collected: return
 
-		if self._Attachments.get_slot("ebook").file: self.set_collection_status(CollectionStatuses.Ebook)
+		if self.attachments.get_slot("ebook").file: self.set_collection_status(CollectionStatuses.Ebook)
 		else: self.set_collection_status(None)
 
 	#==========================================================================================#
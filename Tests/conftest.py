@@ -0,0 +1,68 @@
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+
+from Source.Core.Base.Table import BaseTable
+from Source.Core.Session import Session
+
+ROOT = Path(__file__).parents[1]
+
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ <<<<< #
+#==========================================================================================#
+
+def OpenTable(storage: Path, name: str = "books") -> BaseTable:
+	"""
+	Монтирует хранилище в новой сессии и возвращает таблицу с загруженными данными, имитируя повторный запуск OtakuDB.
+
+	:param storage: Путь к хранилищу.
+	:type storage: Path
+	:param name: Имя таблицы в корневом контейнере.
+	:type name: str
+	:return: Таблица.
+	:rtype: BaseTable
+	"""
+
+	CurrentSession = Session()
+	CurrentSession.mount(storage)
+	Table = CurrentSession.navigator.root_box.get_item(name).table
+	Table.load_data()
+
+	return Table
+
+#==========================================================================================#
+# >>>>> ФИКСТУРЫ <<<<< #
+#==========================================================================================#
+
+@pytest.fixture
+def storage(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+	"""Временное хранилище с таблицей _books_ типа BattleTechBooks. Файл сессии восстанавливается после теста."""
+
+	monkeypatch.chdir(ROOT)
+	SessionFile = ROOT / ".session.json"
+	SessionData = SessionFile.read_bytes() if SessionFile.exists() else None
+
+	Storage = tmp_path / "storage"
+	Storage.mkdir()
+
+	CurrentSession = Session()
+	CurrentSession.mount(Storage)
+	CurrentSession.navigator.root_box.create_table("books", "BattleTechBooks")
+
+	yield Storage
+
+	if SessionData is None: SessionFile.unlink(missing_ok = True)
+	else: SessionFile.write_bytes(SessionData)
+
+@pytest.fixture
+def open_table(storage: Path) -> Callable[[], BaseTable]:
+	"""Функция, открывающая таблицу временного хранилища в новой сессии."""
+
+	return lambda: OpenTable(storage)
+
+@pytest.fixture
+def table(open_table: Callable[[], BaseTable]) -> BaseTable:
+	"""Таблица временного хранилища с загруженными данными."""
+
+	return open_table()
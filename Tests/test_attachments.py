@@ -0,0 +1,19 @@
+import json
+
+def test_save_keeps_attachments_lazy(table, open_table, tmp_path):
+	"""Сохранение записи не создаёт оператор вложений и не теряет данные вложений."""
+
+	table.manifest.attachments.set_attachments_rule(2)
+	Note = table.create_note()
+	File = tmp_path / "cover.txt"
+	File.write_text("cover", encoding = "utf-8")
+	Note.attachments.attach(File, copy = True)
+
+	Reopened = open_table().get_note(Note.id)
+	Reopened.rename("Renamed")
+	assert Reopened._Attachments is None
+
+	Data = json.loads(Reopened.full_path.read_text(encoding = "utf-8"))
+	assert Data["name"] == "Renamed"
+	assert Data["attachments"]["free"] == ["cover.txt"]
+	assert open_table().get_note(Note.id).attachments.free == ("cover.txt",)
@@ -0,0 +1,70 @@
+import pytest
+
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ <<<<< #
+#==========================================================================================#
+
+def CreateNotes(table, count: int):
+	"""Создаёт записи с именами вида _Note N_, где N совпадает с ID записи."""
+
+	for Index in range(count): table.create_note().rename(f"Note {Index + 1}")
+
+def GetState(table) -> tuple[dict[int, str], list[int]]:
+	"""Возвращает имена записей в памяти и ID файлов записей на диске."""
+
+	Files = sorted(int(Path.stem) for Path in table.full_path.glob("*.json") if Path.stem.isdigit())
+
+	return {CurrentNote.id: CurrentNote.name for CurrentNote in table.notes}, Files
+
+#==========================================================================================#
+# >>>>> ТЕСТЫ <<<<< #
+#==========================================================================================#
+
+def test_rollback_create_on_freed_id(table, open_table):
+	"""Откат удаляет запись, созданную на освобождённом перенумерацией ID, и возвращает исходные ID."""
+
+	table.manifest.common.set_recycle_id(True)
+	CreateNotes(table, 3)
+
+	with pytest.raises(RuntimeError), table.batch():
+		table.change_note_id(1, 3, "i")
+		assert table.create_note().id == 1
+		raise RuntimeError()
+
+	Expected = ({1: "Note 1", 2: "Note 2", 3: "Note 3"}, [1, 2, 3])
+	assert not table.is_batch
+	assert GetState(table) == Expected
+	assert [CurrentNote.id for CurrentNote in table.search("note")] == [1, 2, 3]
+	assert GetState(open_table()) == Expected
+
+def test_rollback_renumber_then_delete(table, open_table):
+	"""Откат перенумерации записи, удалённой позже в том же контексте, не требует её присутствия в таблице."""
+
+	CreateNotes(table, 3)
+
+	with pytest.raises(RuntimeError), table.batch():
+		table.change_note_id(3, 10)
+		table.delete_note(10)
+		raise RuntimeError()
+
+	Expected = ({1: "Note 1", 2: "Note 2", 3: "Note 3"}, [1, 2, 3])
+	assert not table.is_batch
+	assert GetState(table) == Expected
+	assert GetState(open_table()) == Expected
+
+def test_failed_rollback_ends_batch(table, open_table):
+	"""Ошибка отмены шага не оставляет таблицу в режиме пакетного редактирования: последующие сохранения записываются сразу."""
+
+	CreateNotes(table, 2)
+
+	with pytest.raises(FileNotFoundError), table.batch():
+		table.delete_note(2)
+		for Path in table.full_path.glob(".2.*.deleted"): Path.unlink()
+		raise RuntimeError()
+
+	assert not table.is_batch
+	table.get_note(1).rename("Renamed")
+	assert open_table().get_note(1).name == "Renamed"
+
+	with table.batch(): table.get_note(1).rename("Batched")
+	assert open_table().get_note(1).name == "Batched"
@@ -0,0 +1,32 @@
+from Source.Core.Session.Blobs import BlobStore, CopyFile
+
+def test_store_is_disabled_by_default(tmp_path):
+	"""Хранилище содержимого не включается само по себе."""
+
+	Store = BlobStore(tmp_path)
+	File = tmp_path / "cover.jpg"
+	File.write_bytes(b"cover")
+
+	assert not Store.is_enabled
+	assert Store.submit(File) is None
+	assert not Store.directory.exists()
+
+def test_copy_breaks_shared_link(tmp_path):
+	"""Запись нового содержимого в дедуплицированное вложение не изменяет остальные ссылки на прежнее содержимое."""
+
+	Store = BlobStore(tmp_path)
+	Store.enable()
+	First, Second, Replacement = tmp_path / "first.jpg", tmp_path / "second.jpg", tmp_path / "replacement.jpg"
+	for File in (First, Second): File.write_bytes(b"cover")
+	Replacement.write_bytes(b"another cover")
+
+	Store.deduplicate([First, Second])
+	assert First.stat().st_ino == Second.stat().st_ino
+
+	Store.copy(Replacement, First)
+	assert First.read_bytes() == b"another cover"
+	assert Second.read_bytes() == b"cover"
+
+	CopyFile(First, Second)
+	assert Second.read_bytes() == b"another cover"
+	assert not list(tmp_path.glob(".*.copy"))
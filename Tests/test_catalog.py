@@ -0,0 +1,20 @@
+import os
+from pathlib import Path
+
+from Source.Core.Session.Catalog import StorageCatalog
+
+def test_box_items_follow_child_manifest(tmp_path):
+	"""Появление манифеста в директории элемента делает закэшированный состав контейнера устаревшим, хотя время изменения контейнера не меняется."""
+
+	Directory = tmp_path / "box"
+	(Directory / "child").mkdir(parents = True)
+	Past = os.stat(Directory).st_mtime_ns - StorageCatalog.RACY_INTERVAL * 2
+	os.utime(Directory, ns = (Past, Past))
+
+	Catalog = StorageCatalog(tmp_path)
+	Catalog.update_box_items(Path("box"), Past, {"child": None})
+	assert Catalog.get_box_items(Path("box")) == {"child": None}
+
+	(Directory / "child" / "manifest.json").write_text("{}", encoding = "utf-8")
+	assert os.stat(Directory).st_mtime_ns == Past
+	assert Catalog.get_box_items(Path("box")) is None
@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from Source.Core import Exceptions
+from Source.Core.Base.Table.Graph import BondGraph
+
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ <<<<< #
+#==========================================================================================#
+
+def GetReference(edges: set[tuple[str, int, int]]) -> dict[int, dict[str, list[int]]]:
+	"""Строит ожидаемое словарное представление графа по множеству рёбер. Списки привязанных записей упорядочены по возрастанию ID."""
+
+	Data: dict[int, dict[str, list[int]]] = dict()
+
+	for Name, MasterID, SlaveID in sorted(edges):
+		Data.setdefault(MasterID, {"parts": list(), "stories": list()})[Name].append(SlaveID)
+
+	return dict(sorted(Data.items()))
+
+#==========================================================================================#
+# >>>>> ТЕСТЫ <<<<< #
+#==========================================================================================#
+
+def test_queries():
+	"""Соседи, транзитивные запросы и топологический порядок строятся по сжатым массивам."""
+
+	Graph = BondGraph(("stories",), {"4": {"stories": [1]}, "1": {"stories": [2, 3]}})
+
+	assert list(Graph.get_slaves("stories", 1)) == [2, 3]
+	assert list(Graph.get_masters("stories", 1)) == [4]
+	assert list(Graph.get_slaves("stories", 5)) == []
+	assert Graph.get_descendants(4) == (1, 2, 3)
+	assert Graph.get_ancestors(3) == (1, 4)
+	assert Graph.is_reachable(4, 3) and not Graph.is_reachable(3, 4)
+	assert Graph.get_topological_order() == (4, 1, 2, 3)
+	assert Graph.to_dict() == {1: {"stories": [2, 3]}, 4: {"stories": [1]}}
+
+def test_cycle_detection():
+	"""Цикл связей обнаруживается при построении топологического порядка."""
+
+	Graph = BondGraph(("stories",), {1: {"stories": [2]}, 2: {"stories": [3]}})
+	Graph.add("stories", 3, 1)
+
+	with pytest.raises(Exceptions.Note.BondCycleDetected): Graph.get_topological_order()
+	assert Graph.remove("stories", 3, 1)
+	assert Graph.get_topological_order() == (1, 2, 3)
+
+def test_overlay_compaction():
+	"""Результаты запросов совпадают с эталоном до и после слияния слоя изменений с основными массивами."""
+
+	Generator = random.Random(0)
+	Graph = BondGraph(("parts", "stories"))
+	Edges: set[tuple[str, int, int]] = set()
+
+	for _ in range(BondGraph.COMPACTION_MINIMUM * 4):
+		Edge = (Generator.choice(("parts", "stories")), Generator.randint(1, 40), Generator.randint(1, 40))
+
+		if Edge in Edges and Generator.random() < 0.5:
+			assert Graph.remove(*Edge)
+			Edges.remove(Edge)
+
+		elif Edge not in Edges:
+			Graph.add(*Edge)
+			Edges.add(Edge)
+
+	assert {MasterID: {Name: sorted(SlavesID) for Name, SlavesID in NoteData.items()} for MasterID, NoteData in Graph.to_dict().items()} == GetReference(Edges)
+
+	for NoteID in range(1, 41):
+		assert Graph.get_slaves_id(NoteID) == tuple(sorted({SlaveID for _, MasterID, SlaveID in Edges if MasterID == NoteID}))
+		assert Graph.get_masters_id(NoteID) == tuple(sorted({MasterID for _, MasterID, SlaveID in Edges if SlaveID == NoteID}))
+
+def test_renumber():
+	"""Перенумерация заменяет ID во всех связях, включая обмен и цикл замен."""
+
+	Graph = BondGraph(("stories",), {1: {"stories": [2, 3]}, 3: {"stories": [4]}})
+	Graph.renumber({1: 3, 3: 1, 4: 10})
+
+	assert Graph.to_dict() == {1: {"stories": [10]}, 3: {"stories": [2, 1]}}
+	assert list(Graph.get_masters("stories", 10)) == [1]
+	Graph.renumber({2: 20})
+	assert Graph.to_dict() == {1: {"stories": [10]}, 3: {"stories": [20, 1]}}
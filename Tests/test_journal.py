@@ -0,0 +1,81 @@
+import json
+import os
+
+import pytest
+
+from Source.Core.Base.Table.Journal import TableJournal
+from Source.Tables.BattleTechBooks.Structs import Types
+
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ <<<<< #
+#==========================================================================================#
+
+def GetNames(table) -> dict[int, str]:
+	"""Возвращает имена записей, прочитанные из файлов таблицы."""
+
+	Names = dict()
+
+	for Path in table.full_path.glob("*.json"):
+		if Path.stem.isdigit(): Names[int(Path.stem)] = json.loads(Path.read_text(encoding = "utf-8"))["name"]
+
+	return dict(sorted(Names.items()))
+
+#==========================================================================================#
+# >>>>> ТЕСТЫ <<<<< #
+#==========================================================================================#
+
+def test_recover_completes_interrupted_plan(table, open_table):
+	"""Прерванная после первого перемещения перенумерация завершается при открытии таблицы, а файл связей перезаписывается из журнала."""
+
+	for Name in ("First", "Second"): table.create_note().rename(Name)
+
+	Journal = TableJournal(table)
+	Journal.begin([("1.json", ".renumber.json"), ("2.json", "1.json"), (".renumber.json", "2.json")], {3: {"stories": [1]}})
+	os.replace(table.full_path / "1.json", table.full_path / ".renumber.json")
+
+	Reopened = open_table()
+	assert GetNames(Reopened) == {1: "Second", 2: "First"}
+	assert not (Reopened.full_path / TableJournal.FILENAME).exists()
+	assert json.loads((Reopened.full_path / ".bonds.json").read_text(encoding = "utf-8")) == {"3": {"stories": [1]}}
+
+def test_recover_rolls_back_impossible_plan(table, open_table):
+	"""Если план невозможно завершить, выполненные перемещения откатываются, а файл связей не изменяется."""
+
+	for Name in ("First", "Second"): table.create_note().rename(Name)
+	BondsPath = table.full_path / ".bonds.json"
+	Bonds = BondsPath.read_bytes() if BondsPath.exists() else None
+
+	Journal = TableJournal(table)
+	Journal.begin([("1.json", ".renumber.json"), ("2.json", "missing/1.json")], {3: {"stories": [1]}})
+
+	assert not Journal.recover()
+	assert GetNames(open_table()) == {1: "First", 2: "Second"}
+	assert (BondsPath.read_bytes() if BondsPath.exists() else None) == Bonds
+
+def test_recover_discards_damaged_journal(table, open_table):
+	"""Повреждённый журнал удаляется без изменения файлов."""
+
+	table.create_note().rename("First")
+	(table.full_path / TableJournal.FILENAME).write_text("{\"moves\": [", encoding = "utf-8")
+
+	Reopened = open_table()
+	assert GetNames(Reopened) == {1: "First"}
+	assert not (Reopened.full_path / TableJournal.FILENAME).exists()
+
+def test_renumber_keeps_bonds_when_journal_fails(table, monkeypatch):
+	"""Если журнал не удалось записать, связи в памяти и файлы записей не изменяются, а частичный журнал удаляется."""
+
+	Story, Compilation = table.create_note(), table.create_note()
+	Compilation.set_type(Types.Compilation)
+	Compilation.bonds.bind("stories", Story.id)
+	Story.rename("Story")
+
+	def Dump(*args, **kwargs): raise OSError("disk full")
+
+	monkeypatch.setattr(json, "dump", Dump)
+	with pytest.raises(OSError): table.renumber({Story.id: 5})
+	monkeypatch.undo()
+
+	assert table.connector.bonds.to_dict() == {Compilation.id: {"stories": [Story.id]}}
+	assert GetNames(table)[Story.id] == "Story"
+	assert not (table.full_path / TableJournal.FILENAME).exists()
@@ -0,0 +1,33 @@
+import pytest
+
+from Source.Core import Exceptions
+
+def test_values_whitelist(table, open_table):
+	"""Значения вне списка допустимых отклоняются, а допустимые числовые строки приводятся к числам."""
+
+	table.manifest.metainfo_rules.create_field_parameters("rating", types = int, values = (1, 2, 3))
+	Note = table.create_note()
+
+	with pytest.raises(Exceptions.Note.MetainfoFieldIncorrectValue): Note.metainfo.set_field_value("rating", 5)
+	with pytest.raises(Exceptions.Note.MetainfoFieldIncorrectValue): Note.metainfo.set_field_value("rating", " 4 ")
+	assert "rating" not in Note.metainfo.to_dict()
+
+	Note.metainfo.set_field_value("rating", " 2 ")
+	assert open_table().get_note(Note.id).metainfo.to_dict()["rating"] == 2
+
+def test_list_rejected_without_allow_list(table):
+	"""Список из нескольких значений отклоняется целиком, если поле не разрешает списки, а повторы схлопываются до одного значения."""
+
+	Rules = table.manifest.metainfo_rules
+	Rules.create_field_parameters("publisher", types = str)
+	Rules.create_field_parameters("tags", types = str, allow_list = True)
+	Note = table.create_note()
+
+	with pytest.raises(Exceptions.Note.MetainfoFieldEnlistingDenied): Note.metainfo.set_field_value("publisher", "FASA; Catalyst")
+	with pytest.raises(Exceptions.Note.MetainfoFieldEnlistingDenied): Note.metainfo.set_field_value("publisher", ["FASA", "Catalyst"])
+	assert "publisher" not in Note.metainfo.to_dict()
+
+	Note.metainfo.set_field_value("publisher", "FASA;  FASA")
+	Note.metainfo.set_field_value("tags", "mech; clan;  mech")
+	assert Note.metainfo.to_dict()["publisher"] == "FASA"
+	assert Note.metainfo.to_dict()["tags"] == ["mech", "clan"]
@@ -0,0 +1,21 @@
+import os
+import time
+
+def test_renumbered_notes_are_reindexed(open_table):
+	"""Сохранённый индекс не должен выдавать строки прежних записей после обмена ID файлов с одинаковыми временем изменения и размером."""
+
+	Table = open_table()
+	for Name in ("Alpha", "Omega"): Table.create_note().rename(Name)
+
+	Past = time.time_ns() - 10 * Table.search_index.RACY_INTERVAL
+	for NoteID in (1, 2): os.utime(Table.full_path / f"{NoteID}.json", ns = (Past, Past))
+
+	Table = open_table()
+	assert [Note.id for Note in Table.search("alpha")] == [1]
+	Table.close()
+
+	open_table().renumber({1: 2, 2: 1})
+
+	Table = open_table()
+	assert Table.search_index.load()
+	assert [(Note.id, Note.name) for Note in Table.search("alpha")] == [(2, "Alpha")]
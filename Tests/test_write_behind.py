@@ -0,0 +1,35 @@
+import json
+
+import pytest
+
+from Source.Core import Exceptions
+from Source.Tables.BattleTechBooks.Structs import Statuses, Types
+
+def test_close_drains_callbacks_cascade(table, open_table):
+	"""Закрытие таблицы в режиме отложенной записи записывает всю цепочку оповещённых сборников."""
+
+	Story, Inner, Outer = table.create_note(), table.create_note(), table.create_note()
+	for CurrentNote in (Inner, Outer): CurrentNote.set_type(Types.Compilation)
+	Inner.bonds.bind("stories", Story.id)
+	Outer.bonds.bind("stories", Inner.id)
+
+	table.enable_write_behind(interval = 60)
+	Story.set_status(Statuses.Completed)
+	assert Outer.status is not Statuses.Completed
+
+	table.close()
+	assert Outer.status is Statuses.Completed
+
+	Reopened = open_table()
+	assert [Reopened.get_note(NoteID).status for NoteID in (Story.id, Inner.id, Outer.id)] == [Statuses.Completed] * 3
+	table.disable_write_behind()
+
+def test_bond_cycle_raises(table, open_table):
+	"""Цикл в сохранённых связях прерывает оповещение исключением, а не теряет оповещения молча."""
+
+	First, Second = table.create_note(), table.create_note()
+	for CurrentNote in (First, Second): CurrentNote.set_type(Types.Compilation)
+	(table.full_path / ".bonds.json").write_text(json.dumps({str(First.id): {"stories": [Second.id]}, str(Second.id): {"stories": [First.id]}}), encoding = "utf-8")
+
+	Reopened = open_table()
+	with pytest.raises(Exceptions.Note.BondCycleDetected): Reopened.get_note(First.id).set_status(Statuses.Completed)
@@ -1,6 +1,8 @@
-from dublib.CLI.Terminalyzer import Command, Terminalyzer
+from dublib.CLI.Templates.Bus import PrintWarning
+from dublib.CLI.Terminalyzer import Command, Terminalyzer, ValidableTypes
 
 from Source import EntryPoint
+from Source.Core.Imports import IMPORT_BUDGET, ProfileImports
 from Source.Core.Session import Session
 from Source.Interfaces.Enums import Interfaces
 
@@ -10,6 +12,10 @@ from Source.Interfaces.Enums import Interfaces
 
 COMMANDS: list[Command] = list()
 
+Com = Command("profile", "Report import time of modules at CLI cold start.")
+Com.base.add_key("--top", type = ValidableTypes.UnsignedInteger, description = "Count of slowest modules to report (20 by default).")
+COMMANDS.append(Com)
+
 Com = Command("run", "Launch OtakuDB interface.")
 ComPos = Com.create_position("INTERFACE", description = "Interface specification.")
 ComPos.add_flag("-api")
@@ -41,6 +47,20 @@ match COMMAND_DATA.name:
 
 	case "help": pass
 
+	case "profile":
+		Records, LoadedLazyModules = ProfileImports()
+		Top = COMMAND_DATA.get_key_value("--top", expected_type = int) or 20
+		Total = sum(Record[2] for Record in Records if Record[3] == 0)
+		OwnTotal = sum(Record[2] for Record in Records if Record[3] == 0 and Record[0].split(".")[0] == "Source")
+
+		print(f"{'SELF, MS':>10}{'TOTAL, MS':>11}   MODULE")
+		for Name, SelfTime, CumulativeTime, Depth in sorted(Records, key = lambda Record: Record[2], reverse = True)[:Top]:
+			print(f"{SelfTime / 1000:>10.1f}{CumulativeTime / 1000:>11.1f}   {'  ' * Depth}{Name}")
+
+		print(f"Cold start imports: {Total / 1000:.1f} ms, OtakuDB modules: {OwnTotal / 1000:.1f} ms (budget: {IMPORT_BUDGET / 1000:.0f} ms).")
+		if OwnTotal > IMPORT_BUDGET: PrintWarning("Import time budget exceeded.")
+		if LoadedLazyModules: PrintWarning(f"Lazy modules loaded at cold start: {', '.join(LoadedLazyModules)}.")
+
 	case "run":
 		InterfaceFlag = None
 